@@ -1,29 +1,204 @@
 import importlib
+import time
+from functools import partial
 
-from .constants import eAreaDesignOrientation, eCNameType, eFramePropType, eItemType, eItemTypeElm, eLoadCaseType, eLoadPatternType, eMatType
+import numpy as np
+
+from .constants import eAreaDesignOrientation, eCNameType, eDiaphragmOption, eFramePropType, eItemType, eItemTypeElm, eLoadCaseType, eLoadPatternType, eMatType
 
 class _CSIProxy:
     """Proxy genérico para centralizar acceso al modelo CSI."""
 
+    # Atributos escalares: no se memorizan porque pueden cambiar entre accesos.
+    _SCALAR_TYPES = (str, bytes, int, float, bool, type(None))
+
     def __init__(self, helpers, target, path=""):
         self._helpers = helpers
         self._target = target
         self._path = path
+        self._members = {}
 
     def __getattr__(self, name):
+        # Cada proxy representa un par (ruta, objetivo): callables resueltos y
+        # sub-objetos (PointObj, Results, Setup, ...) se reutilizan mientras el
+        # modelo siga enlazado, evitando consultas repetidas al objeto CSI.
+        member = self._members.get(name)
+        if member is not None:
+            return member
+
         attr = getattr(self._target, name)
         path = f"{self._path}.{name}" if self._path else name
 
         if callable(attr):
-            return self._helpers.wrap_callable(path, attr)
-        return _CSIProxy(self._helpers, attr, path)
+            member = self._helpers.wrap_callable(path, attr)
+        else:
+            member = _CSIProxy(self._helpers, attr, path)
+            if isinstance(attr, self._SCALAR_TYPES):
+                return member
+
+        if self._helpers.cache_proxies:
+            self._members[name] = member
+        return member
+
+    def _release(self):
+        """Libera recursivamente los miembros memorizados del proxy."""
+        for member in self._members.values():
+            if isinstance(member, _CSIProxy):
+                member._release()
+        self._members.clear()
 
 
 class CSIAPIHelpers:
     """Encapsula helpers y proxys de compatibilidad entre backends CSI."""
 
+    # Ruta del proxy -> nombre del wrapper. Se resuelve una sola vez por clase
+    # en ``_special_table`` para no reconstruir el mapa en cada acceso.
+    _SPECIAL_WRAPPERS = {
+        "LoadCases.GetNameList": "_wrap_get_name_list",
+        "RespCombo.GetNameList": "_wrap_get_name_list",
+        "PropMaterial.GetNameList": "_wrap_get_name_list",
+        "PointObj.GetNameList": "_wrap_get_name_list",
+        "PointObj.GetNameListOnStory": "_wrap_get_name_list_on_story",
+        "FrameObj.GetNameListOnStory": "_wrap_get_name_list_on_story",
+        "AreaObj.GetNameListOnStory": "_wrap_get_name_list_on_story",
+        "GroupDef.GetNameList": "_wrap_get_name_list",
+        "PropFrame.GetNameList": "_wrap_get_name_list",
+        "FrameObj.GetNameList": "_wrap_get_name_list",
+        "PropArea.GetNameList": "_wrap_get_name_list",
+        "AreaObj.GetNameList": "_wrap_get_name_list",
+        "PierLabel.GetNameList": "_wrap_get_name_list",
+        "LoadPatterns.GetNameList": "_wrap_get_name_list",
+        "LoadPatterns.GetLoadType": "_wrap_load_pattern_get_load_type",
+        "LoadPatterns.GetSelfWTMultiplier": "_wrap_load_pattern_get_self_wt_multiplier",
+        "LoadCases.GetTypeOAPI_1": "_wrap_get_type_oapi_1",
+        "PropMaterial.GetTypeOAPI": "_wrap_get_prop_material_type_oapi",
+        "PropMaterial.SetMaterial": "_wrap_set_material",
+        "PropMaterial.SetMPIsotropic": "_wrap_set_mp_isotropic",
+        "PropMaterial.SetWeightAndMass": "_wrap_set_weight_and_mass",
+        "PropMaterial.SetMPUniaxial": "_wrap_set_mp_uniaxial",
+        "RespCombo.GetTypeOAPI": "_wrap_get_resp_combo_type_oapi",
+        "RespCombo.GetTypeCombo": "_wrap_resp_combo_get_type_combo",
+        "RespCombo.Add": "_wrap_resp_combo_add",
+        "RespCombo.GetCaseList": "_wrap_get_case_list",
+        "RespCombo.SetCaseList": "_wrap_resp_combo_set_case_list",
+        "LoadPatterns.Add": "_wrap_load_patterns_add",
+        "Results.JointReact": "_wrap_joint_react",
+        "Results.FrameForce": "_wrap_frame_force",
+        "Results.AreaForceShell": "_wrap_area_force_shell",
+        "Results.PierForce": "_wrap_pier_force",
+        "Results.ModalParticipatingMassRatios": "_wrap_modal_participating_mass_ratios",
+        "Results.JointDispl": "_wrap_joint_displ",
+        "DatabaseTables.GetTableForEditingArray": "_wrap_get_table_for_editing_array",
+        "DatabaseTables.ApplyEditedTables": "_wrap_apply_edited_tables",
+        "DatabaseTables.GetAvailableTables": "_wrap_get_available_tables",
+        "DatabaseTables.GetTableForDisplayArray": "_wrap_get_table_for_display_array",
+        "DatabaseTables.SetTableForEditingArray": "_wrap_set_table_for_editing_array",
+        "PropFrame.GetAllFrameProperties_2": "_wrap_get_all_frame_properties_2",
+        "PropFrame.GetSectProps": "_wrap_get_sect_props",
+        "PropFrame.GetRectangle": "_wrap_get_rectangle",
+        "PropFrame.SetRectangle": "_wrap_set_rectangle",
+        "PropFrame.SetCircle": "_wrap_set_circle",
+        "PropFrame.SetPipe": "_wrap_set_pipe",
+        "PropFrame.SetTube": "_wrap_set_tube",
+        "PropFrame.SetISection": "_wrap_set_i_section",
+        "PropFrame.SetTee": "_wrap_set_tee",
+        "PropFrame.SetAngle": "_wrap_set_angle",
+        "PropFrame.SetChannel": "_wrap_set_channel",
+        "PropFrame.SetSDSection": "_wrap_set_sd_section",
+        "PropFrame.SetDblAngle": "_wrap_set_dbl_angle",
+        "PropFrame.SetDblChannel": "_wrap_set_dbl_channel",
+        "PropFrame.SetConcreteBox": "_wrap_set_concrete_box",
+        "PropFrame.SetConcreteTee": "_wrap_set_concrete_tee",
+        "PropFrame.SetConcreteL": "_wrap_set_concrete_l",
+        "PropFrame.SetConcreteCross": "_wrap_set_concrete_cross",
+        "PropFrame.SetConcretePipe": "_wrap_set_concrete_pipe",
+        "PropFrame.SetPlate": "_wrap_set_plate",
+        "PropFrame.SetRod": "_wrap_set_rod",
+        "PropFrame.SetColdC": "_wrap_set_cold_c",
+        "PropFrame.SetColdZ": "_wrap_set_cold_z",
+        "PropFrame.SetColdHat": "_wrap_set_cold_hat",
+        "PointObj.AddCartesian": "_wrap_add_cartesian",
+        "PointObj.SetRestraint": "_wrap_set_restraint",
+        "FrameObj.GetSection": "_wrap_get_section",
+        "FrameObj.GetPoints": "_wrap_get_points",
+        "FrameObj.GetLabelNameList": "_wrap_get_label_name_list",
+        "FrameObj.GetNameFromLabel": "_wrap_get_name_from_label",
+        "AreaObj.GetProperty": "_wrap_area_get_property",
+        "AreaObj.GetPoints": "_wrap_area_get_points",
+        "PointObj.GetCoordCartesian": "_wrap_get_coord_cartesian",
+        "PointObj.GetRestraint": "_wrap_get_restraint",
+        "PointObj.GetDiaphragm": "_wrap_get_diaphragm",
+        "PointObj.GetSelected": "_wrap_get_selected",
+        "PointObj.GetAllPoints": "_wrap_get_all_points",
+        "SelectObj.GetSelected": "_wrap_select_obj_get_selected",
+        "AreaObj.GetAllAreas": "_wrap_get_all_areas",
+        "FrameObj.GetAllFrames": "_wrap_get_all_frames",
+        "PropArea.GetWall": "_wrap_get_wall",
+        "PropArea.GetSlab": "_wrap_get_slab",
+        "PropArea.GetSlabRibbed": "_wrap_get_slab_ribbed",
+        "PropArea.GetSlabWaffle": "_wrap_get_slab_waffle",
+        "PropArea.GetDeck_1": "_wrap_get_deck_1",
+        "PropArea.SetWall": "_wrap_set_wall",
+        "PropArea.SetSlab": "_wrap_set_slab",
+        "PropArea.SetSlabRibbed": "_wrap_set_slab_ribbed",
+        "PropArea.SetSlabWaffle": "_wrap_set_slab_waffle",
+        "PropArea.SetDeck_1": "_wrap_set_deck_1",
+        "PropArea.SetDeckFilled": "_wrap_set_deck_filled",
+        "PropArea.SetDeckUnfilled": "_wrap_set_deck_unfilled",
+        "PropArea.SetDeckSolidSlab": "_wrap_set_deck_solid_slab",
+        "PropArea.SetShellLayer": "_wrap_set_shell_layer",
+        "AreaObj.SetProperty": "_wrap_area_set_property",
+        "AreaObj.SetLoadUniform": "_wrap_area_set_load_uniform",
+        "AreaObj.SetLoadUniformToFrame": "_wrap_area_set_load_uniform_to_frame",
+        "AreaObj.AddByCoord": "_wrap_area_add_by_coord",
+        "FrameObj.AddByPoint": "_wrap_add_by_point",
+        "FrameObj.SetSection": "_wrap_frame_set_section",
+        "PointObj.SetLoadForce": "_wrap_point_set_load_force",
+        "FrameObj.SetLoadDistributed": "_wrap_frame_set_load_distributed",
+        "FrameObj.SetLoadPoint": "_wrap_frame_set_load_point",
+        "LoadCases.StaticLinear.SetCase": "_wrap_static_linear_set_case",
+        "LoadCases.StaticLinear.SetInitialCase": "_wrap_static_linear_set_initial_case",
+        "LoadCases.StaticLinear.SetLoads": "_wrap_static_linear_set_loads",
+        "LoadCases.ResponseSpectrum.SetCase": "_wrap_response_spectrum_set_case",
+        "LoadCases.ResponseSpectrum.SetLoads": "_wrap_response_spectrum_set_loads",
+        "View.RefreshView": "_wrap_refresh_view",
+        "File.OpenFile": "_wrap_open_file",
+        "File.NewBlank": "_wrap_new_blank",
+        "Analyze.RunAnalysis": "_wrap_run_analysis",
+        "Story.GetStories": "_wrap_get_stories",
+        "Story.GetHeight": "_wrap_get_story_height",
+        "GridSys.GetNameList": "_wrap_get_name_list",
+        "GridSys.GetGridSys_2": "_wrap_get_grid_sys_2",
+        "PropMaterial.GetMPIsotropic": "_wrap_get_mpi_isotropic",
+        "PropMaterial.GetMPOrthotropic": "_wrap_get_mp_orthotropic",
+        "PropMaterial.GetMPAnisotropic": "_wrap_get_mp_anisotropic",
+        "PropMaterial.GetMPUniaxial": "_wrap_get_mp_uniaxial",
+    }
+
+    # Permite desactivar la cache de miembros de los proxys (depuración o benchmarks).
+    cache_proxies = True
+
     def __init__(self, owner):
         self.owner = owner
+        # Backends que ya entregan resultados normalizados (p. ej. ``replay``)
+        # no pasan por los wrappers especiales.
+        connector = getattr(owner, "connector", None)
+        if getattr(connector, "normalized_results", False):
+            self._special = {}
+        else:
+            self._special = self._special_table()
+        self._model_proxy = None
+        self._observers = []
+        self._backend_elapsed = 0.0
+
+    @classmethod
+    def _special_table(cls):
+        """Compila una vez por clase el mapa ruta -> wrapper especial."""
+        table = cls.__dict__.get("_compiled_special")
+        if table is None:
+            table = {path: getattr(cls, name) for path, name in cls._SPECIAL_WRAPPERS.items()}
+            cls._compiled_special = table
+        return table
 
     @property
     def raw_model(self):
@@ -31,26 +206,89 @@ class CSIAPIHelpers:
 
     @property
     def backend(self):
-        return self.owner.backend
+        # El backend simulado puede imitar la forma de resultados de dotnet o comtypes
+        shape = getattr(getattr(self.owner, "connector", None), "api_shape", None)
+        return shape or self.owner.backend
 
     @property
     def api_module(self):
         return self.owner.api_module
 
     def get_model_proxy(self):
-        """Retorna el proxy del modelo activo."""
+        """
+        Retorna un proxy nuevo del modelo activo.
+
+        Descarta la cache de sub-objetos del proxy anterior, que pertenecía
+        al modelo enlazado previamente.
+        """
+        self.release_model_proxy()
         if self.raw_model is None:
             return None
-        return _CSIProxy(self, self.raw_model)
+        self._model_proxy = _CSIProxy(self, self.raw_model)
+        return self._model_proxy
+
+    def release_model_proxy(self):
+        """Libera el proxy del modelo y los sub-objetos memorizados."""
+        if self._model_proxy is not None:
+            self._model_proxy._release()
+            self._model_proxy = None
+
+    def add_observer(self, observer):
+        """
+        Registra un observador de llamadas a la API.
+
+        El observador debe implementar ``observe(path, args, kwargs, result,
+        start, end, backend_s)``; ``start`` y ``end`` vienen de
+        ``time.perf_counter`` y ``backend_s`` es el tiempo de la llamada CSI
+        sin la normalización del wrapper.
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+            self._reset_member_cache()
+        return observer
+
+    def remove_observer(self, observer):
+        """Quita un observador registrado con ``add_observer``."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+            self._reset_member_cache()
+
+    def _reset_member_cache(self):
+        # Los callables memorizados se vuelven a resolver con o sin observación.
+        if self._model_proxy is not None:
+            self._model_proxy._release()
+
+    def _observed_call(self, path, func, *args, **kwargs):
+        self._backend_elapsed = 0.0
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        end = time.perf_counter()
+        backend_s = self._backend_elapsed if self._backend_elapsed else end - start
+        for observer in self._observers:
+            observer.observe(path, args, kwargs, result, start, end, backend_s)
+        return result
+
+    def _timed_backend_call(self, func, *args, **kwargs):
+        # Dentro de un wrapper especial: mide solo la llamada CSI.
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._backend_elapsed += time.perf_counter() - start
+
+    def _system_module(self):
+        # El backend simulado en forma dotnet provee su propio sustituto de ``System``
+        system = getattr(getattr(self.owner, "connector", None), "system_module", None)
+        return system if system is not None else importlib.import_module("System")
 
     def get_system_types(self):
         """Obtiene tipos base de ``System`` cuando el runtime .NET ya está cargado."""
-        system = importlib.import_module("System")
+        system = self._system_module()
         return system.Array, system.Double, system.Int32, system.String
 
     def get_api_enum_placeholder(self, enum_name):
         """Retorna el primer valor disponible de un enum expuesto por la API .NET."""
-        system = importlib.import_module("System")
+        system = self._system_module()
         api_enum = getattr(self.api_module, enum_name)
         return system.Enum.GetValues(api_enum)[0]
 
@@ -58,7 +296,7 @@ class CSIAPIHelpers:
         """Convierte un entero Python al enum real de la API .NET."""
         if self.backend != "dotnet" or self.api_module is None:
             return value
-        system = importlib.import_module("System")
+        system = self._system_module()
         api_enum = getattr(self.api_module, enum_name)
         return system.Enum.ToObject(api_enum, int(value))
 
@@ -79,6 +317,89 @@ class CSIAPIHelpers:
             return default
         return values[index]
 
+    # Tipo de elemento de ``System.Array`` -> dtype con el mismo layout en memoria.
+    _NET_ARRAY_DTYPES = {"Double": np.float64, "Int32": np.int32}
+
+    def _as_numeric_array(self, values, dtype):
+        """
+        Convierte un arreglo numérico CSI a ``numpy.ndarray`` en bloque.
+
+        Tuplas y listas (comtypes) se convierten con ``np.asarray``. Los
+        ``System.Array`` se copian completos vía protocolo buffer o
+        ``Marshal.Copy`` sobre la memoria del array NumPy de destino, evitando
+        la conversión elemento por elemento.
+        """
+        if values is None:
+            return np.empty(0, dtype=dtype)
+        if isinstance(values, np.ndarray):
+            return values.astype(dtype, copy=False)
+        if isinstance(values, (list, tuple)):
+            try:
+                return np.asarray(values, dtype=dtype)
+            except (TypeError, ValueError):
+                convert = self._as_float if dtype == np.float64 else self._as_int
+                return np.array([convert(value) for value in values], dtype=dtype)
+
+        try:
+            return np.array(memoryview(values), dtype=dtype)
+        except (TypeError, ValueError, NotImplementedError):
+            pass
+
+        count = len(values)
+        try:
+            element = self._NET_ARRAY_DTYPES.get(values.GetType().GetElementType().Name)
+        except AttributeError:
+            element = None
+        if element is not None and count:
+            system = importlib.import_module("System")
+            marshal = importlib.import_module("System.Runtime.InteropServices").Marshal
+            buffer = np.empty(count, dtype=element)
+            marshal.Copy(values, 0, system.IntPtr(int(buffer.ctypes.data)), count)
+            return buffer.astype(dtype, copy=False)
+        kind = np.dtype(dtype).kind
+        convert = float if kind == "f" else bool if kind == "b" else int
+        return np.fromiter((convert(value) for value in values), dtype=dtype, count=count)
+
+    def _as_float_array(self, values):
+        return self._as_numeric_array(values, np.float64)
+
+    def _as_int_array(self, values):
+        return self._as_numeric_array(values, np.int64)
+
+    def _as_bool_array(self, values):
+        return self._as_numeric_array(values, np.bool_)
+
+    def _as_str_array(self, values):
+        """Convierte un arreglo de textos CSI a ``numpy.ndarray`` de objetos en una pasada."""
+        if values is None:
+            return np.empty(0, dtype=object)
+        if isinstance(values, np.ndarray) and values.dtype == object:
+            return values
+        items = list(values)
+        array = np.empty(len(items), dtype=object)
+        array[:] = items
+        return array
+
+    def _as_array_result(self, normalized, size, str_items=(), float_items=(), int_items=(), bool_items=()):
+        """
+        Normaliza salidas tabulares CSI (``NumberResults``, arrays..., ``ret``).
+
+        Mantiene los índices del resultado y convierte cada arreglo indicado a
+        ``numpy.ndarray``. El primer elemento y el código de retorno quedan como ``int``.
+        """
+        converted = [self._item(normalized, index, ()) for index in range(size)]
+        converted[0] = self._as_int(self._item(normalized, 0))
+        for index in str_items:
+            converted[index] = self._as_str_array(converted[index])
+        for index in float_items:
+            converted[index] = self._as_float_array(converted[index])
+        for index in int_items:
+            converted[index] = self._as_int_array(converted[index])
+        for index in bool_items:
+            converted[index] = self._as_bool_array(converted[index])
+        converted.append(self._as_int(self._item(normalized, size)))
+        return tuple(converted)
+
     def normalize_api_result(self, result):
         """Normaliza salidas CSI para mantener índices estables entre backends."""
         if self.backend == "dotnet":
@@ -87,123 +408,12 @@ class CSIAPIHelpers:
 
     def wrap_callable(self, path, func):
         """Envuelve métodos especiales y deja el resto como pass-through."""
-        special = {
-            "LoadCases.GetNameList": self._wrap_get_name_list,
-            "RespCombo.GetNameList": self._wrap_get_name_list,
-            "PropMaterial.GetNameList": self._wrap_get_name_list,
-            "PointObj.GetNameList": self._wrap_get_name_list,
-            "PointObj.GetNameListOnStory": self._wrap_get_name_list_on_story,
-            "PropFrame.GetNameList": self._wrap_get_name_list,
-            "FrameObj.GetNameList": self._wrap_get_name_list,
-            "PropArea.GetNameList": self._wrap_get_name_list,
-            "PierLabel.GetNameList": self._wrap_get_name_list,
-            "LoadPatterns.GetNameList": self._wrap_get_name_list,
-            "LoadPatterns.GetLoadType": self._wrap_load_pattern_get_load_type,
-            "LoadPatterns.GetSelfWTMultiplier": self._wrap_load_pattern_get_self_wt_multiplier,
-            "LoadCases.GetTypeOAPI_1": self._wrap_get_type_oapi_1,
-            "PropMaterial.GetTypeOAPI": self._wrap_get_prop_material_type_oapi,
-            "PropMaterial.SetMaterial": self._wrap_set_material,
-            "PropMaterial.SetMPIsotropic": self._wrap_set_mp_isotropic,
-            "PropMaterial.SetWeightAndMass": self._wrap_set_weight_and_mass,
-            "PropMaterial.SetMPUniaxial": self._wrap_set_mp_uniaxial,
-            "RespCombo.GetTypeOAPI": self._wrap_get_resp_combo_type_oapi,
-            "RespCombo.GetTypeCombo": self._wrap_resp_combo_get_type_combo,
-            "RespCombo.Add": self._wrap_resp_combo_add,
-            "RespCombo.GetCaseList": self._wrap_get_case_list,
-            "RespCombo.SetCaseList": self._wrap_resp_combo_set_case_list,
-            "LoadPatterns.Add": self._wrap_load_patterns_add,
-            "Results.JointReact": self._wrap_joint_react,
-            "Results.FrameForce": self._wrap_frame_force,
-            "Results.AreaForceShell": self._wrap_area_force_shell,
-            "Results.PierForce": self._wrap_pier_force,
-            "Results.ModalParticipatingMassRatios": self._wrap_modal_participating_mass_ratios,
-            "Results.JointDispl": self._wrap_joint_displ,
-            "DatabaseTables.GetTableForEditingArray": self._wrap_get_table_for_editing_array,
-            "DatabaseTables.ApplyEditedTables": self._wrap_apply_edited_tables,
-            "DatabaseTables.GetAvailableTables": self._wrap_get_available_tables,
-            "DatabaseTables.GetTableForDisplayArray": self._wrap_get_table_for_display_array,
-            "DatabaseTables.SetTableForEditingArray": self._wrap_set_table_for_editing_array,
-            "PropFrame.GetAllFrameProperties_2": self._wrap_get_all_frame_properties_2,
-            "PropFrame.GetSectProps": self._wrap_get_sect_props,
-            "PropFrame.GetRectangle": self._wrap_get_rectangle,
-            "PropFrame.SetRectangle": self._wrap_set_rectangle,
-            "PropFrame.SetCircle": self._wrap_set_circle,
-            "PropFrame.SetPipe": self._wrap_set_pipe,
-            "PropFrame.SetTube": self._wrap_set_tube,
-            "PropFrame.SetISection": self._wrap_set_i_section,
-            "PropFrame.SetTee": self._wrap_set_tee,
-            "PropFrame.SetAngle": self._wrap_set_angle,
-            "PropFrame.SetChannel": self._wrap_set_channel,
-            "PropFrame.SetSDSection": self._wrap_set_sd_section,
-            "PropFrame.SetDblAngle": self._wrap_set_dbl_angle,
-            "PropFrame.SetDblChannel": self._wrap_set_dbl_channel,
-            "PropFrame.SetConcreteBox": self._wrap_set_concrete_box,
-            "PropFrame.SetConcreteTee": self._wrap_set_concrete_tee,
-            "PropFrame.SetConcreteL": self._wrap_set_concrete_l,
-            "PropFrame.SetConcreteCross": self._wrap_set_concrete_cross,
-            "PropFrame.SetConcretePipe": self._wrap_set_concrete_pipe,
-            "PropFrame.SetPlate": self._wrap_set_plate,
-            "PropFrame.SetRod": self._wrap_set_rod,
-            "PropFrame.SetColdC": self._wrap_set_cold_c,
-            "PropFrame.SetColdZ": self._wrap_set_cold_z,
-            "PropFrame.SetColdHat": self._wrap_set_cold_hat,
-            "PointObj.AddCartesian": self._wrap_add_cartesian,
-            "PointObj.SetRestraint": self._wrap_set_restraint,
-            "FrameObj.GetSection": self._wrap_get_section,
-            "FrameObj.GetPoints": self._wrap_get_points,
-            "FrameObj.GetLabelNameList": self._wrap_get_label_name_list,
-            "FrameObj.GetNameFromLabel": self._wrap_get_name_from_label,
-            "AreaObj.GetProperty": self._wrap_area_get_property,
-            "AreaObj.GetPoints": self._wrap_area_get_points,
-            "PointObj.GetCoordCartesian": self._wrap_get_coord_cartesian,
-            "PointObj.GetRestraint": self._wrap_get_restraint,
-            "PointObj.GetSelected": self._wrap_get_selected,
-            "SelectObj.GetSelected": self._wrap_select_obj_get_selected,
-            "AreaObj.GetAllAreas": self._wrap_get_all_areas,
-            "PropArea.GetWall": self._wrap_get_wall,
-            "PropArea.GetSlab": self._wrap_get_slab,
-            "PropArea.GetSlabRibbed": self._wrap_get_slab_ribbed,
-            "PropArea.GetSlabWaffle": self._wrap_get_slab_waffle,
-            "PropArea.GetDeck_1": self._wrap_get_deck_1,
-            "PropArea.SetWall": self._wrap_set_wall,
-            "PropArea.SetSlab": self._wrap_set_slab,
-            "PropArea.SetSlabRibbed": self._wrap_set_slab_ribbed,
-            "PropArea.SetSlabWaffle": self._wrap_set_slab_waffle,
-            "PropArea.SetDeck_1": self._wrap_set_deck_1,
-            "PropArea.SetDeckFilled": self._wrap_set_deck_filled,
-            "PropArea.SetDeckUnfilled": self._wrap_set_deck_unfilled,
-            "PropArea.SetDeckSolidSlab": self._wrap_set_deck_solid_slab,
-            "PropArea.SetShellLayer": self._wrap_set_shell_layer,
-            "AreaObj.SetProperty": self._wrap_area_set_property,
-            "AreaObj.SetLoadUniform": self._wrap_area_set_load_uniform,
-            "AreaObj.SetLoadUniformToFrame": self._wrap_area_set_load_uniform_to_frame,
-            "AreaObj.AddByCoord": self._wrap_area_add_by_coord,
-            "FrameObj.AddByPoint": self._wrap_add_by_point,
-            "FrameObj.SetSection": self._wrap_frame_set_section,
-            "PointObj.SetLoadForce": self._wrap_point_set_load_force,
-            "FrameObj.SetLoadDistributed": self._wrap_frame_set_load_distributed,
-            "FrameObj.SetLoadPoint": self._wrap_frame_set_load_point,
-            "LoadCases.StaticLinear.SetCase": self._wrap_static_linear_set_case,
-            "LoadCases.StaticLinear.SetInitialCase": self._wrap_static_linear_set_initial_case,
-            "LoadCases.StaticLinear.SetLoads": self._wrap_static_linear_set_loads,
-            "LoadCases.ResponseSpectrum.SetCase": self._wrap_response_spectrum_set_case,
-            "LoadCases.ResponseSpectrum.SetLoads": self._wrap_response_spectrum_set_loads,
-            "View.RefreshView": self._wrap_refresh_view,
-            "File.OpenFile": self._wrap_open_file,
-            "File.NewBlank": self._wrap_new_blank,
-            "Analyze.RunAnalysis": self._wrap_run_analysis,
-            "Story.GetStories": self._wrap_get_stories,
-            "Story.GetHeight": self._wrap_get_story_height,
-            "GridSys.GetNameList": self._wrap_get_name_list,
-            "GridSys.GetGridSys_2": self._wrap_get_grid_sys_2,
-            "PropMaterial.GetMPIsotropic": self._wrap_get_mpi_isotropic,
-            "PropMaterial.GetMPOrthotropic": self._wrap_get_mp_orthotropic,
-            "PropMaterial.GetMPAnisotropic": self._wrap_get_mp_anisotropic,
-            "PropMaterial.GetMPUniaxial": self._wrap_get_mp_uniaxial,
-        }
-        if path in special:
-            return lambda *args, **kwargs: special[path](func, *args, **kwargs)
-        return func
+        wrapper = self._special.get(path)
+        if not self._observers:
+            return func if wrapper is None else partial(wrapper, self, func)
+        if wrapper is not None:
+            func = partial(wrapper, self, partial(self._timed_backend_call, func))
+        return partial(self._observed_call, path, func)
 
     def _wrap_get_name_list(self, func, *args, **kwargs):
         if self.backend == "dotnet":
@@ -297,7 +507,7 @@ class CSIAPIHelpers:
 
     def _wrap_set_table_for_editing_array(self, func, table_key, table_version, fields, number_records, table_data, *args, **kwargs):
         if self.backend == "dotnet":
-            import System
+            Array, _Double, _Int32, String = self.get_system_types()
 
             def _to_str(v):
                 try:
@@ -306,8 +516,8 @@ class CSIAPIHelpers:
                 except (TypeError, ValueError):
                     return str(v)
 
-            net_fields = System.Array[System.String]([str(f) for f in fields])
-            net_data = System.Array[System.String]([_to_str(v) for v in table_data])
+            net_fields = Array[String]([str(f) for f in fields])
+            net_data = Array[String]([_to_str(v) for v in table_data])
             result = func(table_key, int(table_version), net_fields, int(number_records), net_data)
             return self.normalize_api_result(result)
         return func(table_key, table_version, fields, number_records, table_data)
@@ -657,16 +867,19 @@ class CSIAPIHelpers:
 
     def _wrap_joint_react(self, func, point_name, item_type=0, *args, **kwargs):
         if self.backend == "dotnet":
-            item_type = eItemTypeElm.resolve(eItemTypeElm.ObjectElm, api_module=self.api_module)
+            item_type = eItemTypeElm.resolve(item_type, api_module=self.api_module)
             result = func(
                 point_name,item_type,0,[],[],[],[],[],[],[],[],[],[],[]
             )
-            return self.normalize_api_result(result)
-        return self.normalize_api_result(func(point_name, item_type))
+        else:
+            result = func(point_name, item_type)
+        return self._as_array_result(
+            self.normalize_api_result(result), 12, str_items=range(1, 5), float_items=range(5, 12)
+        )
 
     def _wrap_frame_force(self, func, frame_name, item_type=0, *args, **kwargs):
         if self.backend == "dotnet":
-            item_type = eItemTypeElm.resolve(eItemTypeElm.ObjectElm, api_module=self.api_module)
+            item_type = eItemTypeElm.resolve(item_type, api_module=self.api_module)
             result = func(
                 frame_name,
                 item_type,
@@ -685,12 +898,18 @@ class CSIAPIHelpers:
                 [],
                 [],
             )
-            return self.normalize_api_result(result)
-        return self.normalize_api_result(func(frame_name, item_type))
+        else:
+            result = func(frame_name, item_type)
+        return self._as_array_result(
+            self.normalize_api_result(result),
+            14,
+            str_items=(1, 3, 5, 6),
+            float_items=(2, 4, 7, 8, 9, 10, 11, 12, 13),
+        )
 
     def _wrap_area_force_shell(self, func, area_name, item_type=0, *args, **kwargs):
         if self.backend == "dotnet":
-            item_type = eItemTypeElm.resolve(eItemTypeElm.ObjectElm, api_module=self.api_module)
+            item_type = eItemTypeElm.resolve(item_type, api_module=self.api_module)
             result = func(
                 area_name,
                 item_type,
@@ -719,8 +938,11 @@ class CSIAPIHelpers:
                 [],
                 [],
             )
-            return self.normalize_api_result(result)
-        return self.normalize_api_result(func(area_name, item_type))
+        else:
+            result = func(area_name, item_type)
+        return self._as_array_result(
+            self.normalize_api_result(result), 24, str_items=range(1, 6), float_items=range(6, 24)
+        )
 
     def _wrap_pier_force(self, func, *args, **kwargs):
         if self.backend == "dotnet":
@@ -738,24 +960,13 @@ class CSIAPIHelpers:
                 Array[Double]([]),
                 Array[Double]([]),
             )
-            normalized = self.normalize_api_result(result)
-            return (
-                self._as_int(self._item(normalized, 0)),
-                tuple(self._item(normalized, 1, ())),
-                tuple(self._item(normalized, 2, ())),
-                tuple(self._item(normalized, 3, ())),
-                tuple(self._item(normalized, 4, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 5, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 6, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 7, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 8, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 9, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 10, ())),
-                self._as_int(self._item(normalized, 11)),
-            )
-        if args or kwargs:
-            return func(*args, **kwargs)
-        return func()
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        return self._as_array_result(
+            self.normalize_api_result(result), 11, str_items=range(1, 5), float_items=range(5, 11)
+        )
 
     def _wrap_modal_participating_mass_ratios(self, func, *args, **kwargs):
         if self.backend == "dotnet":
@@ -779,35 +990,18 @@ class CSIAPIHelpers:
                 Array[Double]([]),
                 Array[Double]([]),
             )
-            normalized = self.normalize_api_result(result)
-            return (
-                self._as_int(self._item(normalized, 0)),
-                tuple(self._item(normalized, 1, ())),
-                tuple(self._item(normalized, 2, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 3, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 4, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 5, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 6, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 7, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 8, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 9, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 10, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 11, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 12, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 13, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 14, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 15, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 16, ())),
-                self._as_int(self._item(normalized, 17)),
-            )
-        if args or kwargs:
-            return func(*args, **kwargs)
-        return func()
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        return self._as_array_result(
+            self.normalize_api_result(result), 17, str_items=(1, 2), float_items=range(3, 17)
+        )
 
     def _wrap_joint_displ(self, func, point_name, item_type=0, *args, **kwargs):
         if self.backend == "dotnet":
             Array, Double, Int32, String = self.get_system_types()
-            item_type = eItemTypeElm.resolve(eItemTypeElm.ObjectElm, api_module=self.api_module)
+            item_type = eItemTypeElm.resolve(item_type, api_module=self.api_module)
             result = func(
                 point_name,
                 item_type,
@@ -824,34 +1018,25 @@ class CSIAPIHelpers:
                 Array[Double]([]),
                 Array[Double]([]),
             )
-            normalized = self.normalize_api_result(result)
-            return (
-                self._as_int(self._item(normalized, 0)),
-                tuple(self._item(normalized, 1, ())),
-                tuple(self._item(normalized, 2, ())),
-                tuple(self._item(normalized, 3, ())),
-                tuple(self._item(normalized, 4, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 5, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 6, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 7, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 8, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 9, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 10, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 11, ())),
-                self._as_int(self._item(normalized, 12)),
-            )
-        return self.normalize_api_result(func(point_name, item_type))
+        else:
+            result = func(point_name, item_type)
+        return self._as_array_result(
+            self.normalize_api_result(result), 12, str_items=range(1, 5), float_items=range(5, 12)
+        )
 
     def _wrap_get_available_tables(self, func, *args, **kwargs):
         result = func(0, [], [], [])
         return self.normalize_api_result(result)
 
-    def _wrap_get_table_for_display_array(self, func, table_name, *args, **kwargs):
+    def _wrap_get_table_for_display_array(self, func, table_name, FieldKeyList="", GroupName="", *args, **kwargs):
+        # FieldKeyList vacío pide todas las columnas; GroupName vacío, todo el modelo.
+        field_keys = list(FieldKeyList) if FieldKeyList else []
+        group_name = GroupName or ""
         if self.backend == "dotnet":
-            result = func(table_name, [], "", 0, [], 0, [])
+            result = func(table_name, field_keys, group_name, 0, [], 0, [])
             data = self.normalize_api_result(result)
             return (data[0], data[1], list(data[2]), int(data[3]), list(data[4]), int(data[5]))
-        return func(table_name, FieldKeyList="", GroupName="")
+        return func(table_name, FieldKeyList=field_keys or "", GroupName=group_name)
 
     def _wrap_get_all_frame_properties_2(self, func, *args, **kwargs):
         if self.backend == "dotnet":
@@ -1071,6 +1256,19 @@ class CSIAPIHelpers:
             return func(point_name, *args, **kwargs)
         return func(point_name, [])
 
+    def _wrap_get_diaphragm(self, func, point_name, *args, **kwargs):
+        if self.backend == "dotnet":
+            option = eDiaphragmOption.resolve(eDiaphragmOption.Disconnect, api_module=self.api_module)
+            result = func(point_name, option, "")
+        elif args or kwargs:
+            result = func(point_name, *args, **kwargs)
+        else:
+            result = func(point_name)
+        # DiaphragmOption, DiaphragmName, ret
+        normalized = self.normalize_api_result(result)
+        return (self._as_int(self._item(normalized, 0)), str(self._item(normalized, 1, "") or ""),
+                self._as_int(self._item(normalized, 2)))
+
     def _wrap_get_selected(self, func, *args, **kwargs):
         if args:
             point_name, *rest = args
@@ -1113,41 +1311,66 @@ class CSIAPIHelpers:
                 Array[Double]([]),
                 Array[Double]([]),
             )
-            normalized = self.normalize_api_result(result)
-            return (
-                int(normalized[0]),
-                tuple(normalized[1]),
-                tuple(int(item) if hasattr(item, "__int__") else item for item in normalized[2]),
-                int(normalized[3]),
-                tuple(normalized[4]),
-                tuple(normalized[5]),
-                tuple(float(item) for item in normalized[6]),
-                tuple(float(item) for item in normalized[7]),
-                tuple(float(item) for item in normalized[8]),
-                int(normalized[9]),
-            )
-        if args or kwargs:
-            return func(*args, **kwargs)
-        return func()
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        data = self._as_array_result(
+            self.normalize_api_result(result),
+            9,
+            str_items=(1, 5),
+            int_items=(2, 4),
+            float_items=(6, 7, 8),
+        )
+        # NumberBoundaryPts es un entero, no un arreglo.
+        return data[:3] + (self._as_int(data[3]),) + data[4:]
+
+    def _wrap_get_all_points(self, func, *args, **kwargs):
+        if self.backend == "dotnet":
+            csys = kwargs.get("CSys", args[0] if args else "Global")
+            result = func(0, [], [], [], [], csys)
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        return self._as_array_result(
+            self.normalize_api_result(result), 5, str_items=(1,), float_items=(2, 3, 4)
+        )
+
+    def _wrap_get_all_frames(self, func, *args, **kwargs):
+        if self.backend == "dotnet":
+            csys = kwargs.get("CSys", args[0] if args else "Global")
+            result = func(0, [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], [], csys)
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        # NumberNames, MyName, PropName, StoryName, PointName1, PointName2,
+        # Point1X..Point2Z, Angle, Offset1X..Offset2Z, CardinalPoint
+        return self._as_array_result(
+            self.normalize_api_result(result),
+            20,
+            str_items=range(1, 6),
+            float_items=range(6, 19),
+            int_items=(19,),
+        )
 
     def _wrap_get_stories(self, func, *args, **kwargs):
         if self.backend == "dotnet":
             result = func(0, [], [], [], [], [], [], [])
-            normalized = self.normalize_api_result(result)
-            return (
-                self._as_int(self._item(normalized, 0)),
-                tuple(self._item(normalized, 1, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 2, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 3, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 4, ())),
-                tuple(bool(item) for item in self._item(normalized, 5, ())),
-                tuple(self._item(normalized, 6, ())),
-                tuple(self._as_float(item) for item in self._item(normalized, 7, ())),
-                self._as_int(self._item(normalized, 8)),
-            )
-        if args or kwargs:
-            return func(*args, **kwargs)
-        return func()
+        elif args or kwargs:
+            result = func(*args, **kwargs)
+        else:
+            result = func()
+        # NumberStories, StoryNames, StoryElevations, StoryHeights, IsMasterStory,
+        # SimilarToStory, SpliceAbove, SpliceHeight, ret
+        return self._as_array_result(
+            self.normalize_api_result(result),
+            8,
+            str_items=(1, 5),
+            float_items=(2, 3, 7),
+            bool_items=(4, 6),
+        )
 
     def _wrap_get_story_height(self, func, story_name, *args, **kwargs):
         if self.backend == "dotnet":
@@ -0,0 +1,268 @@
+"""
+Benchmarks de los caminos críticos de ``DataExtractor`` y ``ModelBuilder``.
+
+Cada caso corre sobre un ``CSIHandler`` con ``backend="simulated"`` recién
+creado (caches vacías) y reporta tiempo de pared, pico de memoria
+(``tracemalloc``) y cantidad de llamadas al backend, para varios tamaños de
+modelo. Los resultados pueden guardarse en JSON y compararse contra una
+corrida anterior para detectar regresiones entre commits. Con ``--api-shape``
+el simulador responde con la forma cruda de comtypes o dotnet, de modo que
+cada caso también ejercita los wrappers de ``CSIAPIHelpers``.
+
+Uso::
+
+    python benchmarks/bench_extractor.py
+    python benchmarks/bench_extractor.py --sizes small medium --cases frames_properties
+    python benchmarks/bench_extractor.py --output actual.json --compare base.json
+    python benchmarks/bench_extractor.py --sizes small --api-shape dotnet
+"""
+
+import argparse
+import atexit
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from csi_py import CSIHandler
+
+SIZES = {
+    "small": {"stories": 5, "bays_x": 3, "bays_y": 3, "walls": 1},
+    "medium": {"stories": 20, "bays_x": 6, "bays_y": 6, "walls": 2},
+    "large": {"stories": 40, "bays_x": 10, "bays_y": 10, "walls": 3},
+}
+
+_EDIT_TABLE = "Frame Assignments - Section Properties"
+_RESULT_TABLE = "Element Forces - Beams"
+
+
+def _set_table_setup(handler):
+    return handler.get_editing_table(_EDIT_TABLE)
+
+
+def _set_table_run(handler, prepared):
+    version, table = prepared
+    return handler.set_table(_EDIT_TABLE, table, version)
+
+
+def _select_all_outputs(handler):
+    handler.select_cases_and_combos(handler.cases_and_combos)
+
+
+def _snapshot_setup(handler):
+    # Modelo en un archivo temporal y snapshot ya guardado; se mide la recarga.
+    directory = tempfile.mkdtemp(prefix="csi_py_bench_")
+    atexit.register(shutil.rmtree, directory, True)
+    model_file = os.path.join(directory, "model.edb")
+    with open(model_file, "w") as stream:
+        stream.write("simulated")
+    handler.connector.sim_model.file_path = model_file
+    handler.snapshot_dir = os.path.join(directory, "snapshots")
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    handler.frames_properties, handler.area_geometry
+    handler._cache.clear()
+
+
+def _export_path(handler):
+    directory = tempfile.mkdtemp(prefix="csi_py_bench_")
+    atexit.register(shutil.rmtree, directory, True)
+    return os.path.join(directory, "frames")
+
+
+def _export_run(handler, path):
+    return handler.export_results("frame", None, path, chunk=500, overwrite=True)["rows"]
+
+
+def _consume_chunks(chunks):
+    # Sumidero mínimo: solo cuenta filas, sin retener las partes.
+    return sum(len(chunk) for _, chunk in chunks)
+
+
+# nombre -> (preparación fuera de la medición o None, operación medida)
+CASES = {
+    "get_table": (None, lambda h, _: h.get_table(_EDIT_TABLE, definition=True)),
+    "tabular_data": (None, lambda h, _: h.tabular_data),
+    "get_table_results": (_select_all_outputs, lambda h, _: h.get_table(_RESULT_TABLE)),
+    "iter_table": (_select_all_outputs, lambda h, _: _consume_chunks(h.iter_table(_RESULT_TABLE, by="case"))),
+    "points_coordinates": (None, lambda h, _: h.points_coordinates),
+    "frames_properties": (None, lambda h, _: h.frames_properties),
+    "snapshot_reload": (_snapshot_setup, lambda h, _: (h.frames_properties, h.area_geometry)),
+    "get_beams_connectivity": (None, lambda h, _: h.get_beams_connectivity()),
+    "get_columns_connectivity": (None, lambda h, _: h.get_columns_connectivity()),
+    "filter_frames_by_grid": (None, lambda h, _: h.filter_frames_by_grid(grid="A")),
+    "get_frame_forces": (None, lambda h, _: h.get_frame_forces()),
+    "get_frame_forces_subset": (None, lambda h, _: h.get_frame_forces(h.frame_list[::2])),
+    "get_area_forces": (None, lambda h, _: h.get_area_forces()),
+    "get_area_envelope": (None, lambda h, _: h.get_area_forces(columns=["M11", "M22"], envelope=True,
+                                                               chunk_size=200)),
+    "get_point_displacements": (None, lambda h, _: h.get_point_displacements()),
+    "export_results": (_export_path, _export_run),
+    "get_modal_data": (None, lambda h, _: h.get_modal_data()),
+    "set_table": (_set_table_setup, _set_table_run),
+}
+# export_results necesita pyarrow, que es opcional.
+if importlib.util.find_spec("pyarrow") is None:
+    del CASES["export_results"]
+
+
+def _connect(model_options):
+    handler = CSIHandler(backend="simulated", **model_options)
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    return handler
+
+
+def _rows(result):
+    if isinstance(result, (pd.DataFrame, pd.Series, list, tuple, dict)):
+        return len(result)
+    return None
+
+
+def _measure(case, model_options, trace_memory):
+    setup, operation = CASES[case]
+    handler = _connect(model_options)
+    sim_model = handler.connector.sim_model
+    prepared = setup(handler) if setup is not None else None
+    calls_before = sim_model.num_calls
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = operation(handler, prepared)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "wall_s": elapsed,
+        "peak_mb": peak / 2 ** 20,
+        "calls": sim_model.num_calls - calls_before,
+        "rows": _rows(result),
+        "frames": len(sim_model.frame_names),
+        "points": len(sim_model.point_names),
+        "areas": len(sim_model.area_names),
+    }
+
+
+def run(cases=None, sizes=None, repeat=3, api_shape=None):
+    """
+    Ejecuta los casos indicados y retorna una lista de resultados.
+
+    ``wall_s`` es el mínimo de ``repeat`` corridas sin ``tracemalloc``; el pico
+    de memoria se mide en una corrida adicional porque el trazado distorsiona
+    los tiempos.
+    """
+    results = []
+    for size in sizes or list(SIZES):
+        for case in cases or list(CASES):
+            options = dict(SIZES[size], api_shape=api_shape)
+            runs = [_measure(case, options, trace_memory=False) for _ in range(repeat)]
+            traced = _measure(case, options, trace_memory=True)
+            best = min(runs, key=lambda item: item["wall_s"])
+            best["peak_mb"] = traced["peak_mb"]
+            best.update({"case": case, "size": size})
+            results.append(best)
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _metadata():
+    return {
+        "commit": _commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def compare(results, baseline, threshold=1.25):
+    """
+    Compara contra una corrida previa y retorna las regresiones de tiempo.
+
+    Una regresión es un caso cuyo tiempo supera ``threshold`` veces el de referencia.
+    """
+    reference = {(item["case"], item["size"]): item for item in baseline["results"]}
+    regressions = []
+    for item in results:
+        base = reference.get((item["case"], item["size"]))
+        if base is None or not base["wall_s"]:
+            continue
+        ratio = item["wall_s"] / base["wall_s"]
+        item["ratio"] = ratio
+        if ratio > threshold:
+            regressions.append(item)
+    return regressions
+
+
+def _print(results):
+    header = f"{'caso':<26}{'tamaño':<8}{'tiempo [s]':>12}{'pico [MB]':>11}{'llamadas':>10}{'filas':>9}"
+    print(header)
+    print("-" * len(header))
+    for item in results:
+        ratio = f"  x{item['ratio']:.2f}" if "ratio" in item else ""
+        rows = "" if item["rows"] is None else item["rows"]
+        print(
+            f"{item['case']:<26}{item['size']:<8}{item['wall_s']:>12.4f}"
+            f"{item['peak_mb']:>11.1f}{item['calls']:>10,d}{rows:>9}{ratio}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES))
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="Archivo JSON de referencia")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--api-shape", choices=["comtypes", "dotnet"],
+                        help="Forma cruda de las respuestas del simulador (pasa por los wrappers)")
+    args = parser.parse_args(argv)
+
+    results = run(args.cases, args.sizes, args.repeat, args.api_shape)
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as stream:
+            regressions = compare(results, json.load(stream), args.threshold)
+    _print(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump({"meta": dict(_metadata(), api_shape=args.api_shape), "results": results},
+                      stream, indent=2)
+
+    if regressions:
+        print()
+        print(f"Regresiones (> x{args.threshold:.2f}):")
+        for item in regressions:
+            print(f"  {item['case']} [{item['size']}]: x{item['ratio']:.2f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Micro-benchmark de ``GridEngine`` con líneas de grid generales (oblicuas).
+
+Dos escenarios de 100k frames contra 200 líneas generales de ángulo, centro y
+largo aleatorios sobre una planta de 100 x 100:
+
+- ``skewed``: coordenadas distintas en cada frame; el 30 % de los frames cae
+  sobre alguna línea (la mitad como columna, con ambos extremos en el mismo
+  punto de planta).
+- ``building``: 2.500 frames en planta repetidos en 40 pisos, como en un
+  edificio real.
+
+Uso::
+
+    python benchmarks/bench_grid.py
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from csi_py.grid_index import GridEngine
+
+
+def skewed_case(num_frames=100_000, num_lines=200, seed=0):
+    rng = np.random.default_rng(seed)
+    angle = rng.uniform(0, np.pi, num_lines)
+    cx, cy = rng.uniform(0, 100, num_lines), rng.uniform(0, 100, num_lines)
+    length = rng.uniform(20, 140, num_lines)
+    x1, y1 = cx - length / 2 * np.cos(angle), cy - length / 2 * np.sin(angle)
+    x2, y2 = cx + length / 2 * np.cos(angle), cy + length / 2 * np.sin(angle)
+    lines = pd.DataFrame({
+        "GridLineID": [f"G{k}" for k in range(num_lines)], "Axis": "General", "Ordinate": np.nan,
+        "X1": x1, "Y1": y1, "X2": x2, "Y2": y2,
+    })
+
+    xi, yi, xj, yj = (rng.uniform(0, 100, num_frames) for _ in range(4))
+    on_line = rng.random(num_frames) < 0.3
+    k = rng.integers(0, num_lines, num_frames)
+    t_i, t_j = rng.uniform(0, 1, num_frames), rng.uniform(0, 1, num_frames)
+    t_j = np.where(rng.random(num_frames) < 0.5, t_i, t_j)
+    xi = np.where(on_line, x1[k] + t_i * (x2[k] - x1[k]), xi)
+    yi = np.where(on_line, y1[k] + t_i * (y2[k] - y1[k]), yi)
+    xj = np.where(on_line, x1[k] + t_j * (x2[k] - x1[k]), xj)
+    yj = np.where(on_line, y1[k] + t_j * (y2[k] - y1[k]), yj)
+    return lines, xi, yi, xj, yj
+
+
+def building_case(stories=40, num_lines=200, seed=1):
+    lines, xi, yi, xj, yj = skewed_case(100_000 // stories, num_lines, seed)
+    return (lines,) + tuple(np.tile(values, stories) for values in (xi, yi, xj, yj))
+
+
+def run(repeat=3):
+    results = {}
+    for label, case in (("skewed", skewed_case), ("building", building_case)):
+        lines, xi, yi, xj, yj = case()
+        engine = GridEngine(lines)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            frames, _ = engine.pairs(xi, yi, xj, yj)
+            times.append(time.perf_counter() - start)
+        results[label] = (len(xi), len(lines), len(frames), min(times))
+    return results
+
+
+if __name__ == "__main__":
+    for label, (frames, lines, pairs, best) in run().items():
+        print(f"{label:>9}: {frames:,d} frames x {lines} líneas -> {pairs:,d} pares en {best:.3f} s")
@@ -0,0 +1,148 @@
+"""
+Micro-benchmark del proxy ``_CSIProxy``.
+
+Mide llamadas por segundo a ``PointObj.GetCoordCartesian`` contra un modelo
+de reemplazo en Python puro, comparando la resolución previa (mapa de wrappers
+reconstruido en cada acceso) con la tabla precompilada y la cache de callables.
+
+También cuenta cuántos atributos se leen del objeto subyacente durante una
+extracción típica, con y sin memorización de sub-objetos.
+
+Uso::
+
+    python benchmarks/bench_proxy.py
+"""
+
+import time
+
+from csi_py.api_helpers import CSIAPIHelpers, _CSIProxy
+
+
+class _StandInPointObj:
+    def __init__(self, num_points):
+        self.coords = {str(i): (float(i), 0.0, 0.0) for i in range(num_points)}
+
+    def GetCoordCartesian(self, name, *args, **kwargs):
+        x, y, z = self.coords[name]
+        return x, y, z, 0
+
+
+class _StandInSetup:
+    def DeselectAllCasesAndCombosForOutput(self):
+        return 0
+
+    def SetCaseSelectedForOutput(self, name):
+        return 0
+
+
+class _StandInResults:
+    def __init__(self):
+        self.Setup = _StandInSetup()
+
+
+class _StandInSapModel:
+    def __init__(self, num_points):
+        self.PointObj = _StandInPointObj(num_points)
+        self.Results = _StandInResults()
+
+
+class _Counting:
+    """Envuelve un objeto y cuenta cada lectura de atributo (equivale a un fetch COM/.NET)."""
+
+    def __init__(self, target, counter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_counter", counter)
+
+    def __getattr__(self, name):
+        self._counter[0] += 1
+        attr = getattr(self._target, name)
+        if callable(attr) or isinstance(attr, (str, int, float, bool)):
+            return attr
+        return _Counting(attr, self._counter)
+
+
+class _StandInOwner:
+    backend = "comtypes"
+    api_module = None
+
+    def __init__(self, raw_model):
+        self._raw_model = raw_model
+
+
+class _LegacyHelpers(CSIAPIHelpers):
+    """Reproduce la resolución previa: mapa completo y lambda nueva por acceso."""
+
+    cache_proxies = False
+
+    def wrap_callable(self, path, func):
+        special = {key: getattr(self, name) for key, name in self._SPECIAL_WRAPPERS.items()}
+        if path in special:
+            return lambda *args, **kwargs: special[path](func, *args, **kwargs)
+        return func
+
+
+class _UncachedHelpers(CSIAPIHelpers):
+    cache_proxies = False
+
+
+def _calls_per_second(model, names, repeat):
+    # Sub-proxy retenido: aísla el costo de resolver el callable.
+    point_obj = model.PointObj
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for name in names:
+            point_obj.GetCoordCartesian(name)
+    elapsed = time.perf_counter() - start
+    return repeat * len(names) / elapsed
+
+
+def run(num_points=20000, repeat=5):
+    raw_model = _StandInSapModel(num_points)
+    names = list(raw_model.PointObj.coords)
+    results = {}
+    for label, helpers_cls in (
+        ("legacy", _LegacyHelpers),
+        ("table", _UncachedHelpers),
+        ("cached", CSIAPIHelpers),
+    ):
+        helpers = helpers_cls(_StandInOwner(raw_model))
+        model = _CSIProxy(helpers, raw_model)
+        results[label] = _calls_per_second(model, names, repeat)
+    return results
+
+
+def _extraction(model, names, cases):
+    model.Results.Setup.DeselectAllCasesAndCombosForOutput()
+    for case in cases:
+        model.Results.Setup.SetCaseSelectedForOutput(case)
+    for name in names:
+        model.PointObj.GetCoordCartesian(name)
+
+
+def count_fetches(num_points=2000, num_cases=20):
+    """Cuenta lecturas de atributos del modelo subyacente por extracción."""
+    cases = [f"C{i}" for i in range(num_cases)]
+    results = {}
+    for label, helpers_cls in (("uncached", _UncachedHelpers), ("cached", CSIAPIHelpers)):
+        counter = [0]
+        stand_in = _StandInSapModel(num_points)
+        names = list(stand_in.PointObj.coords)
+        raw_model = _Counting(stand_in, counter)
+        model = _CSIProxy(helpers_cls(_StandInOwner(raw_model)), raw_model)
+        _extraction(model, names, cases)
+        first = counter[0]
+        _extraction(model, names, cases)
+        results[label] = (first, counter[0] - first)
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    base = results["legacy"]
+    for label, rate in results.items():
+        print(f"{label:>8}: {rate:12,.0f} llamadas/s  (x{rate / base:.1f})")
+
+    print()
+    print("Lecturas de atributos del modelo subyacente (primera / segunda extracción):")
+    for label, (first, second) in count_fetches().items():
+        print(f"{label:>8}: {first:8,d} / {second:8,d}")
@@ -1,6 +1,7 @@
 from .constants import eMatType,u
 from .constants import EtabsError
 from .extractor import DataExtractor
+from .tables import decode_table
 import numpy as np
 
 import pandas as pd
@@ -28,11 +29,12 @@ class ModelBuilder(DataExtractor):
         self._section_definitions_table = None
         self._tee_section_table = None
 
-    def get_editing_table(self, table_name):
+    def get_editing_table(self, table_name, raw=True):
         """
         Extrae una tabla editable del modelo.
 
-        Retorna la versión de tabla y el DataFrame listo para edición tabular.
+        Retorna la versión de tabla y el DataFrame listo para edición tabular. Con
+        ``raw=False`` las columnas numéricas se convierten a ``float64``.
         """
         data = self.model.DatabaseTables.GetTableForEditingArray(
             table_name, GroupName=''
@@ -46,15 +48,7 @@ class ModelBuilder(DataExtractor):
         if flag != 0:
             raise EtabsError(f"Error al extraer la tabla editable, flag devuelto de {flag}")
 
-        version = data[0]
-        columns = data[1]
-        num_records = data[2]
-        table_data = [i if i else '' for i in data[3]]
-
-        df = pd.DataFrame(table_data)
-        df = df.values.reshape(num_records, len(columns))
-        table = pd.DataFrame(df, columns=columns)
-        return version, table
+        return data[0], decode_table(data[1], data[2], data[3], raw=raw, table_name=table_name)
         
     # Tables
     def apply_edited_table(self):
@@ -79,7 +73,11 @@ class ModelBuilder(DataExtractor):
             import warnings
             if num_warnings > 0:
                 warnings.warn(f"Advertencias: {num_warnings}", RuntimeWarning)
-                
+
+        # Las tablas pueden tocar cualquier dominio del modelo
+        self.invalidate_cache()
+        # y redefinir casos y combinaciones
+        self._forget_selection_state()
         return 0
     
     def get_editable_table(self,name,columns):
@@ -161,6 +159,7 @@ class ModelBuilder(DataExtractor):
         point = self.model.PointObj.AddCartesian(x,y,z)
         if point[-1]!=0:
             raise RuntimeError(f"Error ETABS al crear punto en ({x}, {y}, {z})")
+        self.invalidate_cache('geometry')
         return point[0]
         
     # ==================== LOAD COMBINATIONS ====================
@@ -168,11 +167,13 @@ class ModelBuilder(DataExtractor):
     def add_load_combo(self, combo_name, combo_type=0):
         """Añade una combinación de carga."""
         self.model.RespCombo.Add(combo_name, combo_type)
+        self.invalidate_cache('loads')
         print(f"Combinación de carga '{combo_name}' añadida")
     
     def set_combo_case(self, combo_name, case_name, scale_factor):
         """Asigna un caso o combo a una combinación con su factor."""
         self.model.RespCombo.SetCaseList(combo_name, 0, case_name, scale_factor)
+        self.invalidate_cache('loads')
         print(f"Caso '{case_name}' añadido a combo '{combo_name}' con factor {scale_factor}")
      
     # ==================== MATERIALS ====================
@@ -186,6 +187,7 @@ class ModelBuilder(DataExtractor):
         self.model.PropMaterial.SetMaterial(material_name, material_type)
         self.model.PropMaterial.SetMPIsotropic(material_name, E, U, A)
         self.model.PropMaterial.SetWeightAndMass(material_name, 2, mass_per_volume)
+        self.invalidate_cache('sections')
         print(f"Material '{material_name}' añadido")
         
     def add_uniaxial_material(self, 
@@ -198,6 +200,7 @@ class ModelBuilder(DataExtractor):
         self.model.PropMaterial.SetMaterial(material_name, material_type)
         self.model.PropMaterial.SetMPUniaxial(material_name, E, A)
         self.model.PropMaterial.SetWeightAndMass(material_name, 2, mass_per_volume)
+        self.invalidate_cache('sections')
         print(f"Material uniaxial '{material_name}' añadido")
         
     def add_concrete_material(self,name,fc=21*u.MPa,
@@ -239,6 +242,7 @@ class ModelBuilder(DataExtractor):
         """Define restricciones en un punto."""
         restraints = [UX, UY, UZ, RX, RY, RZ]
         self.model.PointObj.SetRestraint(point_name, restraints)
+        self.invalidate_cache('points_restraints', 'results')
         print(f"Restricciones aplicadas a punto '{point_name}'")
         
     # ==================== FRAMES ====================
@@ -247,21 +251,25 @@ class ModelBuilder(DataExtractor):
         """Crea una sección rectangular sólida."""
         self.model.PropFrame.SetRectangle(section_name, material_name, t3, t2)
         # SetRebarBeam / SetRebarColumn
+        self.invalidate_cache('sections')
         print(f"Sección rectangular '{section_name}' añadida: {t2} x {t3}")
         
     def add_circle_section(self, section_name, material_name, diameter):
         """Crea una sección circular sólida."""
         self.model.PropFrame.SetCircle(section_name, material_name, diameter)
+        self.invalidate_cache('sections')
         print(f"Sección circular '{section_name}' añadida: ø{diameter}")
         
     def add_pipe_section(self, section_name, material_name, diameter, thickness):
         """Crea una sección tubular circular."""
         self.model.PropFrame.SetPipe(section_name, material_name, diameter, thickness)
+        self.invalidate_cache('sections')
         print(f"Sección pipe '{section_name}' añadida: ø{diameter}, t={thickness}")
         
     def add_tube_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección tubular rectangular."""
         self.model.PropFrame.SetTube(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección tube '{section_name}' añadida: {t2} x {t3}, tf={tf}, tw={tw}")
         
     def add_i_section(self, section_name, material_name, t3, t2, tf, tw, t2b=None, tfb=None):
@@ -272,36 +280,43 @@ class ModelBuilder(DataExtractor):
             tfb = tf
         
         self.model.PropFrame.SetISection(section_name, material_name, t3, t2, tf, tw, t2b, tfb)
+        self.invalidate_cache('sections')
         print(f"Sección I '{section_name}' añadida: h={t3}, bf={t2}/{t2b}, tf={tf}/{tfb}, tw={tw}")
         
     def add_channel_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección tipo canal."""
         self.model.PropFrame.SetChannel(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección canal '{section_name}' añadida: h={t3}, bf={t2}, tf={tf}, tw={tw}")
         
     def add_tee_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección tipo T."""
         self.model.PropFrame.SetTee(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección T '{section_name}' añadida: h={t3}, bf={t2}, tf={tf}, tw={tw}")
         
     def add_angle_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección tipo ángulo."""
         self.model.PropFrame.SetAngle(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección ángulo '{section_name}' añadida: {t3} x {t2}, tf={tf}, tw={tw}")
         
     def add_double_angle_section(self, section_name, material_name, t3, t2, tf, tw, dis):
         """Crea una sección de doble ángulo."""
         self.model.PropFrame.SetDblAngle(section_name, material_name, t3, t2, tf, tw, dis)
+        self.invalidate_cache('sections')
         print(f"Sección doble ángulo '{section_name}' añadida: 2L {t3}x{t2}, sep={dis}")
         
     def add_double_channel_section(self, section_name, material_name, t3, t2, tf, tw, dis):
         """Crea una sección de doble canal."""
         self.model.PropFrame.SetDblChannel(section_name, material_name, t3, t2, tf, tw, dis)
+        self.invalidate_cache('sections')
         print(f"Sección doble canal '{section_name}' añadida: 2C h={t3}, sep={dis}")
         
     def add_concrete_box_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección cajón de concreto."""
         self.model.PropFrame.SetConcreteBox(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección cajón concreto '{section_name}' añadida: {t2}x{t3}, tf={tf}, tw={tw}")
         
     def add_concrete_tee_section(self, section_name, material_name, t3, t2, tf, tw, twt=None, mirror=False):
@@ -309,46 +324,55 @@ class ModelBuilder(DataExtractor):
         if twt is None:
             twt = tw
         self.model.PropFrame.SetConcreteTee(section_name, material_name, t3, t2, tf, tw, twt, mirror)
+        self.invalidate_cache('sections')
         print(f"Sección T concreto '{section_name}' añadida: h={t3}, bf={t2}")
         
     def add_concrete_L_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección L de concreto."""
         self.model.PropFrame.SetConcreteL(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección L concreto '{section_name}' añadida: {t3}x{t2}")
         
     def add_concrete_pipe_section(self, section_name, material_name, diameter, thickness):
         """Crea una sección tubular de concreto."""
         self.model.PropFrame.SetConcretePipe(section_name, material_name, diameter, thickness)
+        self.invalidate_cache('sections')
         print(f"Sección tubo concreto '{section_name}' añadida: ø{diameter}, t={thickness}")
         
     def add_concrete_cross_section(self, section_name, material_name, t3, t2, tf, tw):
         """Crea una sección tipo cruz de concreto."""
         self.model.PropFrame.SetConcreteCross(section_name, material_name, t3, t2, tf, tw)
+        self.invalidate_cache('sections')
         print(f"Sección cruz concreto '{section_name}' añadida: {t2}x{t3}")
         
     def add_plate_section(self, section_name, material_name, thickness):
         """Crea una sección tipo placa sólida."""
         self.model.PropFrame.SetPlate(section_name, material_name, thickness)
+        self.invalidate_cache('sections')
         print(f"Sección placa '{section_name}' añadida: t={thickness}")
         
     def add_rod_section(self, section_name, material_name, diameter):
         """Crea una sección tipo varilla sólida."""
         self.model.PropFrame.SetRod(section_name, material_name, diameter)
+        self.invalidate_cache('sections')
         print(f"Sección varilla '{section_name}' añadida: ø{diameter}")
         
     def add_cold_formed_c_section(self, section_name, material_name, t3, t2, thickness, lip):
         """Crea una sección C de acero conformado en frío."""
         self.model.PropFrame.SetColdC(section_name, material_name, t3, t2, thickness, lip)
+        self.invalidate_cache('sections')
         print(f"Sección C conformada '{section_name}' añadida: h={t3}, bf={t2}, t={thickness}")
         
     def add_cold_formed_z_section(self, section_name, material_name, t3, t2, thickness, lip):
         """Crea una sección Z de acero conformado en frío."""
         self.model.PropFrame.SetColdZ(section_name, material_name, t3, t2, thickness, lip)
+        self.invalidate_cache('sections')
         print(f"Sección Z conformada '{section_name}' añadida: h={t3}, bf={t2}, t={thickness}")
         
     def add_cold_formed_hat_section(self, section_name, material_name, t3, t2, thickness):
         """Crea una sección Hat de acero conformado en frío."""
         self.model.PropFrame.SetColdHat(section_name, material_name, t3, t2, thickness)
+        self.invalidate_cache('sections')
         print(f"Sección Hat conformada '{section_name}' añadida: h={t3}, b={t2}, t={thickness}")
         
     def add_frame_section(self, section_name, material_name, section_type, **kwargs):
@@ -509,6 +533,7 @@ class ModelBuilder(DataExtractor):
         """Añade un frame entre dos puntos."""
         frame_name = self.model.FrameObj.AddByPoint(point_i, point_j)[0]
         self.model.FrameObj.SetSection(frame_name, section_name)
+        self.invalidate_cache('geometry')
         print(f"Frame '{frame_name}' añadido entre '{point_i}' y '{point_j}'")
         
     # ==================== SLABS (LOSAS) ====================
@@ -519,6 +544,7 @@ class ModelBuilder(DataExtractor):
         self.model.PropArea.SetSlab(section_name, slab_type, shell_type, 
                             material_name, thickness)
         slab_types = {0: 'Slab', 1: 'Drop', 2: 'Mat', 3: 'Footing'}
+        self.invalidate_cache('sections')
         print(f"Sección de losa '{section_name}' añadida: t={thickness} ({slab_types.get(slab_type, 'Unknown')})")
 
 
@@ -541,6 +567,7 @@ class ModelBuilder(DataExtractor):
         )
 
         direction_str = "Local 1" if rib_direction == 1 else "Local 2"
+        self.invalidate_cache('sections')
         print(f"Sección de losa nervada '{section_name}' añadida:")
         print(f"  - Altura total: {overall_depth}")
         print(f"  - Espesor losa: {slab_thickness}")
@@ -567,6 +594,7 @@ class ModelBuilder(DataExtractor):
             rib_spacing_dir2
         )
         
+        self.invalidate_cache('sections')
         print(f"Sección de losa reticular '{section_name}' añadida:")
         print(f"  - Altura total: {overall_depth}")
         print(f"  - Espesor losa: {slab_thickness}")
@@ -579,6 +607,7 @@ class ModelBuilder(DataExtractor):
         """Crea una sección de muro."""
         self.model.PropArea.SetWall(section_name, wall_prop_type, shell_type,
                             material_name, thickness)
+        self.invalidate_cache('sections')
         print(f"Sección de muro '{section_name}' añadida: t={thickness}")
         
     # ==================== DECKS (LOSAS COLABORANTES) ====================
@@ -593,6 +622,7 @@ class ModelBuilder(DataExtractor):
             concrete_material, slab_depth, rib_depth, rib_width_top, 
             rib_width_bot, rib_spacing, shear_studs_per_rib
         )
+        self.invalidate_cache('sections')
         print(f"Sección de deck relleno '{section_name}' añadida: h_total={slab_depth}")
 
 
@@ -605,6 +635,7 @@ class ModelBuilder(DataExtractor):
             rib_depth, rib_width_top, rib_width_bot, rib_spacing,
             shear_thickness, unit_weight
         )
+        self.invalidate_cache('sections')
         print(f"Sección de deck sin relleno '{section_name}' añadida")
 
 
@@ -614,6 +645,7 @@ class ModelBuilder(DataExtractor):
         self.model.PropArea.SetDeckSolidSlab(
             section_name, shell_type, material, depth, shear_studs_per_rib
         )
+        self.invalidate_cache('sections')
         print(f"Sección de deck losa sólida '{section_name}' añadida: t={depth}")
 
 
@@ -626,6 +658,7 @@ class ModelBuilder(DataExtractor):
             section_name, layer_name, distance_from_ref,
             thickness, shell_type, 0, material, angle
         )
+        self.invalidate_cache('sections')
         print(f"Capa '{layer_name}' añadida a sección '{section_name}': t={thickness}")
 
     def add_area_section(self, section_name, material_name, section_type, **kwargs):
@@ -669,6 +702,7 @@ class ModelBuilder(DataExtractor):
         coords_z = list(np.array(points)[:,2])
         slab_name = self.model.AreaObj.AddByCoord(num_points, coords_x, coords_y, coords_z)[3]
         self.model.AreaObj.SetProperty(slab_name, section_name)
+        self.invalidate_cache('geometry')
         return slab_name
             
      # ==================== LOAD PATTERNS ====================
@@ -676,6 +710,7 @@ class ModelBuilder(DataExtractor):
     def add_load_pattern(self, pattern_name, pattern_type=1):
         """Añade un patrón de carga."""
         self.model.LoadPatterns.Add(pattern_name, pattern_type)
+        self.invalidate_cache('loads')
         print(f"Patrón de carga '{pattern_name}' añadido")
     
     def add_point_load(self, point_name, load_pattern, Fx=0, Fy=0, Fz=0, 
@@ -683,6 +718,7 @@ class ModelBuilder(DataExtractor):
         """Añade una carga puntual a un punto."""
         forces = [Fx, Fy, Fz, Mx, My, Mz]
         self.model.PointObj.SetLoadForce(point_name, load_pattern, forces)
+        self.invalidate_cache('loads')
         print(f"Carga puntual añadida a '{point_name}'")
     
     def add_frame_distributed_load(self, frame_name, load_pattern, direction, 
@@ -691,11 +727,13 @@ class ModelBuilder(DataExtractor):
         self.model.FrameObj.SetLoadDistributed(frame_name, load_pattern, 
                                               dist_type, direction, 0, 1, 
                                               value, value)
+        self.invalidate_cache('loads')
         print(f"Carga distribuida añadida a frame '{frame_name}'")
     
     def add_area_uniform_load(self, area_name, load_pattern, value, direction=6):
         """Añade una carga uniforme a un área."""
         self.model.AreaObj.SetLoadUniform(area_name, load_pattern, value, direction)
+        self.invalidate_cache('loads')
         print(f"Carga uniforme añadida a área '{area_name}'")
 
     # ==================== EXPORT TABULAR DATA ====================
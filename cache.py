@@ -0,0 +1,159 @@
+"""
+Registro de caches de propiedades del handler.
+
+Cada entrada declara su dominio (``geometry``, ``sections``, ``loads`` o
+``results``) y sus dependencias: otras entradas o dominios completos. Al
+invalidar un dominio se descartan sus entradas y, en cascada, todas las que
+dependen de ellas. El registro cuenta aciertos y fallos por entrada y, con un
+presupuesto de memoria, expulsa las tablas (``DataFrame``, arreglos y
+diccionarios de tablas) usadas hace más tiempo (LRU); las listas de nombres no
+cuentan ni se expulsan. Una entrada expulsada se vuelve a calcular en el
+siguiente acceso.
+"""
+
+import sys
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+
+CACHE_DOMAINS = ('geometry', 'sections', 'loads', 'results')
+
+
+def _is_table(value):
+    return isinstance(value, (pd.DataFrame, pd.Series, np.ndarray, dict))
+
+
+def estimate_size(value):
+    """Tamaño aproximado en bytes de un valor cacheado."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(index=True, deep=True)
+        return int(usage.sum()) if isinstance(value, pd.DataFrame) else int(usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(estimate_size(item) for item in value.values())
+    return sys.getsizeof(value)
+
+
+class CacheRegistry:
+    """
+    Caches con dominio, dependencias, contadores y presupuesto LRU opcional.
+
+    ``entries`` es ``{nombre: (dominio, dependencias)}``; ``budget_mb=None``
+    desactiva la expulsión por memoria.
+    """
+
+    def __init__(self, entries, budget_mb=None):
+        self.domains = {}
+        self._dependents = {}
+        for name, (domain, depends) in entries.items():
+            if domain not in CACHE_DOMAINS:
+                raise ValueError(f"Dominio de cache desconocido para '{name}': {domain}")
+            self.domains[name] = domain
+            self._dependents.setdefault(name, set())
+            for upstream in depends:
+                if upstream not in entries and upstream not in CACHE_DOMAINS:
+                    raise ValueError(f"Dependencia desconocida para '{name}': {upstream}")
+                self._dependents.setdefault(upstream, set()).add(name)
+        self.budget_mb = budget_mb
+        self._values = OrderedDict()
+        self._sizes = {}
+        self.hits = Counter()
+        self.misses = Counter()
+        self.evictions = Counter()
+
+    def _check(self, name):
+        if name not in self.domains:
+            raise ValueError(f"Entrada de cache no registrada: '{name}'")
+
+    def get(self, name):
+        """Retorna el valor cacheado o ``None``; cuenta el acierto o el fallo."""
+        self._check(name)
+        if name in self._values:
+            self._values.move_to_end(name)
+            self.hits[name] += 1
+            return self._values[name]
+        self.misses[name] += 1
+        return None
+
+    def peek(self, name):
+        """Como :meth:`get`, sin contar ni mover la entrada en el orden LRU."""
+        self._check(name)
+        return self._values.get(name)
+
+    def set(self, name, value):
+        """Guarda ``value`` y lo retorna; aplica el presupuesto de memoria."""
+        self._check(name)
+        self._values[name] = value
+        self._values.move_to_end(name)
+        if self.budget_mb is not None and _is_table(value):
+            self._sizes[name] = estimate_size(value)
+            self._evict(keep=name)
+        return value
+
+    def _evict(self, keep):
+        budget = self.budget_mb * 2 ** 20
+        for name in list(self._values):
+            if sum(self._sizes.values()) <= budget:
+                break
+            if name == keep or name not in self._sizes:
+                continue
+            del self._values[name]
+            self._sizes.pop(name, None)
+            self.evictions[name] += 1
+
+    def affected(self, names):
+        """Entradas alcanzadas por ``names`` (entradas o dominios), incluidas las dependientes."""
+        pending = list(names)
+        found = set()
+        while pending:
+            name = pending.pop()
+            if name in CACHE_DOMAINS:
+                pending += [entry for entry, domain in self.domains.items() if domain == name]
+            elif name not in found:
+                self._check(name)
+                found.add(name)
+            else:
+                continue
+            pending += self._dependents.get(name, ())
+        return found
+
+    def discard(self, *names):
+        """
+        Descarta entradas o dominios completos y sus dependientes.
+
+        Retorna el conjunto de entradas afectadas.
+        """
+        found = self.affected(names)
+        for name in found:
+            self._values.pop(name, None)
+            self._sizes.pop(name, None)
+        return found
+
+    def clear(self):
+        """Descarta todos los valores; conserva los contadores."""
+        self._values.clear()
+        self._sizes.clear()
+
+    @property
+    def size_mb(self):
+        """Memoria estimada de las entradas cacheadas, en MB."""
+        return sum(estimate_size(value) for value in self._values.values()) / 2 ** 20
+
+    def stats(self):
+        """``DataFrame`` con dominio, aciertos, fallos, expulsiones y tamaño por entrada."""
+        rows = []
+        for name, domain in self.domains.items():
+            cached = name in self._values
+            rows.append({
+                'entry': name,
+                'domain': domain,
+                'cached': cached,
+                'hits': self.hits[name],
+                'misses': self.misses[name],
+                'evictions': self.evictions[name],
+                'size_mb': estimate_size(self._values[name]) / 2 ** 20 if cached else 0.0,
+            })
+        return pd.DataFrame(rows, columns=['entry', 'domain', 'cached', 'hits', 'misses',
+                                           'evictions', 'size_mb'])
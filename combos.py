@@ -0,0 +1,259 @@
+"""
+Evaluación local de combinaciones de carga.
+
+``ComboEngine`` recibe la definición de las combinaciones (``RespCombo``) y el
+tipo de cada caso base, y calcula los resultados de las combinaciones a partir
+de los resultados de los casos base ya extraídos. Las combinaciones que solo
+suman casos lineales se resuelven juntas como un producto matriz de factores x
+matriz de resultados; Envelope, Absolute Add y SRSS se resuelven encima con las
+mismas reglas de signo que CSI. Lo que no se puede evaluar localmente
+(casos no lineales, Range Add, ...) se marca para pedirlo a CSI.
+"""
+
+import numpy as np
+import pandas as pd
+
+COMBO_TYPES = {
+    0: 'Linear Add',
+    1: 'Envelope',
+    2: 'Absolute Add',
+    3: 'SRSS',
+    4: 'Range Add',
+}
+
+# Tipos de combinación evaluables localmente.
+LOCAL_COMBO_TYPES = {0, 1, 2, 3}
+
+# eLoadCaseType cuyos resultados son superponibles: LinearStatic. ResponseSpectrum (4)
+# se pide a CSI hasta contrastar la regla de signos con salidas reales de CSI.
+LINEAR_CASE_TYPES = {1}
+
+
+def sort_like_csi(data, element_keys, case_column, outputs):
+    """
+    Ordena filas como CSI: elemento -> salida (en el orden de ``outputs``) -> resto.
+
+    Dentro de cada elemento y salida se conserva el orden original de las filas.
+    """
+    if data.empty:
+        return data.reset_index(drop=True)
+    if element_keys:
+        element = data.groupby(list(element_keys), sort=False).ngroup().to_numpy()
+    else:
+        element = np.zeros(len(data), dtype=int)
+    rank = {name: position for position, name in enumerate(outputs)}
+    output = data[case_column].map(rank).fillna(len(rank)).to_numpy()
+    order = np.lexsort((np.arange(len(data)), output, element))
+    return data.iloc[order].reset_index(drop=True)
+
+
+class ComboEngine:
+    """
+    Evalúa combinaciones de carga sobre resultados de casos base.
+
+    ``definitions`` es ``{combo: (tipo, [(caso_o_combo, factor), ...])}`` y
+    ``case_types`` es ``{caso: eLoadCaseType}``.
+    """
+
+    def __init__(self, definitions, case_types):
+        self.definitions = dict(definitions)
+        self.case_types = dict(case_types)
+        self._local = {}
+        self._flat = {}
+
+    def is_local(self, name):
+        """Indica si ``name`` (caso o combinación) se puede evaluar localmente."""
+        if name in self._local:
+            return self._local[name]
+        # Marca provisional para cortar ciclos.
+        self._local[name] = False
+        if name in self.definitions:
+            combo_type, items = self.definitions[name]
+            local = combo_type in LOCAL_COMBO_TYPES and bool(items) and all(
+                self.is_local(item) for item, _ in items
+            )
+        else:
+            local = self.case_types.get(name) in LINEAR_CASE_TYPES
+        self._local[name] = local
+        return local
+
+    def flatten(self, name):
+        """
+        Casos base de ``name`` con su factor acumulado, ``{caso: factor}``.
+
+        Los factores se multiplican a lo largo del árbol sin importar el tipo de
+        combinación. El resultado se memoriza por nombre, así que cada
+        combinación anidada se recorre una sola vez.
+        """
+        if name in self._flat:
+            return self._flat[name]
+        # Marca provisional para cortar ciclos.
+        self._flat[name] = {}
+        if name in self.definitions:
+            flat = {}
+            for item, scale in self.definitions[name][1]:
+                for case, factor in self.flatten(item).items():
+                    flat[case] = flat.get(case, 0.0) + scale * factor
+        else:
+            flat = {name: 1.0}
+        self._flat[name] = flat
+        return flat
+
+    def base_cases(self, combos):
+        """Casos base (en orden de aparición) necesarios para evaluar ``combos``."""
+        cases = {}
+        for combo in combos:
+            for case in self.flatten(combo):
+                cases.setdefault(case)
+        return list(cases)
+
+    def _reachable(self, combos):
+        """Combinaciones de ``combos`` y todas las que contienen, en orden de aparición."""
+        found = []
+
+        def visit(name):
+            if name in self.definitions and name not in found:
+                found.append(name)
+                for item, _ in self.definitions[name][1]:
+                    visit(item)
+
+        for combo in combos:
+            visit(combo)
+        return found
+
+    def linear_factors(self, combo):
+        """
+        Factores acumulados ``{caso: factor}`` si ``combo`` es solo Linear Add.
+
+        Retorna ``None`` si en el árbol aparece otro tipo de combinación.
+        """
+        if combo not in self.definitions:
+            return {combo: 1.0}
+        combo_type, items = self.definitions[combo]
+        if combo_type != 0:
+            return None
+        factors = {}
+        for item, scale in items:
+            sub = self.linear_factors(item)
+            if sub is None:
+                return None
+            for case, factor in sub.items():
+                factors[case] = factors.get(case, 0.0) + scale * factor
+        return factors
+
+    def factor_matrix(self, combos):
+        """``DataFrame`` combos x casos base con los factores de las combinaciones lineales."""
+        rows = {combo: self.linear_factors(combo) for combo in combos}
+        rows = {combo: factors for combo, factors in rows.items() if factors is not None}
+        cases = self.base_cases(list(rows))
+        matrix = pd.DataFrame(0.0, index=list(rows), columns=cases)
+        for combo, factors in rows.items():
+            for case, factor in factors.items():
+                matrix.loc[combo, case] = factor
+        return matrix
+
+    def evaluate(self, data, combos, keys, values, case_column='OutputCase', step_column='StepType'):
+        """
+        Calcula ``combos`` a partir de las filas de casos base en ``data``.
+
+        ``keys`` identifica cada posición (elemento y estación/punto) y ``values``
+        las columnas a combinar. Sin ``step_column`` los pares máximo/mínimo se
+        reconocen como filas repetidas de la misma posición (caso de ``PierForce``).
+        Un caso con filas ``Max`` y sin filas ``Min`` (espectro de respuesta) se
+        toma como la envolvente ``±Max``.
+        Retorna filas con la misma forma que ``data`` en el orden de CSI.
+        """
+        keys, values = list(keys), list(values)
+        position = data.groupby(keys, sort=False).ngroup().to_numpy()
+        first = np.unique(position, return_index=True)[1]
+        layout = data.iloc[first].reset_index(drop=True)
+        num_positions = len(layout)
+
+        cases = self.base_cases(combos)
+        case_code = data[case_column].map({case: k for k, case in enumerate(cases)})
+        valid = case_code.notna().to_numpy()
+        case_code = case_code.fillna(-1).to_numpy(dtype=int)
+
+        if step_column is not None:
+            step = data[step_column].astype(str).str.strip().to_numpy()
+        else:
+            group = pd.Series(position * (len(cases) + 1) + case_code)
+            occurrence = group.groupby(group).cumcount().to_numpy()
+            paired = group.map(group.value_counts()).to_numpy() == 2
+            step = np.where(paired, np.where(occurrence == 0, 'Max', 'Min'), '')
+
+        raw = data[values].to_numpy(dtype=float)
+        upper = np.zeros((len(cases), num_positions, len(values)))
+        lower = np.zeros_like(upper)
+        is_upper = valid & (step != 'Min')
+        is_lower = valid & (step != 'Max')
+        upper[case_code[is_upper], position[is_upper]] = raw[is_upper]
+        lower[case_code[is_lower], position[is_lower]] = raw[is_lower]
+        enveloped = np.zeros(len(cases), dtype=bool)
+        np.logical_or.at(enveloped, case_code[valid & (step == 'Max')], True)
+        # Casos que solo entregan la fila Max (espectro de respuesta): el mínimo es -Max.
+        has_min = np.zeros(len(cases), dtype=bool)
+        np.logical_or.at(has_min, case_code[valid & (step == 'Min')], True)
+        magnitude_only = enveloped & ~has_min
+        lower[magnitude_only] = -upper[magnitude_only]
+
+        memo = {case: (upper[k], lower[k], bool(enveloped[k])) for k, case in enumerate(cases)}
+
+        # Combinaciones lineales sobre casos simples: un solo producto matricial.
+        matrix = self.factor_matrix(self._reachable(combos))
+        simple = [case for case in matrix.columns if not memo[case][2]]
+        linear = matrix.loc[(matrix[[c for c in matrix.columns if c not in simple]] == 0).all(axis=1)]
+        if len(linear):
+            base = np.stack([memo[case][0] for case in linear.columns]).reshape(len(linear.columns), -1)
+            result = (linear.to_numpy() @ base).reshape(len(linear), num_positions, len(values))
+            for k, combo in enumerate(linear.index):
+                memo[combo] = (result[k], result[k], False)
+
+        blocks = []
+        for combo in combos:
+            high, low, is_envelope = self._evaluate(combo, memo)
+            steps = (('Max', high), ('Min', low)) if is_envelope else (('', high),)
+            for step_type, block in steps:
+                frame = layout.copy()
+                frame[case_column] = combo
+                if step_column is not None:
+                    frame[step_column] = step_type
+                frame[values] = block
+                blocks.append(frame)
+        if not blocks:
+            return data.iloc[:0].copy()
+        result = pd.concat(blocks, ignore_index=True)
+        for column in data.columns:
+            if column not in keys + values + [case_column, step_column] and \
+                    np.issubdtype(data[column].dtype, np.number):
+                result[column] = 0.0
+        return sort_like_csi(result[list(data.columns)], keys[:-1] or keys, case_column, combos)
+
+    def _evaluate(self, name, memo):
+        """Retorna ``(máximo, mínimo, es_envolvente)`` de un caso o combinación."""
+        if name in memo:
+            return memo[name]
+        combo_type, items = self.definitions[name]
+        parts = []
+        for item, factor in items:
+            high, low, is_envelope = self._evaluate(item, memo)
+            scaled = (factor * high, factor * low) if factor >= 0 else (factor * low, factor * high)
+            parts.append(scaled + (is_envelope,))
+
+        if combo_type == 0:
+            high = sum(part[0] for part in parts)
+            low = sum(part[1] for part in parts)
+            result = (high, low, any(part[2] for part in parts))
+        elif combo_type == 1:
+            high = np.max([part[0] for part in parts], axis=0)
+            low = np.min([part[1] for part in parts], axis=0)
+            result = (high, low, True)
+        else:
+            magnitude = [np.maximum(np.abs(part[0]), np.abs(part[1])) for part in parts]
+            if combo_type == 2:
+                high = np.sum(magnitude, axis=0)
+            else:
+                high = np.sqrt(np.sum(np.square(magnitude), axis=0))
+            result = (high, -high, True)
+        memo[name] = result
+        return result
@@ -198,6 +198,12 @@ class eItemType(_CSIEnum):
     SelectedObjects = 2
 
 
+class eDiaphragmOption(_CSIEnum):
+    Disconnect = 1
+    FromShellObject = 2
+    DefinedDiaphragm = 3
+
+
 class eAreaDesignOrientation(_CSIEnum):
     Wall = 1
     Floor = 2
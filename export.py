@@ -0,0 +1,149 @@
+"""
+Exportación de resultados por partes a Parquet o Arrow IPC.
+
+``ResultWriter`` escribe cada parte de resultados (un caso de un grupo de
+objetos) en un directorio particionado al estilo Hive,
+``OutputCase=<caso>/Story=<piso>/part-00000.parquet``, con el mismo esquema en
+todos los archivos, y deja un ``_manifest.json`` con filas y tiempos por parte.
+Requiere ``pyarrow``, que se importa solo al exportar.
+"""
+
+import json
+import os
+import shutil
+import time
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+EXPORT_FORMATS = {'parquet': '.parquet', 'arrow': '.arrow'}
+PARTITION_COLUMNS = ('OutputCase', 'Story')
+_MANIFEST = '_manifest.json'
+# Valor de partición de las filas sin piso (convención de Hive y pyarrow).
+_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("La exportación de resultados requiere pyarrow: pip install pyarrow") from exc
+    return pyarrow
+
+
+def _partition_value(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)) or str(value) == '':
+        return _NULL_PARTITION
+    return quote(str(value), safe='')
+
+
+class ResultWriter:
+    """
+    Escritor de resultados particionados por caso y piso.
+
+    ``columns`` es ``{columna: 'string' | 'float64'}`` y fija el esquema de
+    todos los archivos; las columnas de partición no se guardan en ellos. Con
+    ``overwrite=True`` se reemplaza una exportación anterior en ``path``.
+    """
+
+    def __init__(self, path, kind, columns, format='parquet', overwrite=False):
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato no válido: {format}. Use: {', '.join(EXPORT_FORMATS)}")
+        self.pa = _require_pyarrow()
+        self.path = os.path.abspath(path)
+        self.kind = kind
+        self.format = format
+        self.columns = {name: dtype for name, dtype in columns.items() if name not in PARTITION_COLUMNS}
+        types = {'string': self.pa.string(), 'float64': self.pa.float64()}
+        self.schema = self.pa.schema([(name, types[dtype]) for name, dtype in self.columns.items()])
+        self.batches = []
+        self._parts = {}
+        self._started = time.perf_counter()
+        self._prepare(overwrite)
+
+    def _prepare(self, overwrite):
+        if os.path.isdir(self.path) and os.listdir(self.path):
+            if not overwrite:
+                raise FileExistsError(f"El directorio '{self.path}' no está vacío; use overwrite=True")
+            if not os.path.isfile(os.path.join(self.path, _MANIFEST)):
+                raise FileExistsError(
+                    f"'{self.path}' no contiene una exportación anterior (falta {_MANIFEST})")
+            shutil.rmtree(self.path)
+        os.makedirs(self.path, exist_ok=True)
+
+    def _table(self, frame):
+        arrays = []
+        for name, dtype in self.columns.items():
+            if name not in frame.columns:
+                arrays.append(self.pa.nulls(len(frame), type=self.schema.field(name).type))
+            elif dtype == 'string':
+                values = frame[name].astype(object).to_numpy()
+                arrays.append(self.pa.array(np.where(pd.isna(values), None, values).astype(object),
+                                            type=self.pa.string()))
+            else:
+                arrays.append(self.pa.array(pd.to_numeric(frame[name], errors='coerce')
+                                            .to_numpy(dtype=float), type=self.pa.float64()))
+        return self.pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def _write_file(self, table, target):
+        if self.format == 'parquet':
+            self.pa.parquet.write_table(table, target)
+        else:
+            with self.pa.OSFile(target, 'wb') as sink:
+                with self.pa.ipc.new_file(sink, self.schema) as writer:
+                    writer.write_table(table)
+
+    def write(self, frame, case, chunk=0, extract_s=0.0):
+        """
+        Escribe las filas de un caso, un archivo por piso.
+
+        ``frame`` puede traer la columna ``Story``; si no, las filas van a la
+        partición sin piso. Retorna la cantidad de filas escritas.
+        """
+        started = time.perf_counter()
+        files = []
+        if len(frame):
+            stories = frame['Story'].astype(object) if 'Story' in frame.columns else \
+                pd.Series([None] * len(frame), index=frame.index, dtype=object)
+            for story, rows in frame.groupby(stories.fillna(''), sort=False).indices.items():
+                directory = os.path.join(f'OutputCase={_partition_value(case)}',
+                                         f'Story={_partition_value(story)}')
+                number = self._parts.get(directory, 0)
+                self._parts[directory] = number + 1
+                name = os.path.join(directory, f'part-{number:05d}{EXPORT_FORMATS[self.format]}')
+                os.makedirs(os.path.join(self.path, directory), exist_ok=True)
+                self._write_file(self._table(frame.iloc[rows]), os.path.join(self.path, name))
+                files.append({'Story': story or None, 'file': name.replace(os.sep, '/'),
+                              'rows': int(len(rows))})
+        self.batches.append({
+            'OutputCase': case,
+            'chunk': int(chunk),
+            'rows': int(len(frame)),
+            'extract_s': round(float(extract_s), 6),
+            'write_s': round(time.perf_counter() - started, 6),
+            'files': files,
+        })
+        return len(frame)
+
+    def close(self):
+        """Escribe ``_manifest.json`` y lo retorna como diccionario."""
+        manifest = {
+            'kind': self.kind,
+            'format': self.format,
+            'partitioning': list(PARTITION_COLUMNS),
+            'schema': dict(self.columns),
+            'rows': sum(batch['rows'] for batch in self.batches),
+            'files': sum(len(batch['files']) for batch in self.batches),
+            'extract_s': round(sum(batch['extract_s'] for batch in self.batches), 6),
+            'write_s': round(sum(batch['write_s'] for batch in self.batches), 6),
+            'elapsed_s': round(time.perf_counter() - self._started, 6),
+            'batches': self.batches,
+        }
+        target = os.path.join(self.path, _MANIFEST)
+        with open(target + '.tmp', 'w', encoding='utf-8') as stream:
+            json.dump(manifest, stream, indent=1)
+        os.replace(target + '.tmp', target)
+        return manifest
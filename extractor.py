@@ -1,8 +1,18 @@
+import os
+import time
+
 import pandas as pd
 import numpy as np
 
-from .constants import EtabsError, eFramePropType
+from .combos import ComboEngine, sort_like_csi
+from .export import ResultWriter
+from .constants import EtabsError, eFramePropType, eItemTypeElm
+from .grid_index import GridEngine, GridFrameIndex
+from .cache import CACHE_DOMAINS, CacheRegistry
 from .handler import Handler
+from .results import ResultEnvelope, ResultStore
+from .snapshot import ModelSnapshot, default_snapshot_dir
+from .tables import decode_table
 
 # funciones de normalización
 def format_list_args(names,defect_values=None,check_values=True):
@@ -13,7 +23,8 @@ def format_list_args(names,defect_values=None,check_values=True):
     if isinstance(names,(list,tuple)):
         names = [str(name).strip() for name in names if name]
     if (defect_values is not None) and check_values:
-        return [name for name in names if name in defect_values]
+        valid = set(defect_values)
+        return [name for name in names if name in valid]
     return names
         
 
@@ -24,51 +35,159 @@ class DataExtractor(Handler):
     Reúne propiedades cacheadas y métodos para extraer geometría, cargas y resultados.
     """
     
-    def __init__(self, *args, **kwargs):
+    # Propiedades que se persisten en disco cuando hay ``snapshot_dir``.
+    _SNAPSHOT_ENTRIES = ('tabular_data', 'frames_properties', 'area_geometry',
+                         'frame_sections_data', 'material_properties')
+
+    # Caches: nombre -> (dominio, dependencias). Una dependencia puede ser otra
+    # entrada o un dominio completo; al invalidarla se descarta también la entrada.
+    _CACHE_ENTRIES = {
+        'grid_system_names': ('geometry', ()),
+        'grid_lines': ('geometry', ()),
+        'story_table': ('geometry', ()),
+        'point_list': ('geometry', ()),
+        'points_coordinates': ('geometry', ()),
+        'points_restraints': ('geometry', ()),
+        'point_diaphragms': ('geometry', ()),
+        'frame_list': ('geometry', ()),
+        'frame_label_names': ('geometry', ()),
+        'frames_properties': ('geometry', ()),
+        'frames_connectivity': ('geometry', ('frames_properties', 'grid_lines')),
+        'beams_connectivity': ('geometry', ('frames_properties', 'grid_lines')),
+        'columns_connectivity': ('geometry', ('frames_properties', 'grid_lines')),
+        'grid_frame_index': ('geometry', ('frames_properties', 'grid_lines')),
+        'area_list': ('geometry', ()),
+        'area_geometry': ('geometry', ()),
+        'strips': ('geometry', ()),
+        'tabular_data': ('geometry', ('sections', 'loads')),
+
+        'material_list': ('sections', ()),
+        'material_properties': ('sections', ('material_list',)),
+        'frame_sections_data': ('sections', ()),
+        'wall_sections_data': ('sections', ()),
+        'slab_sections_data': ('sections', ()),
+        'deck_sections_data': ('sections', ()),
+
+        'cases': ('loads', ()),
+        'combos': ('loads', ()),
+        'cases_and_combos': ('loads', ('cases', 'combos')),
+        'load_case_table': ('loads', ('cases',)),
+        'combo_engine': ('loads', ('combos', 'load_case_table')),
+        'design_cases': ('loads', ('load_case_table',)),
+        'design_cases_and_combos': ('loads', ('design_cases', 'combos')),
+        'modal_cases': ('loads', ('load_case_table',)),
+        'seismic_cases': ('loads', ('load_case_table',)),
+        'seismic_combos': ('loads', ('seismic_cases', 'combo_engine')),
+
+        'points_reactions': ('results', ('geometry', 'sections', 'loads')),
+        'frames_forces': ('results', ('geometry', 'sections', 'loads')),
+        'area_forces': ('results', ('geometry', 'sections', 'loads')),
+        'modal_data': ('results', ('geometry', 'sections', 'loads')),
+    }
+
+    def __init__(self, *args, snapshot_dir=None, cache_budget_mb=None, **kwargs):
+        # snapshot_dir=True usa el directorio temporal por defecto
+        self.snapshot_dir = default_snapshot_dir() if snapshot_dir is True else snapshot_dir
+        self._snapshot = None
+        self._cache = CacheRegistry(self._CACHE_ENTRIES, budget_mb=cache_budget_mb)
         super().__init__(*args, **kwargs)
-        self._stories = None
-        self._grid_system_names = None
-        self._grid_lines = None
-        
-        self._tabular_data = None
-        
-        self._cases = None
-        self._combos = None
-        self._cases_and_combos = None
-        self._design_cases = None
-        self._design_cases_and_combos = None
-        self._seismic_cases = None
-        self._seismic_combos = None
-        self._seismic_cases_and_combos = None
-        
-        self._material_list = None
-        self._material_properties = None
-        
-        self._point_list = None
-        self._points_coordinates = None
-        self._points_restraints = None
-        self._points_reactions = None
-        
-        self._frame_sections_data = None
-        self._frame_list = None
-        self._frame_label_names = None
-        self._frames_properties = None
-        self._frames_forces = None
-        self._frames_connectivity = None
-        self._beams_connectivity = None
-        self._columns_connectivity = None
-        
-        self._wall_sections_data = None
-        self._slab_sections_data = None
-        self._deck_sections_data = None
-        self._area_geometry = None
-        self._area_forces = None
-        
-        self._strips = None
 
-        self._modal_cases = None
-        self._modal_data = None
-        
+    def _on_model_bound(self):
+        super()._on_model_bound()
+        # Un modelo recién enlazado no comparte caches con el anterior
+        self._cache.clear()
+        previous, self._snapshot = self._snapshot, None
+        if not self.snapshot_dir or not self.file_path or not os.path.isfile(self.file_path):
+            return
+        self._snapshot = ModelSnapshot(self.snapshot_dir, self.file_path, self._snapshot_state())
+        # Reconectar al mismo archivo sin guardarlo no borra las ediciones de la sesión
+        if previous is not None and previous.dirty and previous.file == self._snapshot.file \
+                and not previous.file_changed():
+            self._snapshot.mark_dirty()
+
+    def _snapshot_state(self):
+        """Estado del modelo vivo que se agrega a la clave del snapshot."""
+        model = self.model
+        return {
+            'locked': bool(model.GetModelIsLocked()),
+            'points': int(model.PointObj.Count()),
+            'frames': int(model.FrameObj.Count()),
+            'areas': int(model.AreaObj.Count()),
+        }
+
+    def _active_snapshot(self):
+        """
+        Retorna el snapshot si se puede usar o ``None``.
+
+        Con ediciones sin guardar no se usa; cuando el archivo cambia (se guardó)
+        se vuelve a tomar la clave y se empieza un snapshot nuevo.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.dirty:
+            if not snapshot.file_changed():
+                return None
+            snapshot.rekey(self._snapshot_state())
+        return snapshot
+
+    def _load_snapshot(self, name):
+        """Retorna la entrada ``name`` del snapshot en disco (y la cachea) o ``None``."""
+        snapshot = self._active_snapshot()
+        if snapshot is None:
+            return None
+        value = snapshot.load(name)
+        return None if value is None else self._cache.set(name, value)
+
+    def _save_snapshot(self, name, value):
+        """Cachea ``value`` y lo guarda en el snapshot en disco si está activo."""
+        if name in self._SNAPSHOT_ENTRIES:
+            snapshot = self._active_snapshot()
+            if snapshot is not None:
+                snapshot.save(name, value)
+        return self._cache.set(name, value)
+
+    def invalidate_cache(self, *names):
+        """
+        Descarta caches por dominio (``geometry``, ``sections``, ``loads``,
+        ``results``) o por entrada, junto con las que dependen de ellas.
+
+        Sin argumentos descarta todo. Retorna las entradas afectadas.
+
+        Invalidar algo fuera de ``results`` indica que el modelo cambió en la
+        sesión: el snapshot en disco queda marcado y no se usa hasta guardar.
+        """
+        names = names or CACHE_DOMAINS
+        found = self._cache.discard(*names)
+        if self._snapshot is not None and \
+                any(self._cache.domains[name] != 'results' for name in found):
+            self._snapshot.mark_dirty()
+        return found
+
+    def cache_stats(self):
+        """Aciertos, fallos, expulsiones y tamaño de cada cache (ver :class:`CacheRegistry`)."""
+        return self._cache.stats()
+
+    def run_analysis(self):
+        """
+        Ejecuta el análisis del modelo y descarta los resultados cacheados.
+
+        También olvida la selección de salida y de visualización recordada, igual
+        que ``apply_edited_table``: el análisis puede dejarla distinta en el modelo.
+        """
+        ret = self.model.Analyze.RunAnalysis()
+        self.invalidate_cache('results')
+        self._forget_selection_state()
+        return ret
+
+    def clear_snapshot(self):
+        """
+        Elimina el snapshot en disco del modelo conectado.
+
+        Las propiedades ya cargadas en memoria se mantienen; se vuelven a
+        guardar la próxima vez que se extraigan.
+        """
+        if self._snapshot is not None:
+            self._snapshot.clear()
+
     def set_envelopes_for_dysplay(self,set_envelopes=True):
         """
         Configura el formato de resultados mostrado en tablas.
@@ -77,7 +196,12 @@ class DataExtractor(Handler):
         """
         MultistepStatic=1 if set_envelopes else 2
         NonlinearStatic=1 if set_envelopes else 2
-        self.model.DatabaseTables.SetOutputOptionsForDisplay(False,False,0,0,True,0,0,True,0,0,MultistepStatic,NonlinearStatic,1,1,2)
+        options = (False,False,0,0,True,0,0,True,0,0,MultistepStatic,NonlinearStatic,1,1,2)
+        # Solo se reenvían si cambian respecto de la última llamada
+        if options == self._display_options:
+            return
+        self.model.DatabaseTables.SetOutputOptionsForDisplay(*options)
+        self._display_options = options
         
     @property
     def available_tables(self):
@@ -90,26 +214,39 @@ class DataExtractor(Handler):
         df = df[df['ImportType'].isin([2,3])].reset_index(drop=True)
         return df
     
-    def get_table(self, table_name, set_envelopes=True, runned=False, definition=False):
+    def get_table(self, table_name, set_envelopes=True, runned=False, definition=False,
+                  raw=False, dtypes=None, categorical=False, columns=None, group=None):
         """
         Extrae una tabla de visualización del modelo.
 
         Puede ejecutar el análisis automáticamente si la tabla no tiene resultados.
         Usar ``definition=True`` para tablas de definición (secciones, materiales, etc.)
         que no requieren configurar opciones de output ni disparar análisis.
+
+        Las columnas numéricas se devuelven como ``float64`` según el esquema de la
+        tabla en ``TABLE_SCHEMAS`` o, si no lo tiene, el nombre de la columna (ver
+        :func:`decode_table`); ``dtypes`` fija el tipo de columnas concretas,
+        ``categorical=True`` convierte textos repetidos en ``category`` y
+        ``raw=True`` deja todo como texto para reenviarlo con ``set_table``.
+
+        ``columns`` y ``group`` se envían a CSI (``FieldKeyList`` y ``GroupName``)
+        para que solo serialice esas columnas y los objetos de ese grupo; los
+        campos que la tabla no tenga se ignoran.
         """
         if not definition:
             self.set_envelopes_for_dysplay(set_envelopes=set_envelopes)
         data = self.model.DatabaseTables.GetTableForDisplayArray(
-            table_name, FieldKeyList='', GroupName=''
+            table_name, FieldKeyList=list(columns) if columns else '', GroupName=group or ''
         )
 
         flag = data[-1]
         if flag == 1:
             if definition or runned:
                 return pd.DataFrame()
-            self.model.Analyze.RunAnalysis()
-            return self.get_table(table_name, set_envelopes, runned=True)
+            self.run_analysis()
+            return self.get_table(table_name, set_envelopes, runned=True, raw=raw,
+                                  dtypes=dtypes, categorical=categorical,
+                                  columns=columns, group=group)
 
         elif flag == -96:
             raise ValueError(f"La tabla '{table_name}' no existe en el modelo ETABS.")
@@ -117,37 +254,106 @@ class DataExtractor(Handler):
         elif flag != 0:
             raise EtabsError(f"Error al extraer la tabla, flag devuelto de {flag}")
 
-        columns = data[2]
-        num_records = data[3]
-        table_data = [i if i else '' for i in data[4]]
+        return decode_table(data[2], data[3], data[4], raw=raw, dtypes=dtypes,
+                            categorical=categorical, table_name=table_name)
 
-        # Convertir a DataFrame
-        df = pd.DataFrame(table_data)
-        df = df.values.reshape(num_records, len(columns))
-        table = pd.DataFrame(df, columns=columns)
-        return table
+    # Prefijo de los grupos por piso que crea ``iter_table(by='story')``.
+    _STORY_GROUP_PREFIX = 'csi_py Story '
+
+    @property
+    def group_list(self):
+        """Grupos definidos en el modelo, sin el grupo ``All``."""
+        return [name for name in self.model.GroupDef.GetNameList()[1] if name != 'All']
+
+    def _story_group(self, story):
+        """
+        Crea el grupo temporal con los puntos, frames y áreas de ``story``.
+
+        El grupo se elimina antes de asignarlo, para no arrastrar objetos de una
+        asignación anterior, y :meth:`iter_table` lo elimina al terminar.
+        """
+        group = self._STORY_GROUP_PREFIX + story
+        group_def = self.model.GroupDef
+        group_def.Delete(group)
+        group_def.SetGroup(group)
+        for objects in (self.model.PointObj, self.model.FrameObj, self.model.AreaObj):
+            for name in objects.GetNameListOnStory(story)[1]:
+                objects.SetGroupAssign(name, group)
+        return group
+
+    def iter_table(self, table_name, by='case', names=None, **kwargs):
+        """
+        Extrae ``table_name`` por partes y entrega ``(nombre, DataFrame)`` por cada una.
+
+        ``by='case'`` pide la tabla caso por caso (o combinación), ``by='group'``
+        grupo por grupo y ``by='story'`` piso por piso, mediante grupos por piso
+        creados en el modelo. ``names`` limita las partes y ``kwargs`` se pasan a
+        :meth:`get_table`. Solo una parte se extrae y decodifica a la vez; las
+        partes vacías se omiten.
+        """
+        if by not in ('case', 'group', 'story'):
+            raise ValueError(f"by debe ser 'case', 'group' o 'story', no '{by}'")
+        return self._iter_table(table_name, by, names, kwargs)
+
+    def _iter_table(self, table_name, by, names, kwargs):
+        if by == 'case':
+            names = format_list_args(names, self.cases_and_combos)
+            previous = dict(self._display_selection)
+            try:
+                for name in names:
+                    self.select_cases_and_combos([name])
+                    chunk = self.get_table(table_name, **kwargs)
+                    if not chunk.empty:
+                        yield name, chunk
+            finally:
+                # Restituye la selección de visualización previa si se conocía
+                if previous['cases'] is not None and previous['combos'] is not None:
+                    self.select_cases_and_combos(list(previous['cases']) + list(previous['combos']))
+        else:
+            if by == 'group':
+                for name in format_list_args(names, self.group_list):
+                    chunk = self.get_table(table_name, group=name, **kwargs)
+                    if not chunk.empty:
+                        yield name, chunk
+                return
+            created = []
+            try:
+                for name in format_list_args(names, self.stories):
+                    group = self._story_group(name)
+                    created.append(group)
+                    chunk = self.get_table(table_name, group=group, **kwargs)
+                    if not chunk.empty:
+                        yield name, chunk
+            finally:
+                # Los grupos por piso son temporales: no quedan en el modelo
+                for group in created:
+                    self.model.GroupDef.Delete(group)
 
-    
     @property
     def tabular_data(self):
         """
         Retorna todas las tablas editables como un diccionario de DataFrames.
 
-        El resultado se cachea tras la primera carga.
+        El resultado se cachea tras la primera carga. Las columnas quedan como
+        texto para poder reenviarlas con ``export_tabular_data``.
         """
-        if self._tabular_data is None:
+        table_data = self._cache.get('tabular_data')
+        if table_data is None:
+            table_data = self._load_snapshot('tabular_data')
+        if table_data is None:
             table_data = {}
             for table in self.editable_tables['Table']:
-                data = self.get_table(table,set_envelopes=False)
+                data = self.get_table(table,set_envelopes=False,raw=True)
                 table_data[table] = data
-            self._tabular_data = table_data
-        return self._tabular_data
+            self._save_snapshot('tabular_data', table_data)
+        return table_data
 
     # ==================== GRIDS ====================
 
     @property
     def grid_system_names(self):
-        if self._grid_system_names is None:
+        system_names = self._cache.get('grid_system_names')
+        if system_names is None:
             names = []
             try:
                 table = self.get_table('Grid Definitions - Grid Lines', set_envelopes=False)
@@ -164,8 +370,9 @@ class DataExtractor(Handler):
                         if column in table.columns:
                             names = table[column].tolist()
                             break
-            self._grid_system_names = list(set(str(name).strip() for name in names if str(name).strip()))
-        return self._grid_system_names
+            system_names = self._cache.set('grid_system_names', list(
+                set(str(name).strip() for name in names if str(name).strip())))
+        return system_names
 
     def get_grid_system(self, grid_system_name=None):
         """
@@ -192,10 +399,11 @@ class DataExtractor(Handler):
         """
         Retorna todas las líneas de grid de todos los sistemas del modelo.
         """
-        if self._grid_lines is None:
+        lines = self._cache.get('grid_lines')
+        if lines is None:
             try:
                 raw = self.get_table('Grid Definitions - Grid Lines', set_envelopes=False).copy()
-                self._grid_lines = self._normalize_grid_lines_table(raw)
+                lines = self._normalize_grid_lines_table(raw)
             except Exception:
                 frames = [
                     self._grid_system_to_lines(self._get_grid_system_api(grid_name))
@@ -203,14 +411,15 @@ class DataExtractor(Handler):
                 ]
                 frames = [frame for frame in frames if not frame.empty]
                 if frames:
-                    self._grid_lines = pd.concat(frames, ignore_index=True)
+                    lines = pd.concat(frames, ignore_index=True)
                 else:
-                    self._grid_lines = pd.DataFrame(columns=[
+                    lines = pd.DataFrame(columns=[
                         'GridSystem', 'Axis', 'LineType', 'GridLineID', 'Ordinate',
                         'Visible', 'BubbleLoc', 'X1', 'Y1', 'X2', 'Y2',
                         'Xo', 'Yo', 'RZ', 'GridSysType'
                     ])
-        return self._grid_lines
+            self._cache.set('grid_lines', lines)
+        return lines
 
     def _normalize_grid_lines_table(self, table):
         columns = {column.lower().strip(): column for column in table.columns}
@@ -355,75 +564,100 @@ class DataExtractor(Handler):
         
     @property
     def cases(self):
-        if self._cases is None:
+        load_cases = self._cache.get('cases')
+        if load_cases is None:
             load_cases = self.model.LoadCases.GetNameList()[1]
             load_cases = [i for i in load_cases if i[0] != '~']
-            self._cases =  list(load_cases)
-        return self._cases
+            load_cases = self._cache.set('cases', list(load_cases))
+        return load_cases
     
     
     @property
     def combos(self):
-        if self._combos is None:
+        load_combos = self._cache.get('combos')
+        if load_combos is None:
             load_combos = self.model.RespCombo.GetNameList()[1]
             load_combos = [i for i in load_combos if i[0] != '~']
-            self._combos = list(load_combos)
-        return self._combos
+            load_combos = self._cache.set('combos', list(load_combos))
+        return load_combos
     
     @property
     def cases_and_combos(self):
-        if self._cases_and_combos is None:
-            self._cases_and_combos = self.cases+self.combos
-        return self._cases_and_combos
+        names = self._cache.get('cases_and_combos')
+        if names is None:
+            names = self._cache.set('cases_and_combos', self.cases+self.combos)
+        return names
         
+    # eLoadCaseType / eLoadPatternType usados para clasificar casos
+    _MODAL_CASE_TYPE = 3
+    _SEISMIC_DESIGN_TYPE = 5
+    _NON_DESIGN_TYPE = 8
+
+    @property
+    def load_case_table(self):
+        """
+        Metadatos de los casos de carga, leídos en una sola pasada.
+
+        Columnas: ``Case``, ``CaseType``, ``SubType``, ``DesignType``,
+        ``IsModal``, ``IsSeismic`` e ``IsDesign``.
+        """
+        table = self._cache.get('load_case_table')
+        if table is None:
+            rows = [self.model.LoadCases.GetTypeOAPI_1(case)[:3] for case in self.cases]
+            table = pd.DataFrame(rows, columns=['CaseType', 'SubType', 'DesignType'], dtype=int)
+            table.insert(0, 'Case', list(self.cases))
+            table['IsModal'] = table['CaseType'] == self._MODAL_CASE_TYPE
+            table['IsSeismic'] = table['DesignType'] == self._SEISMIC_DESIGN_TYPE
+            table['IsDesign'] = table['DesignType'] != self._NON_DESIGN_TYPE
+            table = self._cache.set('load_case_table', table)
+        return table
+
+    def _cases_where(self, flag):
+        table = self.load_case_table
+        return table.loc[table[flag], 'Case'].tolist()
+
     def get_combo_cases(self, combo_name):
         """
         Retorna los casos base contenidos en una combinación de carga.
 
-        Si la combinación incluye otras combinaciones, el desglose es recursivo.
+        Si la combinación incluye otras combinaciones, el desglose es recursivo
+        (ver :meth:`ComboEngine.flatten`).
         """
-        # Obtener la información inicial de la combinación
-        combo_info = self.model.RespCombo.GetCaseList(combo_name)
-        combo_types = combo_info[1]
-        combo_cases = combo_info[2]
-        unique_cases = []
-        
-        for c_type,combo_case in zip(combo_types,combo_cases):
-            if c_type == 0:
-                unique_cases += [combo_case,]
-            elif c_type == 1:
-                unique_cases += self.get_combo_cases(combo_case)
-                
-        return list(set(unique_cases))
+        engine = self.get_combo_engine()
+        if combo_name not in engine.definitions:
+            return []
+        return list(engine.flatten(combo_name))
     
     @property
     def design_cases(self):
-        if self._design_cases is None:
-            self._design_cases = [case for case in self.cases if
-                self.model.LoadCases.GetTypeOAPI_1(case)[2] != 8]
-        return self._design_cases
+        design_cases = self._cache.get('design_cases')
+        if design_cases is None:
+            design_cases = self._cache.set('design_cases', self._cases_where('IsDesign'))
+        return design_cases
     
     @property
     def design_cases_and_combos(self):
-        if self._design_cases_and_combos is None:
-            self._design_cases_and_combos = self.design_cases+self.combos
-            
-        return self._design_cases_and_combos
+        names = self._cache.get('design_cases_and_combos')
+        if names is None:
+            names = self._cache.set('design_cases_and_combos', self.design_cases+self.combos)
+        return names
     
     @property
     def seismic_cases(self):
-        load_cases = self.cases
-        seismic_cases = [case for case in load_cases if
-         self.model.LoadCases.GetTypeOAPI_1(case)[2]==5]
+        seismic_cases = self._cache.get('seismic_cases')
+        if seismic_cases is None:
+            seismic_cases = self._cache.set('seismic_cases', self._cases_where('IsSeismic'))
         return seismic_cases
     
     @property
     def seismic_combos(self):
-        load_combos = self.combos
-        seismic_cases = self.seismic_cases
-        seismic_combos = [cb for cb in load_combos if
-         set(self.get_combo_cases(cb)).\
-             intersection(seismic_cases)]
+        seismic_combos = self._cache.get('seismic_combos')
+        if seismic_combos is None:
+            engine = self.get_combo_engine()
+            seismic_cases = set(self.seismic_cases)
+            seismic_combos = self._cache.set('seismic_combos', [
+                cb for cb in self.combos if seismic_cases.intersection(engine.flatten(cb))
+            ])
         return seismic_combos
     
     @property
@@ -432,11 +666,13 @@ class DataExtractor(Handler):
     
     @property
     def gravity_cases(self):
-        return list(set(self.cases).difference(self.seismic_cases))
+        seismic_cases = set(self.seismic_cases)
+        return [case for case in self.cases if case not in seismic_cases]
     
     @property
     def gravity_combos(self):
-        return list(set(self.combos).difference(self.seismic_combos))
+        seismic_combos = set(self.seismic_combos)
+        return [combo for combo in self.combos if combo not in seismic_combos]
     
     @property
     def gravity_cases_and_combos(self):
@@ -446,10 +682,68 @@ class DataExtractor(Handler):
         """
         Selecciona casos y combinaciones para la salida tabular activa.
 
-        Esta selección afecta las tablas de resultados extraídas después.
+        Esta selección afecta las tablas de resultados extraídas después. Los
+        casos y las combinaciones se envían por separado y solo si cambian.
         """
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        cases, combos, unknown = self._split_cases_and_combos(cases_and_combos)
+        # Los nombres desconocidos se envían en ambas listas
+        selection = {'cases': cases + unknown, 'combos': combos + unknown}
+        setters = {
+            'cases': self.model.DatabaseTables.SetLoadCasesSelectedForDisplay,
+            'combos': self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay,
+        }
+        for kind, names in selection.items():
+            if self._display_selection[kind] != set(names):
+                setters[kind](names)
+                self._display_selection[kind] = set(names)
+
+    def _split_cases_and_combos(self, names):
+        """Separa ``names`` en casos, combinaciones y nombres desconocidos."""
+        cases, combos = set(self.cases), set(self.combos)
+        split = ([], [], [])
+        for name in names:
+            if name in cases:
+                split[0].append(name)
+            elif name in combos:
+                split[1].append(name)
+            else:
+                split[2].append(name)
+        return split
+
+    def select_output_cases(self, cases_and_combos):
+        """
+        Selecciona casos y combinaciones para ``Results`` (``Results.Setup``).
+
+        Recuerda la selección vigente y solo envía las diferencias: cada nombre se
+        marca con ``SetCaseSelectedForOutput`` o ``SetComboSelectedForOutput``
+        según su tipo. Si la selección es desconocida o el cambio es grande, parte
+        de ``DeselectAllCasesAndCombosForOutput``.
+        """
+        setup = self.model.Results.Setup
+        setters = {'case': setup.SetCaseSelectedForOutput,
+                   'combo': setup.SetComboSelectedForOutput}
+        cases, combos, unknown = self._split_cases_and_combos(cases_and_combos)
+        target = dict.fromkeys(unknown)
+        target.update(dict.fromkeys(cases, 'case'))
+        target.update(dict.fromkeys(combos, 'combo'))
+
+        current = self._output_selection
+        if current is not None:
+            removed = [name for name in current if name not in target]
+            added = [name for name in target if name not in current]
+        if current is None or len(removed) + len(added) > len(target) + 1:
+            setup.DeselectAllCasesAndCombosForOutput()
+            current = self._output_selection = {}
+            removed, added = [], list(target)
+
+        for name in removed:
+            setters[current.pop(name)](name, False)
+        for name in added:
+            kinds = [target[name]] if target[name] else ['case', 'combo']
+            for kind in kinds:
+                if setters[kind](name) == 0:
+                    current[name] = kind
+                    break
         
     def get_response_spectrum(self,spectrum_names='all'):
         """
@@ -462,7 +756,7 @@ class DataExtractor(Handler):
         cols = ['Name','Period','Value','DampRatio']
         data = pd.DataFrame(columns=cols)
         for table in tables:
-            df = self.get_table(table)
+            df = self.get_table(table, columns=cols)
             data = pd.concat([data,df[cols]],ignore_index=True)
             
         if spectrum_names=='all':
@@ -478,10 +772,11 @@ class DataExtractor(Handler):
     @property
     def material_list(self):
         """Obtiene lista de todos los materiales"""
-        if self._material_list is None:
-            self._material_list = list(self.model.PropMaterial.
-                                       GetNameList()[1])
-        return self._material_list
+        materials = self._cache.get('material_list')
+        if materials is None:
+            materials = self._cache.set('material_list', list(self.model.PropMaterial.
+                                                               GetNameList()[1]))
+        return materials
     
     def get_material_properties(self, material_name):
         """
@@ -516,19 +811,23 @@ class DataExtractor(Handler):
     
     @property
     def material_properties(self):
-        if self._material_properties is None:
-            self._material_properties = \
-                self.get_material_properties(self.material_list)
-        return self._material_properties
+        data = self._cache.get('material_properties')
+        if data is None:
+            data = self._load_snapshot('material_properties')
+        if data is None:
+            data = self._save_snapshot('material_properties',
+                                       self.get_material_properties(self.material_list))
+        return data
     
     
     # ==================== POINTS ====================
     @property
     def point_list(self):
         """Obtiene lista de todos los puntos"""
-        if self._point_list is None:
-            self._point_list = list(self.model.PointObj.GetNameList()[1])
-        return self._point_list
+        points = self._cache.get('point_list')
+        if points is None:
+            points = self._cache.set('point_list', list(self.model.PointObj.GetNameList()[1]))
+        return points
     
     @property
     def base_points(self):
@@ -542,10 +841,12 @@ class DataExtractor(Handler):
         Retorna un DataFrame con columnas ``Point``, ``X``, ``Y`` y ``Z``.
         """
         point_names = format_list_args(point_names,self.point_list)
+        cached = self._cache.peek('points_coordinates')
+        if cached is not None:
+            coords = cached.set_index('Point')
+            return coords.loc[point_names, ['X','Y','Z']].reset_index()
         data = {'Point':[],'X':[],'Y':[],'Z':[]}
         for point in point_names:
-            if point not in self.point_list:
-                continue
             data['Point'].append(point)
             coords = self.model.PointObj.GetCoordCartesian(point)
             data['X'].append(coords[0])
@@ -555,12 +856,27 @@ class DataExtractor(Handler):
     
     @property
     def points_coordinates(self):
-        """Dataframe de coordenadas"""
-        if self._points_coordinates is None:
-            self._points_coordinates = \
-                self.get_point_coordinates(self.point_list)
-                
-        return self._points_coordinates
+        """
+        Dataframe de coordenadas.
+
+        Usa ``PointObj.GetAllPoints``; si no está disponible, consulta punto por punto.
+        """
+        data = self._cache.get('points_coordinates')
+        if data is None:
+            try:
+                data = self._get_points_coordinates_bulk()
+            except (EtabsError, AttributeError, TypeError):
+                # Flag de error o GetAllPoints no disponible en el backend
+                data = self.get_point_coordinates(self.point_list)
+            self._cache.set('points_coordinates', data)
+        return data
+
+    def _get_points_coordinates_bulk(self):
+        res = self.model.PointObj.GetAllPoints()
+        if res[-1] != 0:
+            raise EtabsError(f"Error al extraer puntos, flag devuelto de {res[-1]}")
+        return pd.DataFrame({'Point': list(res[1]), 'X': res[2],
+                             'Y': res[3], 'Z': res[4]})
 
     def get_point_restraints(self,point_names):
         """
@@ -568,11 +884,12 @@ class DataExtractor(Handler):
 
         El resultado indica grados de libertad traslacionales y rotacionales restringidos.
         """
-        point_names = format_list_args(point_names,self.point_list)
+        known = set(self.point_list)
+        point_names = format_list_args(point_names,self.point_list,check_values=False)
         data = {'Point':[],'UX':[],'UY':[],'UZ':[],
                 'RX':[],'RY':[],'RZ':[]}
         for point in point_names:
-            if point not in self.point_list:
+            if point not in known:
                 raise ValueError(f'El punto {point} no existe en el modelo')
             restraints = self.model.PointObj.GetRestraint(point)[0]
             data['Point'].append(point)
@@ -585,59 +902,188 @@ class DataExtractor(Handler):
             
         return pd.DataFrame(data)
     
+    _RESTRAINT_DOFS = ['UX', 'UY', 'UZ', 'RX', 'RY', 'RZ']
+
+    def _get_points_restraints_bulk(self):
+        table = self.get_table('Joint Assignments - Restraints', definition=True,
+                               columns=['UniqueName'] + self._RESTRAINT_DOFS)
+        missing = [c for c in ['UniqueName'] + self._RESTRAINT_DOFS if c not in table.columns]
+        if missing:
+            raise KeyError(f"Columnas no encontradas en 'Joint Assignments - Restraints': {missing}")
+        restrained = table.set_index('UniqueName')[self._RESTRAINT_DOFS].apply(
+            lambda col: col.astype(str).str.strip().str.lower().isin(('yes', 'true', '1')))
+        data = pd.DataFrame({'Point': self.point_list}).join(restrained, on='Point')
+        data[self._RESTRAINT_DOFS] = data[self._RESTRAINT_DOFS].fillna(False).astype(bool)
+        return data
+
     @property
     def points_restraints(self):
-        if self._points_restraints is None:
-            data = self.get_point_restraints(self.point_list)
+        """
+        Puntos con los seis grados de libertad restringidos.
+
+        Usa la tabla ``Joint Assignments - Restraints``; si no está disponible,
+        consulta punto por punto.
+        """
+        restraints = self._cache.get('points_restraints')
+        if restraints is None:
+            try:
+                data = self._get_points_restraints_bulk()
+            except (EtabsError, KeyError, ValueError):
+                # Tabla o columnas no disponibles (get_table lanza ValueError si no existe)
+                data = self.get_point_restraints(self.point_list)
             mask = data['UX'] & data['UY'] & data['UZ'] & \
                 data['RX'] & data['RY'] & data['RZ']
-            self._points_restraints = data[mask].reset_index(drop=True)
-        
-        return self._points_restraints
-    
+            restraints = self._cache.set('points_restraints', data[mask].reset_index(drop=True))
+        return restraints
 
-    def get_point_reactions(self,point_names=None,cases_and_combos=None):
-        """Extrae reacciones nodales para los puntos solicitados."""
-        point_names = format_list_args(point_names,self.point_list)
+    @property
+    def point_diaphragms(self):
+        """
+        Puntos con diafragma asignado: columnas ``Point`` y ``Diaphragm``.
+
+        Usa la tabla ``Joint Assignments - Diaphragms``; si no está disponible,
+        consulta punto por punto.
+        """
+        diaphragms = self._cache.get('point_diaphragms')
+        if diaphragms is None:
+            try:
+                table = self.get_table('Joint Assignments - Diaphragms', definition=True,
+                                       columns=['UniqueName', 'Diaphragm'])
+                data = pd.DataFrame({'Point': table['UniqueName'].astype(str).to_numpy(),
+                                     'Diaphragm': table['Diaphragm'].astype(str).to_numpy()})
+            except (EtabsError, KeyError, ValueError):
+                # Tabla o columnas no disponibles (get_table lanza ValueError si no existe)
+                names = {point: self.model.PointObj.GetDiaphragm(point)[1]
+                         for point in self.point_list}
+                data = pd.DataFrame({'Point': list(names), 'Diaphragm': list(names.values())})
+            mask = ~data['Diaphragm'].str.strip().isin(('', 'None', 'nan'))
+            diaphragms = self._cache.set('point_diaphragms', data[mask].reset_index(drop=True))
+        return diaphragms
+    
+
+    # Grupo temporal con el que se piden resultados de una lista de objetos.
+    _RESULTS_GROUP = 'csi_py Results'
+
+    def _result_groups(self, names, all_names, objects, chunk_size=None):
+        """
+        Entrega los grupos con los que se piden los resultados de ``names``.
+
+        Si se piden todos los objetos y no hay ``chunk_size`` basta el grupo
+        ``All``. Si no, los objetos se asignan a un grupo temporal en partes de
+        ``chunk_size`` (una sola parte si es ``None``), que se entrega una vez
+        por parte y se elimina al terminar.
+        """
+        if not len(names):
+            return
+        if chunk_size is None and len(names) == len(all_names) and set(names) == set(all_names):
+            yield 'All'
+            return
+        size = int(chunk_size or len(names))
+        if size < 1:
+            raise ValueError("chunk_size debe ser mayor que cero")
+        group_def = self.model.GroupDef
+        group = self._RESULTS_GROUP
+        try:
+            for start in range(0, len(names), size):
+                group_def.Delete(group)
+                group_def.SetGroup(group)
+                for name in names[start:start + size]:
+                    objects.SetGroupAssign(name, group)
+                yield group
+        finally:
+            group_def.Delete(group)
+
+    def _collect_results(self, func, store, names, all_names, objects, chunk_size=None):
+        """Llena ``store`` con ``func`` sobre cada grupo de :meth:`_result_groups` (``GroupElm``)."""
+        for group in self._result_groups(names, all_names, objects, chunk_size):
+            store.append(self._group_results(func, group))
+        return store
+
+    def _group_results(self, func, group):
+        """Llama ``func`` sobre ``group``; si falla con el modelo sin analizar, analiza y reintenta."""
+        res = func(group, eItemTypeElm.GroupElm)
+        if res[-1] != 0 and not self.model.GetModelIsLocked():
+            self.run_analysis()
+            res = func(group, eItemTypeElm.GroupElm)
+        return res
+
+    _POINT_REACTION_FIELDS = {
+        'Point': 1, 'OutputCase': 3, 'StepType': 4, 'StepNumber': 5,
+        'F1': 6, 'F2': 7, 'F3': 8, 'M1': 9, 'M2': 10, 'M3': 11,
+    }
+
+    def get_point_reactions(self,point_names=None,cases_and_combos=None,as_store=False,
+                            chunk_size=None):
+        """
+        Extrae reacciones nodales para los puntos solicitados.
+
+        Los resultados se piden por grupo, como en :meth:`get_frame_forces`: sin
+        ``point_names`` basta una llamada sobre ``All``, que solo entrega los
+        puntos con apoyo.
+
+        Con ``as_store=True`` retorna el :class:`ResultStore` sin construir el ``DataFrame``.
+        """
+        point_list = self.point_list
+        point_names = format_list_args(point_names,point_list)
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
-        data = {
-            'Point': [], 'OutputCase': [], 'StepType': [], 'StepNumber': [],
-            'F1': [], 'F2': [], 'F3': [], 'M1': [], 'M2': [], 'M3': []
-        }
+        store = ResultStore(self._POINT_REACTION_FIELDS,
+                            categorical=('Point', 'OutputCase', 'StepType'),
+                            index=('Point', 'OutputCase', 'StepNumber'))
         
-        self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
-        for case in cases_and_combos:
-            self.model.Results.Setup.SetCaseSelectedForOutput(case)
-            self.model.Results.Setup.SetComboSelectedForOutput(case)
+        self.select_output_cases(cases_and_combos)
             
-        for point in point_names:
-            res = self.model.Results.JointReact(point, 0)
-            if res[0] == 0:
-                continue
-
-            data['Point'].extend(res[1])
-            data['OutputCase'].extend(res[3])
-            data['StepType'].extend(res[4])
-            data['StepNumber'].extend(res[5])
-            data['F1'].extend(res[6])
-            data['F2'].extend(res[7])
-            data['F3'].extend(res[8])
-            data['M1'].extend(res[9])
-            data['M2'].extend(res[10])
-            data['M3'].extend(res[11])
+        self._collect_results(self.model.Results.JointReact, store, point_names, point_list,
+                              self.model.PointObj, chunk_size)
                 
-        return pd.DataFrame(data)
+        return store if as_store else store.to_dataframe()
+
+    _POINT_DISPLACEMENT_FIELDS = {
+        'Point': 1, 'OutputCase': 3, 'StepType': 4, 'StepNumber': 5,
+        'U1': 6, 'U2': 7, 'U3': 8, 'R1': 9, 'R2': 10, 'R3': 11,
+    }
+
+    def _joint_points(self, point_names, diaphragm_only=False):
+        """Puntos pedidos, opcionalmente solo los asignados a un diafragma."""
+        points = format_list_args(point_names, self.point_list)
+        if diaphragm_only:
+            assigned = set(self.point_diaphragms['Point'])
+            points = [point for point in points if point in assigned]
+        return points
+
+    def get_point_displacements(self, point_names=None, cases_and_combos=None, as_store=False,
+                                chunk_size=None, diaphragm_only=False):
+        """
+        Extrae desplazamientos nodales con ``Results.JointDispl`` pedidos por grupo.
+
+        Sin ``point_names`` se hace una sola llamada sobre el grupo ``All``.
+        ``diaphragm_only=True`` deja solo los puntos de :attr:`point_diaphragms`.
+
+        Con ``as_store=True`` retorna el :class:`ResultStore` sin construir el ``DataFrame``.
+        """
+        points = self._joint_points(point_names, diaphragm_only)
+        cases_and_combos = format_list_args(cases_and_combos,
+                            self.design_cases_and_combos)
+        store = ResultStore(self._POINT_DISPLACEMENT_FIELDS,
+                            categorical=('Point', 'OutputCase', 'StepType'),
+                            index=('Point', 'OutputCase', 'StepNumber'))
+
+        self.select_output_cases(cases_and_combos)
+
+        self._collect_results(self.model.Results.JointDispl, store, points, self.point_list,
+                              self.model.PointObj, chunk_size)
+
+        return store if as_store else store.to_dataframe()
     
     @property
     def points_reactions(self):
-        if self._points_reactions is None:
+        reactions = self._cache.get('points_reactions')
+        if reactions is None:
             data = self.get_point_reactions()
             cols = ['F1','F2','F3','M1','M2','M3']
             mask = (data[cols].fillna(0) != 0).any(axis=1) 
-            self._points_reactions = data[mask].reset_index(drop=True)
-
-        return self._points_reactions
+            reactions = self._cache.set('points_reactions', data[mask].reset_index(drop=True))
+        return reactions
     
     def get_selected_points(self):
         selection = self.model.SelectObj.GetSelected()
@@ -717,7 +1163,8 @@ class DataExtractor(Handler):
         dims_by_section = {}
         for table_name in shape_tables:
             try:
-                tbl = self.get_table(table_name, definition=True)
+                tbl = self.get_table(table_name, definition=True,
+                                     columns=['Name'] + self._SHAPE_DIM_COLS)
             except (ValueError, EtabsError):
                 continue
             if tbl.empty or 'Name' not in tbl.columns:
@@ -748,10 +1195,13 @@ class DataExtractor(Handler):
     
     @property
     def frame_sections_data(self):
-        if self._frame_sections_data is None:
-            self._frame_sections_data = \
-                self.get_frame_section_dimensions(get_properties=True)
-        return self._frame_sections_data
+        data = self._cache.get('frame_sections_data')
+        if data is None:
+            data = self._load_snapshot('frame_sections_data')
+        if data is None:
+            data = self._save_snapshot('frame_sections_data',
+                                       self.get_frame_section_dimensions(get_properties=True))
+        return data
 
     _SECTION_PROP_COLS = ['Area', 'As2', 'As3', 'Torsion', 'I22', 'I33',
                           'S22', 'S33', 'Z22', 'Z33', 'R22', 'R33']
@@ -838,9 +1288,10 @@ class DataExtractor(Handler):
     @property
     def frame_list(self):
         """Obtiene lista de todos los frames"""
-        if self._frame_list is None:
-            self._frame_list =  list(self.model.FrameObj.GetNameList()[1])
-        return self._frame_list
+        frames = self._cache.get('frame_list')
+        if frames is None:
+            frames = self._cache.set('frame_list', list(self.model.FrameObj.GetNameList()[1]))
+        return frames
     
     def get_frame_section(self, frame_name):
         """Obtiene la sección asignada a un frame."""
@@ -879,70 +1330,102 @@ class DataExtractor(Handler):
 
     @property
     def frame_label_names(self):
-        if self._frame_label_names is None:
+        names = self._cache.get('frame_label_names')
+        if names is None:
             data = self.model.FrameObj.GetLabelNameList()
             df = {'Frame':data[1],'Label':data[2],'Story':data[3]}
-            self._frame_label_names = pd.DataFrame(df)
-        return self._frame_label_names
+            names = self._cache.set('frame_label_names', pd.DataFrame(df))
+        return names
     
     @property
     def frames_properties(self):
-        if self._frames_properties is None:
-            data = pd.DataFrame({'Frame':self.frame_list})
-            label_data = self.frame_label_names
-            data = data.merge(label_data, on='Frame')
-            data['Section'] = data['Frame'].map(self.get_frame_section)
-            data[['point_i', 'point_j']] = data['Frame'].map(
-                self.get_frame_points).apply(pd.Series)
-            data[['coord_i', 'coord_j']] = data['Frame'].map(
-                self.get_frame_coordinates).apply(pd.Series)
-            data['length'] = data['Frame'].map(self.get_frame_length)
-            self._frames_properties = data
-        
-        return self._frames_properties
+        """
+        Tabla de frames con label, piso, sección, puntos, coordenadas y longitud.
+
+        Usa ``FrameObj.GetAllFrames`` (dos llamadas en total); si no está
+        disponible, consulta frame por frame.
+        """
+        data = self._cache.get('frames_properties')
+        if data is None:
+            data = self._load_snapshot('frames_properties')
+        if data is None:
+            try:
+                data = self._get_frames_properties_bulk()
+            except (EtabsError, AttributeError, TypeError):
+                # Flag de error o GetAllFrames no disponible en el backend
+                data = self._get_frames_properties_per_frame()
+            self._save_snapshot('frames_properties', data)
+        return data
+
+    def _get_frames_properties_bulk(self):
+        res = self.model.FrameObj.GetAllFrames()
+        if res[-1] != 0:
+            raise EtabsError(f"Error al extraer frames, flag devuelto de {res[-1]}")
+        coord_i = np.column_stack([res[6], res[7], res[8]]).astype(float)
+        coord_j = np.column_stack([res[9], res[10], res[11]]).astype(float)
+        data = pd.DataFrame({
+            'Frame': list(res[1]),
+            'Section': list(res[2]),
+            'point_i': list(res[4]),
+            'point_j': list(res[5]),
+            'coord_i': list(map(tuple, coord_i.tolist())),
+            'coord_j': list(map(tuple, coord_j.tolist())),
+            'length': np.sqrt(((coord_j - coord_i) ** 2).sum(axis=1)),
+        })
+        data = data.merge(self.frame_label_names, on='Frame')
+        return data[['Frame', 'Label', 'Story', 'Section', 'point_i',
+                     'point_j', 'coord_i', 'coord_j', 'length']]
+
+    def _get_frames_properties_per_frame(self):
+        data = pd.DataFrame({'Frame':self.frame_list})
+        label_data = self.frame_label_names
+        data = data.merge(label_data, on='Frame')
+        data['Section'] = data['Frame'].map(self.get_frame_section)
+        data[['point_i', 'point_j']] = data['Frame'].map(
+            self.get_frame_points).apply(pd.Series)
+        data[['coord_i', 'coord_j']] = data['Frame'].map(
+            self.get_frame_coordinates).apply(pd.Series)
+        data['length'] = data['Frame'].map(self.get_frame_length)
+        return data
         
     
-    def get_frame_forces(self,frame_name=None,cases_and_combos=None):
-        """Extrae fuerzas internas de frames usando la API nativa."""
-        frames = format_list_args(frame_name,self.frame_list)
+    _FRAME_FORCE_FIELDS = {
+        'Frame': 1, 'Station': 2, 'OutputCase': 5, 'StepType': 6, 'StepNumber': 7,
+        'P': 8, 'V2': 9, 'V3': 10, 'T': 11, 'M2': 12, 'M3': 13,
+    }
+
+    def get_frame_forces(self,frame_name=None,cases_and_combos=None,as_store=False,
+                         chunk_size=None):
+        """
+        Extrae fuerzas internas de frames usando la API nativa.
+
+        Los resultados se piden por grupo: el grupo ``All`` si se piden todos los
+        frames, o un grupo temporal con los frames pedidos. ``chunk_size`` limita
+        la cantidad de frames por llamada para acotar la memoria.
+
+        Con ``as_store=True`` retorna el :class:`ResultStore` sin construir el ``DataFrame``.
+        """
+        frame_list = self.frame_list
+        frames = format_list_args(frame_name,frame_list)
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
-        data = {
-            'Frame': [], 'Station': [], 'OutputCase': [], 
-            'StepType': [], 'StepNumber': [],
-            'P': [], 'V2': [], 'V3': [], 'T': [], 'M2': [], 'M3': []
-        }
+        store = ResultStore(self._FRAME_FORCE_FIELDS,
+                            categorical=('Frame', 'OutputCase', 'StepType'),
+                            index=('Frame', 'OutputCase', 'Station'))
         
-        self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
-        for case in cases_and_combos:
-            self.model.Results.Setup.SetCaseSelectedForOutput(case)
-            self.model.Results.Setup.SetComboSelectedForOutput(case)
+        self.select_output_cases(cases_and_combos)
             
-        frame_force = self.model.Results.FrameForce
-        for frame in frames:
-            res = frame_force(frame, 0)
-            if res[-1] == 1:
-                self.model.Analyze.RunAnalysis()
-
-            data['Frame'].extend(res[1])
-            data['Station'].extend(res[2])
-            data['OutputCase'].extend(res[5])
-            data['StepType'].extend(res[6])
-            data['StepNumber'].extend(res[7])
-            data['P'].extend(res[8])
-            data['V2'].extend(res[9])
-            data['V3'].extend(res[10])
-            data['T'].extend(res[11])
-            data['M2'].extend(res[12])
-            data['M3'].extend(res[13])
+        self._collect_results(self.model.Results.FrameForce, store, frames, frame_list,
+                              self.model.FrameObj, chunk_size)
                 
-        return pd.DataFrame(data)
+        return store if as_store else store.to_dataframe()
     
     @property
     def frames_forces(self):
-        if self._frames_forces is None:
-            self._frames_forces = self.get_frame_forces()
-        return self._frames_forces
+        forces = self._cache.get('frames_forces')
+        if forces is None:
+            forces = self._cache.set('frames_forces', self.get_frame_forces())
+        return forces
     
     @property
     def label_beams(self):
@@ -956,96 +1439,6 @@ class DataExtractor(Handler):
         return (label_names[label_names['Label'].str.startswith('C')]
                  ['Label'].unique())
 
-    def _point_on_grid_line(self, point_xy, grid_line, tol=1e-6):
-        x, y = point_xy
-        axis = str(grid_line.get('Axis', '')).strip().upper()
-        ordinate = grid_line.get('Ordinate', np.nan)
-
-        if axis == 'X' and pd.notna(ordinate):
-            return abs(float(x) - float(ordinate)) <= tol
-        if axis == 'Y' and pd.notna(ordinate):
-            return abs(float(y) - float(ordinate)) <= tol
-
-        x1 = grid_line.get('X1', np.nan)
-        y1 = grid_line.get('Y1', np.nan)
-        x2 = grid_line.get('X2', np.nan)
-        y2 = grid_line.get('Y2', np.nan)
-        if pd.notna(x1) and pd.notna(y1) and pd.notna(x2) and pd.notna(y2):
-            dx = float(x2) - float(x1)
-            dy = float(y2) - float(y1)
-            seg_len_sq = dx * dx + dy * dy
-            if seg_len_sq <= tol ** 2:
-                return np.hypot(float(x) - float(x1), float(y) - float(y1)) <= tol
-
-            px = float(x) - float(x1)
-            py = float(y) - float(y1)
-            cross = abs(px * dy - py * dx)
-            if cross / np.sqrt(seg_len_sq) > tol:
-                return False
-
-            dot = px * dx + py * dy
-            if dot < -tol or dot > seg_len_sq + tol:
-                return False
-            return True
-
-        return False
-
-    def _resolve_beam_grid(self, point_i_xy, point_j_xy, tol=1e-6):
-        for _, grid_line in self.grid_lines.iterrows():
-            if self._point_on_grid_line(point_i_xy, grid_line, tol=tol) and \
-               self._point_on_grid_line(point_j_xy, grid_line, tol=tol):
-                return str(grid_line['GridLineID']).strip()
-        return ''
-
-    def _append_grid_id(self, current_value, grid_id):
-        grid_id = str(grid_id).strip()
-        if not grid_id:
-            return current_value
-        if not current_value:
-            return grid_id
-        existing = [item for item in current_value.split('|') if item]
-        if grid_id in existing:
-            return current_value
-        return f"{current_value}|{grid_id}"
-
-    def _split_grid_ids(self, value):
-        if value in (None, ''):
-            return []
-        return [item.strip() for item in str(value).split('|') if item.strip()]
-
-    def _grid_value_matches(self, value, targets):
-        if not targets:
-            return False
-        values = set(self._split_grid_ids(value))
-        return bool(values.intersection(targets))
-
-    def _resolve_column_grids(self, point_i_xy, point_j_xy, tol=1e-6):
-        grid_x = ''
-        grid_y = ''
-        general = ''
-
-        for _, grid_line in self.grid_lines.iterrows():
-            if not (
-                self._point_on_grid_line(point_i_xy, grid_line, tol=tol)
-                and self._point_on_grid_line(point_j_xy, grid_line, tol=tol)
-            ):
-                continue
-
-            grid_id = grid_line.get('GridLineID', '')
-            axis = str(grid_line.get('Axis', '')).strip().upper()
-            if axis == 'X':
-                grid_x = self._append_grid_id(grid_x, grid_id)
-            elif axis == 'Y':
-                grid_y = self._append_grid_id(grid_y, grid_id)
-            else:
-                general = self._append_grid_id(general, grid_id)
-
-        return {
-            'GridX': grid_x,
-            'GridY': grid_y,
-            'General': general,
-        }
-
     def get_beams_connectivity(self, beams_label=None, tol=1e-6):
         """
         Retorna conectividad de vigas y su pertenencia a grid como ``DataFrame``.
@@ -1080,13 +1473,8 @@ class DataExtractor(Handler):
         })
         beams = beams.merge(points_j, on='point_j', how='left')
 
-        beams['Grid'] = beams.apply(
-            lambda row: self._resolve_beam_grid(
-                (row['Xi'], row['Yi']),
-                (row['Xj'], row['Yj']),
-                tol=tol,
-            ),
-            axis=1,
+        beams['Grid'] = GridEngine(self.grid_lines).beam_grids(
+            beams['Xi'], beams['Yi'], beams['Xj'], beams['Yj'], tol=tol
         )
 
         beams = beams.rename(columns={'Frame': 'Beam'})
@@ -1094,9 +1482,10 @@ class DataExtractor(Handler):
 
     @property
     def beams_connectivity(self):
-        if self._beams_connectivity is None:
-            self._beams_connectivity = self.get_beams_connectivity()
-        return self._beams_connectivity
+        data = self._cache.get('beams_connectivity')
+        if data is None:
+            data = self._cache.set('beams_connectivity', self.get_beams_connectivity())
+        return data
 
     def get_beam_connectivity(self, beams_label=None, tol=1e-6):
         """Alias de :meth:`get_beams_connectivity`."""
@@ -1153,9 +1542,28 @@ class DataExtractor(Handler):
 
     @property
     def frames_connectivity(self):
-        if self._frames_connectivity is None:
-            self._frames_connectivity = self.get_frames_connectivity()
-        return self._frames_connectivity
+        data = self._cache.get('frames_connectivity')
+        if data is None:
+            data = self._cache.set('frames_connectivity', self.get_frames_connectivity())
+        return data
+
+    def _get_grid_frame_index(self, tol=1e-6):
+        """Retorna el índice grid -> frames, construyéndolo una vez por tolerancia."""
+        index = self._cache.get('grid_frame_index')
+        if index is None or index.tol != tol:
+            index = self._cache.set('grid_frame_index',
+                                    GridFrameIndex(self.get_frames_connectivity(tol=tol), tol=tol))
+        return index
+
+    def _frame_type_targets(self, frame_type):
+        frame_type_norm = None if frame_type is None else str(frame_type).strip().lower()
+        if frame_type_norm in (None, ''):
+            return None
+        if frame_type_norm in ('beam', 'beams'):
+            return {'Beam'}
+        if frame_type_norm in ('column', 'columns'):
+            return {'Column'}
+        raise ValueError("frame_type debe ser None, 'beam' o 'column'.")
 
     def filter_frames_by_grid(self, grid=None, grid_x=None, grid_y=None,
                               story=None, frame_type=None, labels=None, tol=1e-6):
@@ -1165,40 +1573,37 @@ class DataExtractor(Handler):
         - ``grid`` busca frames asociados a un solo eje.
         - ``grid_x`` + ``grid_y`` busca intersección de dos ejes.
         - ``story`` filtra por piso.
+
+        Las consultas usan un índice cacheado construido desde la conectividad.
         """
-        frames = self.get_frames_connectivity(frame_type=frame_type, labels=labels, tol=tol).copy()
-        if frames.empty:
-            return frames
+        frame_types = self._frame_type_targets(frame_type)
+        index = self._get_grid_frame_index(tol)
 
         grid_targets = set(format_list_args(grid, check_values=False) or [])
         grid_x_targets = set(format_list_args(grid_x, check_values=False) or [])
         grid_y_targets = set(format_list_args(grid_y, check_values=False) or [])
         story_targets = set(format_list_args(story, check_values=False) or [])
-
-        if story_targets:
-            frames = frames[frames['Story'].isin(story_targets)]
-
-        if grid_targets:
-            mask_grid = frames.apply(
-                lambda row: (
-                    self._grid_value_matches(row.get('Grid', ''), grid_targets)
-                    or self._grid_value_matches(row.get('GridX', ''), grid_targets)
-                    or self._grid_value_matches(row.get('GridY', ''), grid_targets)
-                    or self._grid_value_matches(row.get('General', ''), grid_targets)
-                ),
-                axis=1,
-            )
-            frames = frames[mask_grid]
-
-        if grid_x_targets:
-            mask_grid_x = frames['GridX'].apply(lambda value: self._grid_value_matches(value, grid_x_targets))
-            frames = frames[mask_grid_x]
-
-        if grid_y_targets:
-            mask_grid_y = frames['GridY'].apply(lambda value: self._grid_value_matches(value, grid_y_targets))
-            frames = frames[mask_grid_y]
-
-        return frames.reset_index(drop=True)
+        labels = format_list_args(labels, check_values=False)
+
+        rows = None
+        for targets, axes in (
+            (grid_targets, GridFrameIndex.AXES),
+            (grid_x_targets, ('GridX',)),
+            (grid_y_targets, ('GridY',)),
+        ):
+            if targets:
+                found = index.rows(targets, axes, story_targets, frame_types)
+                rows = found if rows is None else rows & found
+
+        if rows is None:
+            frames = index.connectivity
+            mask = pd.Series(True, index=frames.index)
+            if story_targets:
+                mask &= frames['Story'].isin(story_targets)
+            if frame_types:
+                mask &= frames['FrameType'].isin(frame_types)
+            rows = np.flatnonzero(mask.to_numpy())
+        return index.select(rows, labels=labels)
 
     def get_frames_on_grid(self, grid, story=None, frame_type=None, labels=None, tol=1e-6):
         """Alias expresivo para filtrar frames en un solo eje."""
@@ -1217,37 +1622,20 @@ class DataExtractor(Handler):
 
         El orden de ``grid_x`` y ``grid_y`` es intercambiable.
         """
-        frames = self.get_frames_connectivity(
-            frame_type=frame_type,
-            labels=labels,
-            tol=tol,
-        ).copy()
-        if frames.empty:
-            return frames
+        frame_types = self._frame_type_targets(frame_type)
+        index = self._get_grid_frame_index(tol)
 
         story_targets = set(format_list_args(story, check_values=False) or [])
-        if story_targets:
-            frames = frames[frames['Story'].isin(story_targets)]
-
         grid_a_targets = set(format_list_args(grid_x, check_values=False) or [])
         grid_b_targets = set(format_list_args(grid_y, check_values=False) or [])
+        labels = format_list_args(labels, check_values=False)
 
-        mask_direct = frames.apply(
-            lambda row: (
-                self._grid_value_matches(row.get('GridX', ''), grid_a_targets)
-                and self._grid_value_matches(row.get('GridY', ''), grid_b_targets)
-            ),
-            axis=1,
-        )
-        mask_swapped = frames.apply(
-            lambda row: (
-                self._grid_value_matches(row.get('GridX', ''), grid_b_targets)
-                and self._grid_value_matches(row.get('GridY', ''), grid_a_targets)
-            ),
-            axis=1,
-        )
+        def rows(targets, axis):
+            return index.rows(targets, (axis,), story_targets, frame_types)
 
-        return frames[mask_direct | mask_swapped].reset_index(drop=True)
+        direct = rows(grid_a_targets, 'GridX') & rows(grid_b_targets, 'GridY')
+        swapped = rows(grid_b_targets, 'GridX') & rows(grid_a_targets, 'GridY')
+        return index.select(direct | swapped, labels=labels)
 
     def get_frame_connectivity(self, frame_type=None, labels=None, tol=1e-6):
         """Alias de :meth:`get_frames_connectivity`."""
@@ -1293,15 +1681,11 @@ class DataExtractor(Handler):
         })
         columns = columns.merge(points_j, on='point_j', how='left')
 
-        grid_data = columns.apply(
-            lambda row: self._resolve_column_grids(
-                (row['Xi'], row['Yi']),
-                (row['Xj'], row['Yj']),
-                tol=tol,
-            ),
-            axis=1,
-        ).apply(pd.Series)
-        columns = pd.concat([columns, grid_data], axis=1)
+        grid_data = GridEngine(self.grid_lines).column_grids(
+            columns['Xi'], columns['Yi'], columns['Xj'], columns['Yj'], tol=tol
+        )
+        for key, values in grid_data.items():
+            columns[key] = values
 
         columns = columns.rename(columns={'Frame': 'Column'})
         return columns[[
@@ -1311,9 +1695,10 @@ class DataExtractor(Handler):
 
     @property
     def columns_connectivity(self):
-        if self._columns_connectivity is None:
-            self._columns_connectivity = self.get_columns_connectivity()
-        return self._columns_connectivity
+        data = self._cache.get('columns_connectivity')
+        if data is None:
+            data = self._cache.set('columns_connectivity', self.get_columns_connectivity())
+        return data
 
     def get_column_connectivity(self, columns_label=None, tol=1e-6):
         """Alias de :meth:`get_columns_connectivity`."""
@@ -1328,8 +1713,7 @@ class DataExtractor(Handler):
         beams_label = format_list_args(beams_label,self.label_beams)
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
         data_forces = self.get_table('Element Forces - Beams')
         data_forces = data_forces[data_forces['Beam'].isin(beams_label)]
         data_forces['_index'] = data_forces.index
@@ -1465,14 +1849,18 @@ class DataExtractor(Handler):
             df[num_cols] = df[num_cols].fillna(0)
             locals()[name] = df
             
-        self._wall_sections_data = walls
-        self._slab_sections_data = slabs
-        self._deck_sections_data = decks
+        self._cache.set('wall_sections_data', walls)
+        self._cache.set('slab_sections_data', slabs)
+        self._cache.set('deck_sections_data', decks)
 
     
     @property
     def area_list(self):
-        return list(self.model.PropArea.GetNameList()[1])
+        """Obtiene lista de todas las áreas"""
+        areas = self._cache.get('area_list')
+        if areas is None:
+            areas = self._cache.set('area_list', list(self.model.AreaObj.GetNameList()[1]))
+        return areas
     
     def get_area_section(self, area_name):
         """Obtiene la sección asignada a un área."""
@@ -1490,20 +1878,25 @@ class DataExtractor(Handler):
 
         Incluye tipo, sección y coordenadas de sus puntos de contorno.
         """
-        if self._area_geometry is None:
+        geometry = self._cache.get('area_geometry')
+        if geometry is None:
+            geometry = self._load_snapshot('area_geometry')
+        if geometry is None:
             data = self.model.AreaObj.GetAllAreas()
-            area_name = data[1] 
-            orientation = data[2] 
-            points = [data[5][i+1:j+1] for i,j in 
-                      zip((-1,)+data[4],data[4])] 
-            p_x = [data[6][i+1:j+1] for i,j in 
-                   zip((-1,)+data[4],data[4])] 
-            p_y = [data[7][i+1:j+1] for i,j in 
-                   zip((-1,)+data[4],data[4])] 
-            p_z = [data[8][i+1:j+1] for i,j in 
-                   zip((-1,)+data[4],data[4])] 
-            type_map = {1:'wall',2:'floor',3:'ramp',4:'null',5:'other'} 
-            area_type = [type_map[o] for o in orientation] 
+            area_name = data[1]
+            orientation = data[2]
+            if data[0] == 0 or len(data[4]) == 0:
+                # Sin áreas: np.split entregaría una parte vacía sin nombre
+                return self._save_snapshot('area_geometry', pd.DataFrame(
+                    columns=['name', 'area_type', 'section', 'points_x', 'points_y', 'points_z']))
+            # PointDelimiter guarda el último índice de cada área
+            bounds = np.asarray(data[4], dtype=int)[:-1] + 1
+            points = np.split(data[5], bounds)
+            p_x = np.split(data[6], bounds)
+            p_y = np.split(data[7], bounds)
+            p_z = np.split(data[8], bounds)
+            type_map = {1:'wall',2:'floor',3:'ramp',4:'null',5:'other'}
+            area_type = [type_map[int(o)] for o in orientation]
             data =  pd.DataFrame({ 
                 'name' : area_name, 
                 'area_type' : area_type, 
@@ -1514,72 +1907,86 @@ class DataExtractor(Handler):
             data['section'] = data['name'].map(self.get_area_section)
             data = data[['name','area_type','section','points_x',
                          'points_y','points_z']]
-            self._area_geometry = data
-        return self._area_geometry              
+            geometry = self._save_snapshot('area_geometry', data)
+        return geometry              
     
-    def get_area_forces(self, area_name=None, cases_and_combos=None):
-        """Extrae fuerzas internas en áreas."""
-        areas = format_list_args(area_name,self.area_list)
+    _AREA_FORCE_FIELDS = {
+        'AreaName': 1, 'PointName': 3, 'OutputCase': 4, 'StepType': 5, 'StepNumber': 6,
+        'F11': 7, 'F22': 8, 'F12': 9, 'M11': 14, 'M22': 15, 'M12': 16,
+        'V13': 20, 'V23': 21,
+    }
+
+    # Fuerzas de ``Results.AreaForceShell`` que se pueden pedir con ``columns``.
+    _AREA_FORCE_VALUES = ('F11', 'F22', 'F12', 'M11', 'M22', 'M12', 'V13', 'V23')
+
+    def get_area_forces(self, area_name=None, cases_and_combos=None, as_store=False,
+                        chunk_size=None, columns=None, envelope=False):
+        """
+        Extrae fuerzas internas en áreas.
+
+        Los resultados se piden por grupo, como en :meth:`get_frame_forces`, y
+        ``chunk_size`` limita la cantidad de áreas por llamada. ``columns`` deja
+        solo las fuerzas indicadas (``F11`` ... ``V23``). Con ``envelope=True``
+        cada respuesta se reduce al llegar a máximo y mínimo por área y caso
+        (filas ``StepType`` ``Max`` y ``Min``), sin guardar las filas por punto.
+
+        Con ``as_store=True`` retorna el :class:`ResultStore` (o el
+        :class:`ResultEnvelope`) sin construir el ``DataFrame``.
+        """
+        area_list = self.area_list
+        areas = format_list_args(area_name,area_list)
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
-    
-        data = {
-            'AreaName': [], 'PointName': [], 'OutputCase': [], 
-            'StepType': [], 'StepNumber': [],
-            'F11': [], 'F22': [], 'F12': [],
-            'M11': [], 'M22': [], 'M12': [],
-            'V13': [], 'V23': []
-        }
-        
-        self.model.View.RefreshView(0, False)
+        requested = list(self._AREA_FORCE_VALUES) if columns is None else \
+            format_list_args(columns, check_values=False)
+        unknown = [column for column in requested if column not in self._AREA_FORCE_VALUES]
+        if unknown or not requested:
+            raise ValueError(f"columns debe elegir entre {list(self._AREA_FORCE_VALUES)}, "
+                             f"no {unknown or requested}")
+        values = [column for column in self._AREA_FORCE_VALUES if column in requested]
+
+        if envelope:
+            store = ResultEnvelope(self._AREA_FORCE_FIELDS,
+                                   keys=('AreaName', 'OutputCase'), values=values)
+        else:
+            fields = {column: position for column, position in self._AREA_FORCE_FIELDS.items()
+                      if column not in self._AREA_FORCE_VALUES or column in values}
+            store = ResultStore(fields,
+                                categorical=('AreaName', 'PointName', 'OutputCase', 'StepType'),
+                                index=('AreaName', 'OutputCase', 'PointName'))
         
-        self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
+        self.select_output_cases(cases_and_combos)
         self.set_envelopes_for_dysplay(set_envelopes=False)
-        for case in cases_and_combos:
-            self.model.Results.Setup.SetCaseSelectedForOutput(case)
-            self.model.Results.Setup.SetComboSelectedForOutput(case)
             
-        area_force = self.model.Results.AreaForceShell
-        for area in areas:
-            res = area_force(area, 0)
-            if res[-1] == 0:
-                self.model.Analyze.RunAnalysis()
-                res = area_force(area, 0)
-
-            data['AreaName'].extend(res[1])
-            data['PointName'].extend(res[3])
-            data['OutputCase'].extend(res[4])
-            data['StepType'].extend(res[5])
-            data['StepNumber'].extend(res[6])
-            data['F11'].extend(res[7])
-            data['F22'].extend(res[8])
-            data['F12'].extend(res[9])
-            data['M11'].extend(res[14])
-            data['M22'].extend(res[15])
-            data['M12'].extend(res[16])
-            data['V13'].extend(res[20])
-            data['V23'].extend(res[21])
+        self._collect_results(self.model.Results.AreaForceShell, store, areas, area_list,
+                              self.model.AreaObj, chunk_size)
                 
-        return pd.DataFrame(data)
+        return store if as_store else store.to_dataframe()
     
     @property
     def area_forces(self):
-        if self._area_forces is None:
-            self._area_forces = self.get_area_forces(cases_and_combos=self.design_cases)
-        return self._area_forces
+        forces = self._cache.get('area_forces')
+        if forces is None:
+            forces = self._cache.set('area_forces',
+                                     self.get_area_forces(cases_and_combos=self.design_cases))
+        return forces
     
     # ==================== SLABS/FLOORS ====================
     @property
     def slab_sections_data(self):
-        if self._slab_sections_data is None:
+        data = self._cache.get('slab_sections_data')
+        if data is None:
             self.map_area_properties()
-        return self._slab_sections_data
+            data = self._cache.peek('slab_sections_data')
+        return data
     
     @property
     def deck_sections_data(self):
-        if self._deck_sections_data is None:
+        data = self._cache.get('deck_sections_data')
+        if data is None:
             self.map_area_properties()
-        return self._deck_sections_data
+            data = self._cache.peek('deck_sections_data')
+        return data
     
     @property
     def floor_sections_list(self):
@@ -1598,19 +2005,19 @@ class DataExtractor(Handler):
     
     @property
     def strip_list(self):
-        if self._strips is not None:
-            return self._strips
+        strips = self._cache.get('strips')
+        if strips is not None:
+            return strips
         d_case = self.design_cases[0]
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay([d_case])
-        strip_forces = self.get_table('Strip Forces')
+        self.select_cases_and_combos([d_case])
+        strip_forces = self.get_table('Strip Forces', columns=['Strip', 'StripObject'])
         if strip_forces.empty:
             return []
         if 'StripObject' in strip_forces.columns:
             strips = strip_forces['StripObject'].unique()
         else:
             strips = strip_forces['Strip'].unique()
-        self._strips = list(strips)
-        return self._strips
+        return self._cache.set('strips', list(strips))
     
     def extract_strip_loads(self,strips=None,cases_and_combos=None):
         """
@@ -1621,8 +2028,7 @@ class DataExtractor(Handler):
         if cases_and_combos ==None:
             cases_and_combos = self.design_cases_and_combos
             
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
         
         df = self.get_table('Strip Forces')
         
@@ -1655,9 +2061,11 @@ class DataExtractor(Handler):
     # ==================== WALLS ====================
     @property
     def wall_sections_data(self):
-        if self._wall_sections_data is None:
+        data = self._cache.get('wall_sections_data')
+        if data is None:
             self.map_area_properties()
-        return self._wall_sections_data
+            data = self._cache.peek('wall_sections_data')
+        return data
     
     @property
     def wall_list(self):
@@ -1675,12 +2083,14 @@ class DataExtractor(Handler):
 
         Permite filtrar por pier, nivel y casos o combinaciones de salida.
         """
+        df = self._get_pier_forces_raw(cases_and_combos)
+        return self._filter_pier_forces(self._label_pier_envelopes(df), piers, stories)
+
+    def _get_pier_forces_raw(self, cases_and_combos=None):
+        """Filas de ``Results.PierForce`` sin etiquetar máximos y mínimos."""
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
-        self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
-        for case in cases_and_combos:
-            self.model.Results.Setup.SetCaseSelectedForOutput(case)
-            self.model.Results.Setup.SetComboSelectedForOutput(case)
+        self.select_output_cases(cases_and_combos)
         
         df = {'Pier':[],'Story':[],'OutputCase':[],
                 'Location':[],'P':[],'V2':[],'V3':[],
@@ -1689,7 +2099,7 @@ class DataExtractor(Handler):
         data = self.model.Results.PierForce()
  
         if data[-1] == 1:
-            self.model.Analyze.RunAnalysis()
+            self.run_analysis()
 
         df['Pier'].extend(data[2])
         df['Story'].extend(data[1])
@@ -1702,9 +2112,11 @@ class DataExtractor(Handler):
         df['M2'].extend(data[9])
         df['M3'].extend(data[10])
    
-        df = pd.DataFrame(df)
+        return pd.DataFrame(df)
 
+    def _label_pier_envelopes(self, df):
         # Etiquetar max/min en casos sísmicos (2 filas por grupo)
+        df = df.copy()
         group_cols = ['Pier', 'Story', 'OutputCase', 'Location']
         suffixes = df.groupby(group_cols).cumcount()
         mask_dup = df.duplicated(subset=group_cols, keep=False)
@@ -1712,7 +2124,9 @@ class DataExtractor(Handler):
         df.loc[mask_dup, 'OutputCase'] = (
             df.loc[mask_dup, 'OutputCase'] + suffixes[mask_dup].map(suffix_map)
         )
+        return df
 
+    def _filter_pier_forces(self, df, piers=None, stories=None):
         if piers is not None:
             piers = format_list_args(piers,self.pier_list)
             df = df[df['Pier'].isin(piers)]
@@ -1735,32 +2149,34 @@ class DataExtractor(Handler):
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
         # Trabajo con tablas
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay(cases_and_combos)
-        data = self.get_table('Area Assignments - Pier Labels')
+        self.select_cases_and_combos(cases_and_combos)
+        data = self.get_table('Area Assignments - Pier Labels',
+                              columns=['Story','PierName','Label'])
         
         # Filtro con el máximo piso del Pier
         idx_story = list(data.groupby('PierName')['Story'].idxmax()) 
         data = data.loc[idx_story]
         data = data[['Story','PierName','Label']]
         # Puntos de los muros
-        wall_points = self.get_table('Wall Bays')
+        wall_points = self.get_table('Wall Bays', columns=['Label','PointBay'])
         wall_points = wall_points[['Label','PointBay']]
         data = data.merge(wall_points)
         
         # Desplazamiento de los puntos
-        p_disp = self.get_table('Joint Displacements')
+        p_disp = self.get_table('Joint Displacements',
+                                columns=['Story','OutputCase','Label','Ux','Uy'])
         p_disp = p_disp[['Story','OutputCase','Label','Ux','Uy']]
         data = data.merge(p_disp, left_on=['Story','PointBay'], right_on=['Story','Label'])
         data = data.drop(columns = ['Label_x','PointBay','Label_y'])
         data = data.rename(columns={'PierName':'Pier'})
         
         # Dirección de los piers
-        direc = self.get_table('Pier Section Properties')
+        direc = self.get_table('Pier Section Properties',
+                               columns=['Story','Pier','AxisAngle'])
         idx_ = list(direc.groupby('Pier')['Story'].idxmin())
         direc = direc.loc[idx_]
         direc = direc[['Pier','AxisAngle']]
-        direc['Dir'] = np.where(direc['AxisAngle']=='0','X','Y')
+        direc['Dir'] = np.where(direc['AxisAngle'].astype(float)==0,'X','Y')
         direc = direc.drop(columns='AxisAngle')
         data = data.merge(direc, on ='Pier')
         
@@ -1775,12 +2191,65 @@ class DataExtractor(Handler):
         return data.reset_index(drop=True)
         
     # ==================== STORIES ====================   
+    _STORY_COLUMNS = ['Story', 'Elevation', 'Height', 'IsMasterStory',
+                      'SimilarToStory', 'SpliceAbove', 'SpliceHeight']
+
+    @property
+    def story_table(self):
+        """
+        Pisos del modelo ordenados por elevación, leídos con una sola llamada a
+        ``Story.GetStories``.
+
+        Columnas: ``Story``, ``Elevation``, ``Height``, ``IsMasterStory``,
+        ``SimilarToStory``, ``SpliceAbove`` y ``SpliceHeight``.
+        """
+        table = self._cache.get('story_table')
+        if table is None:
+            data = self.model.Story.GetStories()
+            table = pd.DataFrame(dict(zip(self._STORY_COLUMNS, (
+                list(data[1]),
+                np.asarray(data[2], dtype=float),
+                np.asarray(data[3], dtype=float),
+                np.asarray(data[4], dtype=bool),
+                list(data[5]),
+                np.asarray(data[6], dtype=bool),
+                np.asarray(data[7], dtype=float),
+            ))), columns=self._STORY_COLUMNS)
+            table = table.sort_values('Elevation', kind='stable').reset_index(drop=True)
+            self._cache.set('story_table', table)
+        return table
+
     @property
     def stories(self):
-        return self.model.Story.GetStories()[1]
+        return self.story_table['Story'].tolist()
     
     def get_story_height(self,story):
+        heights = self.story_table.set_index('Story')['Height']
+        if story in heights.index:
+            return float(heights[story])
         return self.model.Story.GetHeight(story)[0]
+
+    def get_stories_at(self, elevations, tol=1e-6):
+        """
+        Asigna a cada elevación el piso más alto cuya cota no la supera.
+
+        Retorna un arreglo de nombres; las elevaciones bajo el primer piso
+        quedan como ``None``.
+        """
+        table = self.story_table
+        levels = table['Elevation'].to_numpy()
+        positions = np.searchsorted(levels, np.asarray(elevations, dtype=float) + tol,
+                                    side='right') - 1
+        names = np.array(table['Story'].tolist() + [None], dtype=object)
+        return names[np.where(positions >= 0, positions, len(levels))]
+
+    def _add_story_columns(self, df, columns=('Height',)):
+        """Agrega a ``df`` columnas de ``story_table`` cruzando por ``Story``."""
+        info = self.story_table.set_index('Story')
+        story = df['Story'].astype(object)
+        for column in columns:
+            df[column] = story.map(info[column]).to_numpy()
+        return df
     
     def get_story_forces(self,cases_and_combos=None):
         """
@@ -1791,16 +2260,15 @@ class DataExtractor(Handler):
         cases_and_combos = format_list_args(cases_and_combos,
                             self.design_cases_and_combos)
         
-        self.model.DatabaseTables.\
-            SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.\
-            SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
             
         self.set_envelopes_for_dysplay()
-        df = self.get_table('Story Forces')
+        df = self.get_table('Story Forces',
+                            columns=['Story','OutputCase','CaseType','StepType',
+                                     'Location','P','VX','VY','T','MX','MY'])
         df[['P','VX','VY','T','MX','MY']] =\
             df[['P','VX','VY','T','MX','MY']].astype(float)
-        df['Height'] = df['Story'].map(self.get_story_height)
+        df = self._add_story_columns(df)
         drop_columns = {'Casetype','StepNumber','StepLabel'}.intersection(df.columns)
         df = df.drop(drop_columns,axis=1)
         
@@ -1818,15 +2286,14 @@ class DataExtractor(Handler):
         """
         cases_and_combos = format_list_args(cases_and_combos,
                             self.seismic_cases_and_combos)
-        self.model.DatabaseTables.\
-            SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.\
-            SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
             
-        df = self.get_table('Story Max Over Avg Displacements')
+        df = self.get_table('Story Max Over Avg Displacements',
+                            columns=['Story','OutputCase','CaseType','StepType',
+                                     'Direction','Maximum','Average','Ratio'])
         df[['Maximum','Average','Ratio']] =\
             df[['Maximum','Average','Ratio']].astype(float)
-        df['Height'] = df['Story'].map(self.get_story_height)
+        df = self._add_story_columns(df)
         drop_columns = {'Casetype','StepNumber','StepLabel'}.intersection(df.columns)
         df = df.drop(drop_columns,axis=1)
         
@@ -1844,15 +2311,14 @@ class DataExtractor(Handler):
         """
         cases_and_combos = format_list_args(cases_and_combos,
                             self.seismic_cases_and_combos)
-        self.model.DatabaseTables.\
-            SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.\
-            SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
             
-        df = self.get_table('Diaphragm Max Over Avg Drifts')
+        df = self.get_table('Diaphragm Max Over Avg Drifts',
+                            columns=['Story','OutputCase','CaseType','StepType',
+                                     'Item','Max Drift','Avg Drift','Ratio'])
         df[['Max Drift','Avg Drift','Ratio']] =\
             df[['Max Drift','Avg Drift','Ratio']].astype(float)
-        df['Height'] = df['Story'].map(self.get_story_height)
+        df = self._add_story_columns(df)
         drop_columns = {'Casetype','StepNumber','StepLabel',
                         'Max Loc X','Max Loc Y','Max Loc Z','Label'}.\
                             intersection(df.columns)
@@ -1874,10 +2340,11 @@ class DataExtractor(Handler):
         if cases_and_combos == None:
             cases_and_combos = self.cases_and_combos
             
-        self.model.DatabaseTables.SetLoadCasesSelectedForDisplay(cases_and_combos)
-        self.model.DatabaseTables.SetLoadCombinationsSelectedForDisplay(cases_and_combos)
+        self.select_cases_and_combos(cases_and_combos)
         
-        soil_pressures = self.get_table('Soil Pressures')
+        soil_pressures = self.get_table('Soil Pressures',
+                                        columns=['UniqueName','OutputCase','StepType',
+                                                 'SoilPressure','GlobalX','GlobalY'])
         required_columns = {'UniqueName', 'OutputCase', 'SoilPressure', 'GlobalX', 'GlobalY'}
         if soil_pressures.empty or 'OutputCase' not in soil_pressures.columns:
             return pd.DataFrame()
@@ -1911,33 +2378,27 @@ class DataExtractor(Handler):
 
         Los datos se cachean tras la primera lectura y pueden filtrarse por caso.
         """
-        if self._modal_data is None:
+        modal_data = self._cache.get('modal_data')
+        if modal_data is None:
             cases_and_combos = self.cases_and_combos
-            self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
-            for case in cases_and_combos:
-                self.model.Results.Setup.SetCaseSelectedForOutput(case)
-                self.model.Results.Setup.SetComboSelectedForOutput(case)
+            self.select_output_cases(cases_and_combos)
                 
             res = self.model.Results.ModalParticipatingMassRatios()
             columns = ['LoadCase','StepType','StepNum','Period','UX','UY',
                     'UZ','SumUX','SumUY','SumUZ','RX','RY','RZ','SumRX',
                     'SumRY','SumRZ']
-            df = pd.DataFrame(np.array(res[1:-1]).T
-                            .reshape((res[0],len(columns))),
-                            columns=columns)
+            df = pd.DataFrame(dict(zip(columns, res[1:-1])), columns=columns)
             df = df[['LoadCase','Period','UX','UY','UZ','SumUX','SumUY',
                      'RZ','SumRZ']]
-            self._modal_data = df
+            modal_data = self._cache.set('modal_data', df)
             
         if cases is None:
-            return self._modal_data
+            return modal_data
         
         if isinstance(cases,str):
             cases = [cases]
         
-        df = df[df['LoadCase'].isin(cases)]
-        
-        return df
+        return modal_data[modal_data['LoadCase'].isin(cases)]
     
     @property
     def modal_data(self):
@@ -1945,12 +2406,10 @@ class DataExtractor(Handler):
     
     @property
     def modal_cases(self):
-        if self._modal_cases is None:
-            self._modal_cases = [
-                case for case in self.cases
-                if self.model.LoadCases.GetTypeOAPI_1(case)[0] == 3
-            ]
-        return self._modal_cases
+        modal_cases = self._cache.get('modal_cases')
+        if modal_cases is None:
+            modal_cases = self._cache.set('modal_cases', self._cases_where('IsModal'))
+        return modal_cases
 
     def get_modal_periods(self, case_name=None, num_modes=None, as_dict=False):
         """
@@ -2045,12 +2504,21 @@ class DataExtractor(Handler):
 
         return summary
 
+    _MODAL_DISPLACEMENT_FIELDS = {
+        'Point': 1, 'LoadCase': 3, 'StepType': 4, 'StepNum': 5,
+        'U1': 6, 'U2': 7, 'U3': 8, 'R1': 9, 'R2': 10, 'R3': 11,
+    }
+
     def get_modal_displacements(self, case_name=None, point_names=None,
-                               mode_number=None, item_type=0):
+                               mode_number=None, item_type=0, chunk_size=None,
+                               diaphragm_only=False):
         """
         Obtiene desplazamientos modales para puntos y modos seleccionados.
 
-        El resultado incluye traslaciones y rotaciones por punto y modo.
+        El resultado incluye traslaciones y rotaciones por punto y modo. Con
+        ``item_type`` ``ObjectElm`` (por defecto) los puntos se piden por grupo,
+        como en :meth:`get_point_displacements`; ``diaphragm_only=True`` deja
+        solo los puntos con diafragma asignado.
         """
         # Obtener casos modales disponibles
         modal_cases_list = self.modal_cases
@@ -2069,66 +2537,28 @@ class DataExtractor(Handler):
             )
 
         # Determinar puntos a extraer
-        if point_names is None:
-            point_names = self.point_list
-        else:
-            point_names = format_list_args(point_names, self.point_list)
-
-        # Estructura de datos para almacenar resultados
-        data = {
-            'Point': [],
-            'LoadCase': [],
-            'StepType': [],
-            'StepNum': [],
-            'U1': [],
-            'U2': [],
-            'U3': [],
-            'R1': [],
-            'R2': [],
-            'R3': []
-        }
-
-        # Configurar salida para el caso específico
-        self.model.Results.Setup.DeselectAllCasesAndCombosForOutput()
-        self.model.Results.Setup.SetCaseSelectedForOutput(case_name)
-
-        # Extraer desplazamientos para cada punto
-        for point in point_names:
-            res = self.model.Results.JointDispl(point, item_type)
-
-            # Verificar si hay resultados
-            if res[-1] != 0:
-                # Intentar correr análisis si no hay resultados
-                self.model.Analyze.RunAnalysis()
-                res = self.model.Results.JointDispl(point, item_type)
+        point_names = self._joint_points(point_names, diaphragm_only)
 
-                if res[-1] != 0:
-                    continue
+        # Resultados acumulados como columnas tipadas, indexados por punto y modo
+        store = ResultStore(self._MODAL_DISPLACEMENT_FIELDS,
+                            categorical=('Point', 'LoadCase', 'StepType'),
+                            index=('Point', 'LoadCase', 'StepNum'))
 
-            # Extraer datos
-            num_results = res[0]
-            if num_results == 0:
-                continue
+        # Configurar salida para el caso específico
+        self.select_output_cases([case_name])
 
-            # res[1] = Point names
-            # res[3] = Load case names
-            # res[4] = Step types
-            # res[5] = Step numbers
-            # res[6-11] = U1, U2, U3, R1, R2, R3
-
-            data['Point'].extend(res[1])
-            data['LoadCase'].extend(res[3])
-            data['StepType'].extend(res[4])
-            data['StepNum'].extend(res[5])
-            data['U1'].extend(res[6])
-            data['U2'].extend(res[7])
-            data['U3'].extend(res[8])
-            data['R1'].extend(res[9])
-            data['R2'].extend(res[10])
-            data['R3'].extend(res[11])
+        joint_displ = self.model.Results.JointDispl
+        if int(item_type) == eItemTypeElm.ObjectElm:
+            self._collect_results(joint_displ, store, point_names, self.point_list,
+                                  self.model.PointObj, chunk_size)
+        else:
+            for point in point_names:
+                res = joint_displ(point, item_type)
+                if res[-1] == 0:
+                    store.append(res)
 
         # Crear DataFrame
-        df = pd.DataFrame(data)
+        df = store.to_dataframe()
 
         if df.empty:
             raise ValueError(
@@ -2296,13 +2726,14 @@ class DataExtractor(Handler):
 
             if include_areas:
                 # Asegurar que las propiedades de área estén mapeadas
-                if self._wall_sections_data is None:
-                    self.map_area_properties()
+                walls = self.wall_sections_data
+                slabs = self._cache.peek('slab_sections_data')
+                decks = self._cache.peek('deck_sections_data')
 
                 geometry['area_sections'] = {
-                    'walls': self._wall_sections_data.copy() if self._wall_sections_data is not None else pd.DataFrame(),
-                    'slabs': self._slab_sections_data.copy() if self._slab_sections_data is not None else pd.DataFrame(),
-                    'decks': self._deck_sections_data.copy() if self._deck_sections_data is not None else pd.DataFrame()
+                    'walls': walls.copy() if walls is not None else pd.DataFrame(),
+                    'slabs': slabs.copy() if slabs is not None else pd.DataFrame(),
+                    'decks': decks.copy() if decks is not None else pd.DataFrame()
                 }
                 total_area_sections = (
                     len(geometry['area_sections']['walls']) +
@@ -2416,7 +2847,7 @@ class DataExtractor(Handler):
                 # Convertir listas a strings para serialización
                 for col in ['points_x', 'points_y', 'points_z']:
                     if col in areas_df.columns:
-                        areas_df[col] = areas_df[col].apply(lambda x: list(x) if isinstance(x, (list, tuple)) else x)
+                        areas_df[col] = areas_df[col].apply(lambda x: list(x) if isinstance(x, (list, tuple, np.ndarray)) else x)
                 geometry['areas'] = areas_df.to_dict(orient='records')
 
             # Secciones de área
@@ -2515,22 +2946,18 @@ class DataExtractor(Handler):
                 14: 'Staged Construction'
             }
 
-            for case in self.cases:
-                case_type = self.model.LoadCases.GetTypeOAPI_1(case)[2]
-
-                cases_data['Case'].append(case)
-                cases_data['Type'].append(case_type)
-                cases_data['TypeName'].append(case_type_map.get(case_type, 'Unknown'))
+            case_table = self.load_case_table
+            cases_data['Case'] = case_table['Case'].tolist()
+            cases_data['Type'] = case_table['CaseType'].tolist()
+            cases_data['TypeName'] = [case_type_map.get(case_type, 'Unknown')
+                                      for case_type in cases_data['Type']]
 
             load_info['load_cases'] = pd.DataFrame(cases_data)
 
             # Agregar información de casos modales
             if include_details:
-                modal_cases = self.modal_cases if hasattr(self, 'modal_cases') else []
-                load_info['load_cases']['IsModal'] = load_info['load_cases']['Case'].isin(modal_cases)
-
-                seismic_cases = self.seismic_cases if hasattr(self, 'seismic_cases') else []
-                load_info['load_cases']['IsSeismic'] = load_info['load_cases']['Case'].isin(seismic_cases)
+                load_info['load_cases']['IsModal'] = case_table['IsModal'].to_numpy()
+                load_info['load_cases']['IsSeismic'] = case_table['IsSeismic'].to_numpy()
 
             print(f"  Total casos: {len(load_info['load_cases'])}")
         else:
@@ -2556,30 +2983,24 @@ class DataExtractor(Handler):
             }
 
             combo_details_list = []
+            definitions = self.get_combo_engine().definitions
 
             for combo in self.combos:
-                combo_type = self.model.RespCombo.GetTypeOAPI(combo)[0]
-
-                # Obtener casos de la combinación
-                combo_info = self.model.RespCombo.GetCaseList(combo)
-                num_cases = combo_info[0]
-                case_types = combo_info[1]
-                case_names = combo_info[2]
-                scale_factors = combo_info[3]
+                combo_type, items = definitions[combo]
 
                 combos_data['Combo'].append(combo)
                 combos_data['Type'].append(combo_type)
                 combos_data['TypeName'].append(combo_type_map.get(combo_type, 'Unknown'))
-                combos_data['NumCases'].append(num_cases)
+                combos_data['NumCases'].append(len(items))
 
                 # Detalles de cada caso en la combinación
                 if include_details:
-                    for i in range(num_cases):
+                    for case_name, scale_factor in items:
                         combo_details_list.append({
                             'Combo': combo,
-                            'CaseType': 'LoadCase' if case_types[i] == 0 else 'LoadCombo',
-                            'CaseName': case_names[i],
-                            'ScaleFactor': scale_factors[i]
+                            'CaseType': 'LoadCombo' if case_name in definitions else 'LoadCase',
+                            'CaseName': case_name,
+                            'ScaleFactor': scale_factor
                         })
 
             load_info['load_combos'] = pd.DataFrame(combos_data)
@@ -2683,36 +3104,180 @@ class DataExtractor(Handler):
 
         return load_dict
 
+    # resultado -> (función Results, campos, columnas de texto, lista de nombres, objetos CSI)
+    _EXPORT_RESULTS = {
+        'frame': ('FrameForce', _FRAME_FORCE_FIELDS, ('Frame', 'OutputCase', 'StepType'),
+                  'frame_list', 'FrameObj'),
+        'area': ('AreaForceShell', _AREA_FORCE_FIELDS,
+                 ('AreaName', 'PointName', 'OutputCase', 'StepType'), 'area_list', 'AreaObj'),
+        'joint': ('JointReact', _POINT_REACTION_FIELDS, ('Point', 'OutputCase', 'StepType'),
+                  'point_list', 'PointObj'),
+        'displacement': ('JointDispl', _POINT_DISPLACEMENT_FIELDS,
+                         ('Point', 'OutputCase', 'StepType'), 'point_list', 'PointObj'),
+    }
+    # resultado -> (extractor por caso, columnas de texto, columnas numéricas)
+    _EXPORT_TABLES = {
+        'pier': ('_get_pier_forces_raw', ('Pier', 'Story', 'OutputCase', 'Location'),
+                 ('P', 'V2', 'V3', 'T', 'M2', 'M3')),
+        'story': ('get_story_forces', ('Story', 'OutputCase', 'CaseType', 'StepType', 'Location'),
+                  ('P', 'VX', 'VY', 'T', 'MX', 'MY', 'Height')),
+    }
+
+    def _object_stories(self, objects):
+        """``{nombre: piso}`` de puntos, frames o áreas, con una llamada por piso."""
+        return {name: story for story in self.stories
+                for name in objects.GetNameListOnStory(story)[1]}
+
+    def export_results(self, kind, cases, path, chunk=None, format='parquet', names=None,
+                       overwrite=False):
+        """
+        Exporta resultados a ``path`` por partes, particionados por caso y piso.
+
+        ``kind`` acepta ``frame``, ``area``, ``joint`` (reacciones),
+        ``displacement``, ``pier`` y ``story``. Cada caso de ``cases`` (por
+        defecto, los de diseño) se pide por separado y, en frames, áreas y
+        puntos, por grupos de ``chunk`` objetos (todos con ``None``); cada parte
+        se escribe y se libera antes de pedir la siguiente. ``format`` es
+        ``parquet`` o ``arrow`` (Arrow IPC). Requiere ``pyarrow``.
+
+        Retorna el manifiesto guardado en ``path/_manifest.json``.
+        """
+        kinds = list(self._EXPORT_RESULTS) + list(self._EXPORT_TABLES)
+        if kind not in kinds:
+            raise ValueError(f"Resultado no válido: {kind}. Use: {', '.join(kinds)}")
+        cases = format_list_args(cases, self.design_cases_and_combos,
+                                 check_values=False)
+
+        if kind in self._EXPORT_TABLES:
+            method, text_columns, value_columns = self._EXPORT_TABLES[kind]
+            columns = dict.fromkeys(text_columns, 'string')
+            columns.update(dict.fromkeys(value_columns, 'float64'))
+            writer = ResultWriter(path, kind, columns, format=format, overwrite=overwrite)
+            for case in cases:
+                started = time.perf_counter()
+                frame = getattr(self, method)(cases_and_combos=[case])
+                writer.write(frame, case, extract_s=time.perf_counter() - started)
+            return writer.close()
+
+        function, fields, text_columns, list_name, objects_name = self._EXPORT_RESULTS[kind]
+        columns = {column: 'string' if column in text_columns else 'float64' for column in fields}
+        element = next(iter(fields))
+        objects = getattr(self.model, objects_name)
+        all_names = getattr(self, list_name)
+        names = format_list_args(names, all_names)
+        story_of = self._object_stories(objects)
+        func = getattr(self.model.Results, function)
+        writer = ResultWriter(path, kind, columns, format=format, overwrite=overwrite)
+        for number, group in enumerate(self._result_groups(names, all_names, objects, chunk)):
+            for case in cases:
+                started = time.perf_counter()
+                self.select_output_cases([case])
+                store = ResultStore(fields, categorical=text_columns)
+                store.append(self._group_results(func, group))
+                frame = store.to_dataframe()
+                frame['Story'] = frame[element].map(story_of)
+                writer.write(frame, case, chunk=number, extract_s=time.perf_counter() - started)
+                del store, frame
+        return writer.close()
+
+    # resultado -> (extractor de casos, columnas clave, columnas de valores, columna StepType)
+    _COMBO_RESULT_PATHS = {
+        'frame': ('get_frame_forces', ['Frame', 'Station'],
+                  ['P', 'V2', 'V3', 'T', 'M2', 'M3'], 'StepType'),
+        'area': ('get_area_forces', ['AreaName', 'PointName'],
+                 ['F11', 'F22', 'F12', 'M11', 'M22', 'M12', 'V13', 'V23'], 'StepType'),
+        'joint': ('get_point_reactions', ['Point'],
+                  ['F1', 'F2', 'F3', 'M1', 'M2', 'M3'], 'StepType'),
+        'pier': ('_get_pier_forces_raw', ['Story', 'Pier', 'Location'],
+                 ['P', 'V2', 'V3', 'T', 'M2', 'M3'], None),
+    }
+
+    def get_combo_engine(self):
+        """
+        Retorna el :class:`ComboEngine` (cacheado) con las combinaciones y casos del modelo.
+
+        Lee tipo y lista de casos de cada combinación una sola vez; el tipo de
+        cada caso base sale de :attr:`load_case_table`.
+        """
+        engine = self._cache.get('combo_engine')
+        if engine is None:
+            definitions = {}
+            for combo in self.combos:
+                combo_type = self.model.RespCombo.GetTypeOAPI(combo)[0]
+                combo_info = self.model.RespCombo.GetCaseList(combo)
+                items = list(zip(combo_info[2], combo_info[3]))
+                definitions[combo] = (int(combo_type), [(name, float(sf)) for name, sf in items])
+            table = self.load_case_table
+            case_types = dict(zip(table['Case'], table['CaseType'].astype(int)))
+            engine = self._cache.set('combo_engine', ComboEngine(definitions, case_types))
+        return engine
+
+    def get_combo_results(self, result='frame', names=None, combos=None):
+        """
+        Calcula resultados de combinaciones a partir de los casos base.
+
+        ``result`` acepta ``frame``, ``area``, ``joint`` o ``pier``. Las
+        combinaciones Linear Add, Envelope, Absolute Add y SRSS de casos lineales
+        se evalúan localmente; el resto se pide a CSI. La salida tiene la misma
+        forma que el extractor correspondiente.
+        """
+        if result not in self._COMBO_RESULT_PATHS:
+            raise ValueError(
+                f"Resultado no válido: {result}. Use: {', '.join(self._COMBO_RESULT_PATHS)}"
+            )
+        method, keys, values, step_column = self._COMBO_RESULT_PATHS[result]
+        if result == 'pier':
+            def extract(_, cases):
+                return self._get_pier_forces_raw(cases)
+        else:
+            extract = getattr(self, method)
+
+        combos = format_list_args(combos, self.combos)
+        engine = self.get_combo_engine()
+        local = [combo for combo in combos if engine.is_local(combo)]
+        remote = [combo for combo in combos if combo not in local]
+
+        frames = []
+        if local:
+            base = extract(names, engine.base_cases(local))
+            frames.append(engine.evaluate(base, local, keys, values, step_column=step_column))
+        if remote:
+            frames.append(extract(names, remote))
+        if not frames:
+            data = extract(names, [])
+        else:
+            data = pd.concat(frames, ignore_index=True)
+            data = sort_like_csi(data, keys[:-1] or keys, 'OutputCase', combos)
+
+        if result == 'pier':
+            data = self._filter_pier_forces(self._label_pier_envelopes(data), piers=names)
+        return data
+
     def get_combo_breakdown(self, combo_name):
         """
         Desglosa recursivamente una combinación de carga.
 
         El resultado acumula factores y consolida los casos base repetidos.
         """
+        definitions = self.get_combo_engine().definitions
+
         def get_combo_cases_recursive(combo, factor=1.0, level=0):
             """Función recursiva para obtener todos los casos base"""
-            combo_info = self.model.RespCombo.GetCaseList(combo)
-            num_items = combo_info[0]
-            item_types = combo_info[1]  # 0 = LoadCase, 1 = LoadCombo
-            item_names = combo_info[2]
-            scale_factors = combo_info[3]
-
             results = []
 
-            for i in range(num_items):
-                current_factor = factor * scale_factors[i]
-                item_type = 'Case' if item_types[i] == 0 else 'Combo'
+            for item_name, scale_factor in definitions[combo][1]:
+                current_factor = factor * scale_factor
 
-                if item_types[i] == 0:  # Es un caso de carga
+                if item_name not in definitions:  # Es un caso de carga
                     results.append({
-                        'Case': item_names[i],
+                        'Case': item_name,
                         'Factor': current_factor,
                         'Level': level,
-                        'Path': combo if level == 0 else f"{combo} > {item_names[i]}"
+                        'Path': combo if level == 0 else f"{combo} > {item_name}"
                     })
                 else:  # Es otra combinación (recursivo)
                     sub_results = get_combo_cases_recursive(
-                        item_names[i],
+                        item_name,
                         current_factor,
                         level + 1
                     )
@@ -0,0 +1,261 @@
+"""
+Clasificación vectorizada de frames contra líneas de grid.
+
+``GridEngine`` clasifica todos los frames a la vez: un frame pertenece a una
+línea si ambos extremos caen sobre ella con tolerancia ``tol``. Las líneas
+cartesianas X/Y se resuelven con búsqueda binaria sobre ordenadas ordenadas y
+las líneas generales con distancia punto-segmento solo sobre los candidatos
+que pasan un prefiltro por caja y distancia a la recta.
+
+``GridFrameIndex`` guarda la conectividad ya resuelta como índice invertido
+para responder consultas por eje e intersección sin recalcularla.
+"""
+
+import numpy as np
+import pandas as pd
+
+_GROUP_X, _GROUP_Y, _GROUP_GENERAL = 0, 1, 2
+
+
+def _as_float(values):
+    return pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=float)
+
+
+class GridEngine:
+    """Índice de líneas de grid listo para clasificar extremos de frames."""
+
+    def __init__(self, grid_lines):
+        lines = grid_lines.reset_index(drop=True)
+        count = len(lines)
+
+        def column(name):
+            if name in lines.columns:
+                return lines[name]
+            return pd.Series([np.nan] * count, dtype=object)
+
+        self.ids = np.array([str(value).strip() for value in column("GridLineID").fillna("")], dtype=object)
+        axis = np.array([str(value).strip().upper() for value in column("Axis").fillna("")], dtype=object)
+        ordinate = _as_float(column("Ordinate"))
+        x1, y1 = _as_float(column("X1")), _as_float(column("Y1"))
+        x2, y2 = _as_float(column("X2")), _as_float(column("Y2"))
+
+        self.group = np.full(count, _GROUP_GENERAL)
+        self.group[axis == "X"] = _GROUP_X
+        self.group[axis == "Y"] = _GROUP_Y
+
+        has_ordinate = ~np.isnan(ordinate)
+        is_x = (axis == "X") & has_ordinate
+        is_y = (axis == "Y") & has_ordinate
+        self._x_lines = self._sorted_lines(np.flatnonzero(is_x), ordinate)
+        self._y_lines = self._sorted_lines(np.flatnonzero(is_y), ordinate)
+
+        has_segment = ~(np.isnan(x1) | np.isnan(y1) | np.isnan(x2) | np.isnan(y2))
+        general = np.flatnonzero(~is_x & ~is_y & has_segment)
+        self._general = general
+        self._segments = np.column_stack([x1, y1, x2, y2])[general] if len(general) else np.empty((0, 4))
+
+    @staticmethod
+    def _sorted_lines(indices, ordinate):
+        order = np.argsort(ordinate[indices], kind="stable")
+        return indices[order], ordinate[indices][order]
+
+    def _cartesian_pairs(self, lines, a, b, tol):
+        """Pares (frame, línea) cuyos dos extremos están a ``tol`` de la ordenada."""
+        indices, ordinates = lines
+        if not len(indices):
+            return np.empty(0, dtype=int), np.empty(0, dtype=int)
+        pad = tol + 1e-12 * np.maximum(1.0, np.abs(a))
+        lo = np.maximum(
+            np.searchsorted(ordinates, a - pad, side="left"),
+            np.searchsorted(ordinates, b - pad, side="left"),
+        )
+        hi = np.minimum(
+            np.searchsorted(ordinates, a + pad, side="right"),
+            np.searchsorted(ordinates, b + pad, side="right"),
+        )
+        counts = np.maximum(hi - lo, 0)
+        frames = np.repeat(np.arange(len(a)), counts)
+        if not len(frames):
+            return frames, frames
+        offsets = np.arange(len(frames)) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(lo, counts) + offsets
+        keep = (np.abs(a[frames] - ordinates[positions]) <= tol) & (np.abs(b[frames] - ordinates[positions]) <= tol)
+        return frames[keep], indices[positions[keep]]
+
+    @staticmethod
+    def _on_segments(px, py, segments, tol):
+        """Matriz (puntos x segmentos): punto a menos de ``tol`` del segmento, extremos incluidos."""
+        x1, y1, x2, y2 = (segments[:, k][None, :] for k in range(4))
+        dx, dy = x2 - x1, y2 - y1
+        seg_len_sq = dx * dx + dy * dy
+        rx, ry = px[:, None] - x1, py[:, None] - y1
+        degenerate = seg_len_sq <= tol ** 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross = np.abs(rx * dy - ry * dx) / np.sqrt(seg_len_sq)
+        dot = rx * dx + ry * dy
+        on_line = (cross <= tol) & (dot >= -tol) & (dot <= seg_len_sq + tol)
+        return np.where(degenerate, np.hypot(rx, ry) <= tol, on_line)
+
+    def _general_pairs(self, xi, yi, xj, yj, tol):
+        """
+        Pares (frame, línea general) con ambos extremos sobre el segmento.
+
+        Los frames se reducen a coordenadas en planta únicas (los pisos repiten
+        las mismas) y, por segmento, los candidatos se acotan con la caja del
+        segmento sobre los extremos ordenados por X y con la distancia a la
+        recta del extremo i; la regla exacta de :meth:`_on_segments` solo se
+        evalúa sobre los que pasan.
+        """
+        empty = np.empty(0, dtype=int)
+        if not len(self._general):
+            return empty, empty
+        coords = np.column_stack([xi, yi, xj, yj])
+        valid = np.flatnonzero(~np.isnan(coords).any(axis=1))
+        if not len(valid):
+            return empty, empty
+        plan, inverse = np.unique(coords[valid], axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        # Extremos i ordenados por X para acotar cada segmento con searchsorted
+        order = np.argsort(plan[:, 0], kind="stable")
+        sorted_x = plan[order, 0]
+
+        rows, lines = [], []
+        for position, (x1, y1, x2, y2) in enumerate(self._segments):
+            dx, dy = x2 - x1, y2 - y1
+            length = np.hypot(dx, dy)
+            degenerate = length * length <= tol ** 2
+            # Un punto aceptado está a tol de la recta y a tol / largo más allá de los extremos
+            pad = (tol if degenerate else tol + tol / length) * (1 + 1e-9) + 1e-12
+            lo = np.searchsorted(sorted_x, min(x1, x2) - pad, side="left")
+            hi = np.searchsorted(sorted_x, max(x1, x2) + pad, side="right")
+            if lo >= hi:
+                continue
+            candidates = order[lo:hi]
+            px, py = plan[candidates, 0], plan[candidates, 1]
+            near = (py >= min(y1, y2) - pad) & (py <= max(y1, y2) + pad)
+            if not degenerate:
+                near &= np.abs((px - x1) * dy - (py - y1) * dx) <= pad * length
+            candidates = candidates[near]
+            if not len(candidates):
+                continue
+            segment = self._segments[position:position + 1]
+            hits = (
+                self._on_segments(plan[candidates, 0], plan[candidates, 1], segment, tol)[:, 0]
+                & self._on_segments(plan[candidates, 2], plan[candidates, 3], segment, tol)[:, 0]
+            )
+            rows.append(candidates[hits])
+            lines.append(np.full(int(hits.sum()), self._general[position]))
+        if not rows:
+            return empty, empty
+        rows, lines = np.concatenate(rows), np.concatenate(lines)
+
+        # Cada fila única vuelve a todos los frames con esas coordenadas
+        by_row = np.argsort(inverse, kind="stable")
+        starts = np.searchsorted(inverse[by_row], rows, side="left")
+        counts = np.searchsorted(inverse[by_row], rows, side="right") - starts
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        frames = valid[by_row[np.repeat(starts, counts) + offsets]]
+        return frames, np.repeat(lines, counts)
+
+    def pairs(self, xi, yi, xj, yj, tol=1e-6):
+        """
+        Retorna todos los pares (frame, línea) con ambos extremos sobre la línea.
+
+        Los pares quedan ordenados por frame y luego por orden de la tabla de grids.
+        """
+        xi, yi, xj, yj = (np.asarray(values, dtype=float) for values in (xi, yi, xj, yj))
+        found = [
+            self._cartesian_pairs(self._x_lines, xi, xj, tol),
+            self._cartesian_pairs(self._y_lines, yi, yj, tol),
+            self._general_pairs(xi, yi, xj, yj, tol),
+        ]
+        frames = np.concatenate([item[0] for item in found]).astype(int)
+        lines = np.concatenate([item[1] for item in found]).astype(int)
+        order = np.lexsort((lines, frames))
+        return frames[order], lines[order]
+
+    def beam_grids(self, xi, yi, xj, yj, tol=1e-6):
+        """Primer grid (en orden de tabla) que contiene a cada frame, o ``''``."""
+        result = np.full(len(xi), "", dtype=object)
+        frames, lines = self.pairs(xi, yi, xj, yj, tol)
+        if len(frames):
+            first, index = np.unique(frames, return_index=True)
+            result[first] = self.ids[lines[index]]
+        return result
+
+    def column_grids(self, xi, yi, xj, yj, tol=1e-6):
+        """
+        Ids de grid X, Y y generales que contienen a cada frame.
+
+        Varios ids del mismo grupo se unen con ``|`` sin repetir, en orden de tabla.
+        """
+        result = {key: np.full(len(xi), "", dtype=object) for key in ("GridX", "GridY", "General")}
+        frames, lines = self.pairs(xi, yi, xj, yj, tol)
+        ids = self.ids[lines]
+        keep = ids != ""
+        frames, lines, ids = frames[keep], lines[keep], ids[keep]
+        if not len(frames):
+            return result
+
+        matches = pd.DataFrame({"frame": frames, "group": self.group[lines], "id": ids})
+        matches = matches.drop_duplicates(["frame", "group", "id"])
+        if matches.duplicated(["frame", "group"]).any():
+            matches = matches.groupby(["frame", "group"], sort=False)["id"].agg("|".join).reset_index()
+        for key, group in (("GridX", _GROUP_X), ("GridY", _GROUP_Y), ("General", _GROUP_GENERAL)):
+            subset = matches[matches["group"] == group]
+            result[key][subset["frame"].to_numpy()] = subset["id"].to_numpy()
+        return result
+
+
+class GridFrameIndex:
+    """
+    Índice invertido (grid, eje, piso, tipo de frame) -> filas de conectividad.
+
+    Se construye una vez a partir de ``get_frames_connectivity()``; las consultas
+    por eje son uniones de conjuntos y las de intersección, intersecciones.
+    """
+
+    # Columna de conectividad -> eje del índice.
+    AXES = ('Grid', 'GridX', 'GridY', 'General')
+
+    def __init__(self, connectivity, tol=1e-6):
+        self.connectivity = connectivity.reset_index(drop=True)
+        self.tol = tol
+        self._rows = {}
+        stories = self.connectivity['Story'].to_numpy() if len(self.connectivity) else []
+        frame_types = self.connectivity['FrameType'].to_numpy() if len(self.connectivity) else []
+        for axis in self.AXES:
+            if axis not in self.connectivity.columns:
+                continue
+            for row, value in enumerate(self.connectivity[axis].to_numpy()):
+                if value in (None, '') or value != value:
+                    continue
+                for grid in str(value).split('|'):
+                    grid = grid.strip()
+                    if grid:
+                        key = (grid, axis, stories[row], frame_types[row])
+                        self._rows.setdefault(key, set()).add(row)
+
+        self._keys = {}
+        for key in self._rows:
+            self._keys.setdefault((key[0], key[1]), []).append(key)
+
+    def rows(self, grids, axes, stories=None, frame_types=None):
+        """Filas cuyo ``axis`` contiene alguno de ``grids`` (con filtros opcionales)."""
+        found = set()
+        for grid in grids:
+            for axis in axes:
+                for key in self._keys.get((grid, axis), ()):
+                    if stories and key[2] not in stories:
+                        continue
+                    if frame_types and key[3] not in frame_types:
+                        continue
+                    found |= self._rows[key]
+        return found
+
+    def select(self, rows, labels=None):
+        """Retorna las filas indicadas en el orden original de conectividad."""
+        frames = self.connectivity.iloc[sorted(rows)]
+        if labels:
+            frames = frames[frames['Label'].isin(labels)]
+        return frames.reset_index(drop=True)
@@ -2,12 +2,15 @@ from .constants import eUnits, u
 
 import importlib
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
+import pandas as pd
 import psutil
 
 from .api_helpers import CSIAPIHelpers
+from .instrumentation import STATS_COLUMNS, CallStats
 
 PROGRAM_INFO = {
     "ETABS": {
@@ -56,12 +59,15 @@ def validate_backend(backend: str):
     """
     Valida y normaliza el backend de conexión.
 
-    Los valores admitidos son ``auto``, ``dotnet`` y ``comtypes``.
+    Los valores admitidos son ``auto``, ``dotnet``, ``comtypes``, ``replay``
+    y ``simulated``.
     """
     backend = (backend or "auto").lower().strip()
-    valid_backends = {"auto", "dotnet", "comtypes"}
+    valid_backends = {"auto", "dotnet", "comtypes", "replay", "simulated"}
     if backend not in valid_backends:
-        raise ValueError(f"Backend no válido: {backend}. Use: auto, dotnet o comtypes")
+        raise ValueError(
+            f"Backend no válido: {backend}. Use: auto, dotnet, comtypes, replay o simulated"
+        )
     return backend
 
 
@@ -252,8 +258,94 @@ class _ComtypesBackend:
         return csi_object.SapModel
 
 
-def _build_backend(program: str, backend: str, dll_path: Optional[str] = None):
+class _ReplayBackend:
+    """
+    Backend sin programa CSI que sirve una grabación de ``CallRecorder``.
+
+    Los resultados grabados ya están normalizados, por lo que los helpers no
+    aplican wrappers especiales sobre este backend.
+    """
+
+    name = "replay"
+    normalized_results = True
+
+    def __init__(self, program: str, replay_path=None, latency=0.0, strict=True):
+        if replay_path is None:
+            raise ValueError("El backend replay requiere replay_path")
+        self.program = validate_programs(program)
+        self.program_info = _get_program_info(self.program)
+
+        from .replay import ReplayModel, _ReplayApplication
+
+        self._application = _ReplayApplication
+        self.replay = ReplayModel(replay_path, latency=latency, strict=strict)
+        self.module = None
+        self.helper = None
+
+    def get_object(self):
+        return self._application(self.replay)
+
+    def get_object_process(self, pid: int):
+        return self.get_object()
+
+    def create_object(self, exe_path: str):
+        return self.get_object()
+
+    def create_object_progid(self):
+        return self.get_object()
+
+    def get_sap_model(self, csi_object):
+        return csi_object.SapModel
+
+
+class _SimulatedBackend:
+    """
+    Backend en memoria sobre un ``SimulatedModel`` paramétrico.
+
+    Acepta un modelo ya construido (``model=``) o los parámetros de
+    ``SimulatedModel`` (``stories``, ``bays_x``, ``bays_y``, ...). Con
+    ``api_shape="comtypes"`` o ``"dotnet"`` responde con la forma cruda de ese
+    backend y los helpers aplican sus wrappers especiales.
+    """
+
+    name = "simulated"
+
+    def __init__(self, program: str, model=None, api_shape=None, **model_options):
+        self.program = validate_programs(program)
+        self.program_info = _get_program_info(self.program)
+
+        from .simulator import SimulatedApplication, SimulatedModel, SimulatedSystem
+
+        self._application = SimulatedApplication
+        self.api_shape = api_shape
+        self.normalized_results = api_shape is None
+        self.system_module = SimulatedSystem if api_shape == "dotnet" else None
+        self.sim_model = model if model is not None else SimulatedModel(**model_options)
+        self.module = None
+        self.helper = None
+
+    def get_object(self):
+        return self._application(self.sim_model, self.api_shape)
+
+    def get_object_process(self, pid: int):
+        return self.get_object()
+
+    def create_object(self, exe_path: str):
+        return self.get_object()
+
+    def create_object_progid(self):
+        return self.get_object()
+
+    def get_sap_model(self, csi_object):
+        return csi_object.SapModel
+
+
+def _build_backend(program: str, backend: str, dll_path: Optional[str] = None, **backend_options):
     backend = validate_backend(backend)
+    if backend == "replay":
+        return _ReplayBackend(program, **backend_options)
+    if backend == "simulated":
+        return _SimulatedBackend(program, **backend_options)
     if backend == "dotnet":
         return _DotNetBackend(program, dll_path=dll_path)
     if backend == "comtypes":
@@ -300,7 +392,7 @@ def get_paths(program="ETABS", backend="auto"):
 
 def get_available_backends():
     """Retorna los backends de conexión soportados por la librería."""
-    return ["dotnet", "comtypes"]
+    return ["dotnet", "comtypes", "replay", "simulated"]
 
 
 class Handler:
@@ -308,8 +400,11 @@ class Handler:
     Clase base de conexión para modelos CSI.
 
     Gestiona backend, adjunción a instancias y operaciones básicas sobre el modelo.
+    Las opciones adicionales se pasan al backend: ``replay_path``, ``latency`` y
+    ``strict`` para ``replay``; ``model``, ``api_shape`` o los parámetros de
+    ``SimulatedModel`` para ``simulated``.
     """
-    def __init__(self, program="ETABS", units=u.csi_units, backend="auto", dll_path=None):
+    def __init__(self, program="ETABS", units=u.csi_units, backend="auto", dll_path=None, **backend_options):
         self.program = validate_programs(program)
         self._raw_model = None
         self.model = None
@@ -322,11 +417,26 @@ class Handler:
         self.requested_backend = validate_backend(backend)
         self.backend = None
         self.dll_path = dll_path
-        self.connector = _build_backend(self.program, self.requested_backend, dll_path=self.dll_path)
+        self.connector = _build_backend(
+            self.program, self.requested_backend, dll_path=self.dll_path, **backend_options
+        )
         self.backend = self.connector.name
         self.helper = self.connector.helper
         self.api_module = getattr(self.connector, "module", None)
         self.api = CSIAPIHelpers(self)
+        self._recorder = None
+        self._call_stats = None
+        self._forget_selection_state()
+
+    def _forget_selection_state(self):
+        """Marca como desconocida la selección de salida y de visualización del modelo."""
+        self._output_selection = None
+        self._display_selection = {'cases': None, 'combos': None}
+        self._display_options = None
+
+    def _on_model_bound(self):
+        """Se ejecuta cada vez que el handler queda apuntando a un modelo."""
+        self._forget_selection_state()
 
     def _bind_model(self):
         self._raw_model = self.connector.get_sap_model(self.object)
@@ -335,6 +445,7 @@ class Handler:
         self.file_path = self.model.GetModelFilename()
         self.file_name = os.path.basename(self.file_path) if self.file_path else "Untitled"
         self.set_units()
+        self._on_model_bound()
         self.is_connected = True
 
     def connect_open_instance(self, instance_position=None):
@@ -387,6 +498,7 @@ class Handler:
         self.file_path = file_path
         self.file_name = os.path.basename(self.file_path)
         self.set_units()
+        self._on_model_bound()
         self.is_connected = True
         print(f"Conectado a {self.file_name} usando backend {self.backend}")
         return True
@@ -415,6 +527,7 @@ class Handler:
         if units:
             self.units = units
         self.set_units()
+        self._on_model_bound()
 
         self.is_connected = True
         print(f"Nueva instancia de {self.program} abierta usando backend {self.backend}")
@@ -434,14 +547,94 @@ class Handler:
         if self.object is None:
             return True
         self.object.ApplicationExit(True)
+        self.api.release_model_proxy()
         self.object = None
         self._raw_model = None
         self.model = None
         self.api_model = None
+        self._forget_selection_state()
         self.is_connected = False
         print(f"{self.file_name} cerrado")
         return True
 
+    def start_recording(self, path):
+        """
+        Empieza a grabar las llamadas a la API en ``path``.
+
+        La grabación puede reproducirse luego con ``backend="replay"``.
+        """
+        if self._recorder is not None:
+            raise RuntimeError(f"Ya hay una grabación activa en {self._recorder.path}")
+        from .replay import CallRecorder
+
+        self._recorder = CallRecorder(path, program=self.program, backend=self.backend)
+        self.api.add_observer(self._recorder)
+        return self._recorder
+
+    def stop_recording(self):
+        """Detiene la grabación activa, la guarda y retorna su ruta."""
+        if self._recorder is None:
+            return None
+        recorder, self._recorder = self._recorder, None
+        self.api.remove_observer(recorder)
+        return recorder.save()
+
+    @contextmanager
+    def recording(self, path):
+        """Graba las llamadas a la API realizadas dentro del bloque ``with``."""
+        recorder = self.start_recording(path)
+        try:
+            yield recorder
+        finally:
+            self.stop_recording()
+
+    def enable_stats(self, trace=True):
+        """
+        Activa la instrumentación de llamadas a la API.
+
+        Mientras está activa se acumulan llamadas, latencias y tamaño de
+        resultados por ruta; consultar con :meth:`stats`.
+        """
+        if self._call_stats is None:
+            self._call_stats = CallStats(trace=trace)
+            self.api.add_observer(self._call_stats)
+        return self._call_stats
+
+    def disable_stats(self):
+        """Desactiva la instrumentación y retorna las estadísticas acumuladas."""
+        call_stats, self._call_stats = self._call_stats, None
+        if call_stats is not None:
+            self.api.remove_observer(call_stats)
+            call_stats.stop()
+        return call_stats
+
+    def stats(self):
+        """Retorna las estadísticas por ruta de la API como ``DataFrame``."""
+        if self._call_stats is None:
+            return pd.DataFrame(columns=STATS_COLUMNS)
+        return self._call_stats.to_dataframe()
+
+    def export_stats(self, path, format="json"):
+        """Exporta las estadísticas activas en ``json`` o traza ``chrome``."""
+        if self._call_stats is None:
+            raise RuntimeError("La instrumentación no está activa; use enable_stats()")
+        return self._call_stats.export(path, format=format)
+
+    @contextmanager
+    def collect_stats(self, trace=True):
+        """
+        Mide las llamadas a la API realizadas dentro del bloque ``with``.
+
+        Entrega un ``CallStats`` independiente de :meth:`enable_stats`.
+        """
+        call_stats = CallStats(trace=trace)
+        self.api.add_observer(call_stats)
+        try:
+            yield call_stats
+        finally:
+            self.api.remove_observer(call_stats)
+            call_stats.stop()
+
     def refresh_view(self):
         """Actualiza la vista del modelo en la aplicación CSI."""
         self.model.View.RefreshView()
@@ -0,0 +1,166 @@
+"""
+Instrumentación de llamadas a la API CSI.
+
+``CallStats`` es un observador de ``CSIAPIHelpers`` que acumula, por ruta de
+la API, cantidad de llamadas, latencias (total, percentiles y tiempo propio de
+la llamada CSI) y tamaño de los resultados. Solo existe costo mientras está
+registrado: sin observadores los proxys devuelven los callables sin envolver.
+"""
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+STATS_COLUMNS = [
+    "path", "calls", "total_s", "backend_s", "normalize_s", "mean_ms",
+    "p50_ms", "p90_ms", "p99_ms", "max_ms", "elements", "bytes",
+]
+
+
+def _payload_size(result):
+    """Cuenta elementos y bytes aproximados de un resultado normalizado."""
+    if isinstance(result, np.ndarray):
+        if result.dtype == object:
+            return result.size, sum(len(item) for item in result if isinstance(item, str))
+        return result.size, result.nbytes
+    if isinstance(result, (str, bytes)):
+        return 1, len(result)
+    if isinstance(result, (list, tuple)):
+        elements = size = 0
+        for item in result:
+            item_elements, item_size = _payload_size(item)
+            elements += item_elements
+            size += item_size
+        return elements, size
+    return 1, 8
+
+
+class CallStats:
+    """
+    Acumula estadísticas por ruta de la API mientras está registrado.
+
+    ``trace=True`` guarda además cada llamada individual para exportarla en
+    formato Chrome Trace (``chrome://tracing`` o Perfetto).
+    """
+
+    def __init__(self, trace=True):
+        self.trace = trace
+        self.started = time.perf_counter()
+        self.stopped = None
+        self._durations = {}
+        self._backend = {}
+        self._elements = {}
+        self._bytes = {}
+        self._events = []
+
+    def observe(self, path, args, kwargs, result, start, end, backend_s=None):
+        durations = self._durations.get(path)
+        if durations is None:
+            durations = self._durations[path] = []
+            self._backend[path] = 0.0
+            self._elements[path] = 0
+            self._bytes[path] = 0
+        durations.append(end - start)
+        self._backend[path] += end - start if backend_s is None else backend_s
+        elements, size = _payload_size(result)
+        self._elements[path] += elements
+        self._bytes[path] += size
+        if self.trace:
+            self._events.append((path, start, end))
+
+    def stop(self):
+        if self.stopped is None:
+            self.stopped = time.perf_counter()
+        return self
+
+    @property
+    def elapsed(self):
+        """Tiempo de pared desde que se creó hasta ``stop`` (o hasta ahora)."""
+        end = self.stopped if self.stopped is not None else time.perf_counter()
+        return end - self.started
+
+    @property
+    def api_time(self):
+        """Tiempo total dentro de llamadas a la API (incluye normalización)."""
+        return float(sum(sum(durations) for durations in self._durations.values()))
+
+    @property
+    def num_calls(self):
+        return sum(len(durations) for durations in self._durations.values())
+
+    def to_dataframe(self):
+        """Retorna una fila por ruta, ordenada por tiempo total descendente."""
+        rows = []
+        for path, durations in self._durations.items():
+            values = np.asarray(durations)
+            total = float(values.sum())
+            p50, p90, p99 = np.percentile(values, [50, 90, 99]) * 1e3
+            rows.append({
+                "path": path,
+                "calls": len(values),
+                "total_s": total,
+                "backend_s": self._backend[path],
+                "normalize_s": max(total - self._backend[path], 0.0),
+                "mean_ms": total / len(values) * 1e3,
+                "p50_ms": p50,
+                "p90_ms": p90,
+                "p99_ms": p99,
+                "max_ms": float(values.max()) * 1e3,
+                "elements": self._elements[path],
+                "bytes": self._bytes[path],
+            })
+        data = pd.DataFrame(rows, columns=STATS_COLUMNS)
+        return data.sort_values("total_s", ascending=False).reset_index(drop=True)
+
+    def summary(self):
+        """Resumen del bloque medido: tiempo de pared, de API y resto (Python/pandas)."""
+        api_time = self.api_time
+        backend = float(sum(self._backend.values()))
+        return {
+            "elapsed_s": self.elapsed,
+            "api_s": api_time,
+            "backend_s": backend,
+            "normalize_s": max(api_time - backend, 0.0),
+            "other_s": max(self.elapsed - api_time, 0.0),
+            "calls": self.num_calls,
+        }
+
+    def to_chrome_trace(self):
+        """Retorna los eventos en formato Chrome Trace (microsegundos)."""
+        events = [
+            {
+                "name": path,
+                "cat": path.split(".", 1)[0],
+                "ph": "X",
+                "ts": (start - self.started) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": 1,
+                "tid": 1,
+            }
+            for path, start, end in self._events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export(self, path, format="json"):
+        """
+        Exporta las estadísticas a ``path``.
+
+        ``format="json"`` escribe resumen y tabla por ruta; ``format="chrome"``
+        escribe la traza de llamadas individuales.
+        """
+        if format == "chrome":
+            if not self.trace:
+                raise ValueError("La traza Chrome requiere CallStats(trace=True)")
+            payload = self.to_chrome_trace()
+        elif format == "json":
+            payload = {
+                "summary": self.summary(),
+                "paths": self.to_dataframe().to_dict(orient="records"),
+            }
+        else:
+            raise ValueError(f"Formato no válido: {format}. Use: json o chrome")
+        with open(path, "w", encoding="utf-8") as stream:
+            json.dump(payload, stream, indent=1)
+        return str(path)
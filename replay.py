@@ -0,0 +1,268 @@
+"""
+Grabación y reproducción de llamadas a la API CSI.
+
+``CallRecorder`` registra cada llamada resuelta por ``_CSIProxy`` (ruta,
+argumentos y resultado ya normalizado) y la guarda en un archivo ``.npz`` sin
+pickle: los arreglos numéricos van como arreglos NumPy y el resto de la
+estructura como un manifiesto JSON dentro del mismo archivo, de modo que se
+puede compartir entre equipos sin ejecutar código al leerlo. ``ReplayModel`` sirve esas respuestas sin ETABS/SAP2000/SAFE instalados, lo que
+permite ejecutar ``DataExtractor`` y ``ModelBuilder`` en cualquier sistema.
+"""
+
+import base64
+import json
+import time
+from functools import partial
+
+import numpy as np
+
+from .constants import EtabsError
+
+RECORDING_FORMAT = 2
+_MANIFEST = 'manifest'
+# Secuencias numéricas desde este largo se guardan como arreglo NumPy.
+_MIN_ARRAY_LENGTH = 8
+
+
+def _freeze(value):
+    """Convierte argumentos a una clave hashable y estable entre ejecuciones."""
+    if isinstance(value, (str, bytes, bool, int, float, type(None))):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), _freeze(item)) for key, item in value.items()))
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def _portable(value):
+    """Convierte resultados del backend a tipos Python/NumPy serializables."""
+    if isinstance(value, (str, bytes, bool, int, float, type(None), np.ndarray, np.generic)):
+        return value
+    if isinstance(value, tuple):
+        return tuple(_portable(item) for item in value)
+    if isinstance(value, list):
+        return [_portable(item) for item in value]
+    if hasattr(value, "__len__") and hasattr(value, "__iter__"):
+        # ``System.Array`` y colecciones COM.
+        return [_portable(item) for item in value]
+    for convert in (int, float):
+        try:
+            return convert(value)
+        except (TypeError, ValueError):
+            continue
+    return str(value)
+
+
+def _numeric_sequence(value):
+    """Retorna la secuencia como arreglo si es homogénea (solo float o solo int)."""
+    if len(value) < _MIN_ARRAY_LENGTH:
+        return None
+    first = type(value[0])
+    if first not in (float, int) or any(type(item) is not first for item in value):
+        return None
+    try:
+        return np.array(value, dtype=np.float64 if first is float else np.int64)
+    except OverflowError:
+        return None
+
+
+def _encode(value, arrays):
+    """Convierte un valor a JSON; los arreglos numéricos se agregan a ``arrays``."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, bytes):
+        return {'@bytes': base64.b64encode(value).decode('ascii')}
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind not in 'biufU':
+            return {'@objects': [_encode(item, arrays) for item in value.tolist()]}
+        name = f'a{len(arrays)}'
+        arrays[name] = value
+        return {'@array': name}
+    if isinstance(value, (tuple, list)):
+        container = 'tuple' if isinstance(value, tuple) else 'list'
+        numeric = _numeric_sequence(value)
+        if numeric is not None:
+            name = f'a{len(arrays)}'
+            arrays[name] = numeric
+            return {'@array': name, 'container': container}
+        items = [_encode(item, arrays) for item in value]
+        return {'@tuple': items} if container == 'tuple' else items
+    raise TypeError(f"Valor no serializable en la grabación: {type(value).__name__}")
+
+
+def _decode(value, arrays):
+    """Reconstruye un valor guardado con :func:`_encode`."""
+    if isinstance(value, list):
+        return [_decode(item, arrays) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if '@tuple' in value:
+        return tuple(_decode(item, arrays) for item in value['@tuple'])
+    if '@bytes' in value:
+        return base64.b64decode(value['@bytes'])
+    if '@objects' in value:
+        items = [_decode(item, arrays) for item in value['@objects']]
+        stored = np.empty(len(items), dtype=object)
+        stored[:] = items
+        return stored
+    stored = arrays[value['@array']]
+    container = value.get('container')
+    if container is None:
+        return stored
+    return tuple(stored.tolist()) if container == 'tuple' else stored.tolist()
+
+
+def call_key(args, kwargs):
+    """Clave de búsqueda de una llamada a partir de sus argumentos."""
+    if kwargs:
+        return _freeze(args), _freeze(kwargs)
+    return _freeze(args), ()
+
+
+class CallRecorder:
+    """
+    Observador de ``CSIAPIHelpers`` que registra las llamadas a la API.
+
+    Las llamadas repetidas con los mismos argumentos se guardan en orden para
+    reproducir también los cambios de estado del modelo.
+    """
+
+    def __init__(self, path, program=None, backend=None):
+        self.path = str(path)
+        self.program = program
+        self.backend = backend
+        self.calls = {}
+        self.num_calls = 0
+
+    def observe(self, path, args, kwargs, result, start, end, backend_s=None):
+        by_key = self.calls.setdefault(path, {})
+        by_key.setdefault(call_key(args, kwargs), []).append(_portable(result))
+        self.num_calls += 1
+
+    def save(self):
+        """Escribe la grabación en disco y retorna su ruta."""
+        arrays = {}
+        calls = {
+            path: [[_encode(key, arrays), _encode(results, arrays)]
+                   for key, results in by_key.items()]
+            for path, by_key in self.calls.items()
+        }
+        manifest = {
+            "format": RECORDING_FORMAT,
+            "program": self.program,
+            "backend": self.backend,
+            "num_calls": self.num_calls,
+            "calls": calls,
+        }
+        arrays[_MANIFEST] = np.array(json.dumps(manifest))
+        # Con un archivo abierto, NumPy no agrega la extensión .npz a la ruta
+        with open(self.path, "wb") as stream:
+            np.savez_compressed(stream, **arrays)
+        return self.path
+
+
+def load_recording(path):
+    """Lee una grabación creada por ``CallRecorder``."""
+    try:
+        with np.load(str(path), allow_pickle=False) as stored:
+            arrays = dict(stored)
+        manifest = json.loads(str(arrays.pop(_MANIFEST)))
+    except (OSError, ValueError, KeyError) as exc:
+        raise ValueError(f"Archivo de grabación no válido: {path}") from exc
+    if not isinstance(manifest, dict) or manifest.get("format") != RECORDING_FORMAT:
+        raise ValueError(f"Archivo de grabación no válido: {path}")
+    manifest["calls"] = {
+        name: {_decode(key, arrays): _decode(results, arrays) for key, results in entries}
+        for name, entries in manifest["calls"].items()
+    }
+    return manifest
+
+
+class ReplayModel:
+    """
+    Sirve llamadas grabadas con la misma forma que ``SapModel``.
+
+    ``latency`` agrega una espera fija (segundos) por llamada para simular el
+    costo de ida y vuelta COM/.NET. Con ``strict=False`` una llamada con
+    argumentos no grabados devuelve la última respuesta conocida de la misma ruta.
+    """
+
+    def __init__(self, recording, latency=0.0, strict=True):
+        if not isinstance(recording, dict):
+            recording = load_recording(recording)
+        self.program = recording.get("program")
+        self.source_backend = recording.get("backend")
+        self.calls = recording["calls"]
+        self.latency = float(latency or 0.0)
+        self.strict = strict
+        self.num_calls = 0
+        self._cursors = {}
+        self._objects = {""}
+        for path in self.calls:
+            parts = path.split(".")
+            for index in range(1, len(parts)):
+                self._objects.add(".".join(parts[:index]))
+
+    def is_object(self, path):
+        return path in self._objects and path not in self.calls
+
+    def call(self, path, *args, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        self.num_calls += 1
+        by_key = self.calls.get(path)
+        if by_key is None:
+            raise EtabsError(f"Llamada no grabada: {path}")
+        key = call_key(args, kwargs)
+        results = by_key.get(key)
+        if results is None:
+            if self.strict:
+                raise EtabsError(f"Llamada no grabada: {path}{args}")
+            results = list(by_key.values())[-1]
+        # Las llamadas repetidas avanzan en orden y se quedan en la última.
+        cursor_key = (path, key)
+        position = self._cursors.get(cursor_key, 0)
+        self._cursors[cursor_key] = position + 1
+        return results[min(position, len(results) - 1)]
+
+    def rewind(self):
+        """Reinicia el orden de las respuestas repetidas."""
+        self._cursors.clear()
+        self.num_calls = 0
+
+
+class _ReplayObject:
+    """Nodo intermedio del modelo reproducido (``PointObj``, ``Results``, ...)."""
+
+    def __init__(self, replay, path=""):
+        self._replay = replay
+        self._path = path
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        path = f"{self._path}.{name}" if self._path else name
+        if self._replay.is_object(path):
+            return _ReplayObject(self._replay, path)
+        return partial(self._replay.call, path)
+
+
+class _ReplayApplication:
+    """Equivalente mínimo de ``cOAPI`` para el backend de reproducción."""
+
+    def __init__(self, replay):
+        self.SapModel = _ReplayObject(replay)
+
+    def ApplicationStart(self, *args, **kwargs):
+        return 0
+
+    def ApplicationExit(self, *args, **kwargs):
+        return 0
@@ -0,0 +1,268 @@
+"""
+Almacenamiento columnar de resultados de elementos.
+
+``ResultStore`` acumula las respuestas de ``Results.FrameForce``,
+``Results.AreaForceShell``, ``Results.JointReact``, etc. como columnas NumPy:
+las columnas de texto (elemento, caso, tipo de paso) se guardan como códigos
+enteros más un arreglo de categorías y el resto como ``float64``. El
+``DataFrame`` se construye solo cuando se pide. ``ResultEnvelope`` reduce cada
+respuesta a máximos y mínimos por grupo al agregarla, sin guardar las filas.
+"""
+
+import numpy as np
+import pandas as pd
+
+_CODE_DTYPE = np.int32
+
+
+class _Categories:
+    """Diccionario incremental valor -> código para una columna categórica."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, values):
+        uniques, inverse = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+        mapping = np.empty(len(uniques), dtype=_CODE_DTYPE)
+        for position, value in enumerate(uniques):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.values)
+                self.values.append(str(value))
+            mapping[position] = code
+        return mapping[inverse.reshape(-1)]
+
+    def code(self, value):
+        return self.codes.get(str(value))
+
+    def array(self):
+        return np.array(self.values, dtype=object)
+
+
+class ResultStore:
+    """
+    Resultados tabulares con columnas NumPy tipadas.
+
+    ``fields`` asocia cada columna con su posición en la respuesta normalizada
+    de la API. ``categorical`` indica las columnas de texto y ``index`` hasta
+    tres columnas (elemento, caso, estación/punto) usadas por :meth:`rows`.
+    """
+
+    def __init__(self, fields, categorical=(), index=()):
+        self.fields = dict(fields)
+        self.columns = list(self.fields)
+        self.categorical = tuple(categorical)
+        self.index = tuple(index)
+        self._categories = {column: _Categories() for column in self.categorical}
+        self._chunks = {column: [] for column in self.columns}
+        self._data = None
+        self._order = None
+        self._keys = None
+
+    def append(self, result):
+        """Agrega las filas de una respuesta de la API."""
+        size = len(result[self.fields[self.columns[0]]])
+        if not size:
+            return
+        for column, position in self.fields.items():
+            values = result[position]
+            if column in self._categories:
+                values = self._categories[column].encode(values)
+            else:
+                values = np.asarray(values, dtype=float)
+            self._chunks[column].append(values)
+        self._data = self._order = self._keys = None
+
+    @property
+    def data(self):
+        """Columnas consolidadas: códigos ``int32`` o valores ``float64``."""
+        if self._data is None:
+            self._data = {}
+            for column in self.columns:
+                chunks = self._chunks[column]
+                dtype = _CODE_DTYPE if column in self._categories else float
+                values = np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype)
+                self._data[column] = values
+                self._chunks[column] = [values] if len(values) else []
+        return self._data
+
+    def __len__(self):
+        return len(self.data[self.columns[0]])
+
+    @property
+    def nbytes(self):
+        """Memoria aproximada de las columnas y categorías."""
+        size = sum(values.nbytes for values in self.data.values())
+        for categories in self._categories.values():
+            size += sum(len(value) + 49 for value in categories.values)
+        return size
+
+    def categories(self, column):
+        """Valores distintos de una columna categórica en orden de código."""
+        return self._categories[column].array()
+
+    def column(self, column, rows=None):
+        """Retorna una columna decodificada, opcionalmente en las filas ``rows``."""
+        values = self.data[column]
+        if rows is not None:
+            values = values[rows]
+        if column in self._categories:
+            return self.categories(column)[values]
+        return values
+
+    def _build_index(self):
+        data = self.data
+        levels = [data[column] for column in self.index]
+        self._order = np.lexsort(levels[::-1]) if levels else np.arange(len(self))
+        if len(levels) >= 2:
+            width = max(len(self._categories[self.index[1]].values), 1)
+            keys = data[self.index[0]].astype(np.int64) * width + data[self.index[1]]
+        elif levels:
+            keys = data[self.index[0]].astype(np.int64)
+        else:
+            keys = np.zeros(len(self), dtype=np.int64)
+        self._keys = keys[self._order]
+
+    def rows(self, element=None, case=None):
+        """
+        Posiciones de las filas de ``element`` (y ``case``) ordenadas por el índice.
+
+        Con ``element`` la búsqueda es binaria sobre las claves ordenadas; sin él
+        se filtra por ``case`` en toda la tabla.
+        """
+        if self._order is None:
+            self._build_index()
+        if element is None:
+            if case is None:
+                return self._order
+            if len(self.index) < 2:
+                raise ValueError("El índice no incluye una columna de caso.")
+            code = self._categories[self.index[1]].code(case)
+            if code is None:
+                return np.empty(0, dtype=np.intp)
+            return self._order[self.data[self.index[1]][self._order] == code]
+
+        element_code = self._categories[self.index[0]].code(element)
+        if element_code is None:
+            return np.empty(0, dtype=np.intp)
+        if len(self.index) < 2:
+            low = high = element_code
+        else:
+            width = max(len(self._categories[self.index[1]].values), 1)
+            low = element_code * width
+            high = low + width - 1
+            if case is not None:
+                case_code = self._categories[self.index[1]].code(case)
+                if case_code is None:
+                    return np.empty(0, dtype=np.intp)
+                low = high = low + case_code
+        start = np.searchsorted(self._keys, low, side='left')
+        end = np.searchsorted(self._keys, high, side='right')
+        return self._order[start:end]
+
+    def select(self, element=None, case=None, categorical=False):
+        """``DataFrame`` con las filas de :meth:`rows`."""
+        return self.to_dataframe(rows=self.rows(element, case), categorical=categorical)
+
+    def to_dataframe(self, rows=None, categorical=False):
+        """
+        Construye el ``DataFrame`` de resultados.
+
+        Con ``categorical=True`` las columnas de texto se devuelven como
+        ``pd.Categorical`` sin expandir los códigos.
+        """
+        frame = {}
+        for column in self.columns:
+            values = self.data[column] if rows is None else self.data[column][rows]
+            if column in self._categories and categorical:
+                values = pd.Categorical.from_codes(values, categories=self.categories(column))
+            elif column in self._categories:
+                values = self.categories(column)[values]
+            frame[column] = values
+        return pd.DataFrame(frame, columns=self.columns)
+
+
+class ResultEnvelope:
+    """
+    Envolvente de resultados reducida al agregar cada respuesta de la API.
+
+    ``fields`` tiene el formato de :class:`ResultStore`; ``keys`` son las
+    columnas de texto que definen cada grupo (p. ej. área y caso) y ``values``
+    las columnas numéricas de las que se guardan máximo y mínimo. Solo se
+    conservan los extremos por grupo, nunca las filas originales.
+    """
+
+    def __init__(self, fields, keys, values):
+        self.fields = dict(fields)
+        self.keys = tuple(keys)
+        self.values = tuple(values)
+        self.columns = list(self.keys) + ['StepType'] + list(self.values)
+        self._categories = {key: _Categories() for key in self.keys}
+        self._parts = []
+
+    @staticmethod
+    def _reduce(codes, maximum, minimum):
+        """Agrupa las columnas de ``codes`` y reduce los extremos de cada grupo."""
+        order = np.lexsort(codes[::-1])
+        codes = codes[:, order]
+        change = np.ones(codes.shape[1], dtype=bool)
+        change[1:] = (codes[:, 1:] != codes[:, :-1]).any(axis=0)
+        starts = np.flatnonzero(change)
+        return (codes[:, starts],
+                np.maximum.reduceat(maximum[:, order], starts, axis=1),
+                np.minimum.reduceat(minimum[:, order], starts, axis=1))
+
+    def append(self, result):
+        """Reduce las filas de una respuesta de la API y acumula sus extremos."""
+        size = len(result[self.fields[self.keys[0]]])
+        if not size:
+            return
+        codes = np.vstack([self._categories[key].encode(result[self.fields[key]])
+                           for key in self.keys])
+        values = np.vstack([np.asarray(result[self.fields[column]], dtype=float)
+                            for column in self.values])
+        self._parts.append(self._reduce(codes, values, values))
+
+    @property
+    def data(self):
+        """``(códigos, máximos, mínimos)`` por grupo, con una columna por grupo."""
+        if not self._parts:
+            return (np.empty((len(self.keys), 0), dtype=_CODE_DTYPE),
+                    np.empty((len(self.values), 0)), np.empty((len(self.values), 0)))
+        if len(self._parts) > 1:
+            codes, maximum, minimum = (np.concatenate(part, axis=1) for part in zip(*self._parts))
+            self._parts = [self._reduce(codes, maximum, minimum)]
+        return self._parts[0]
+
+    def __len__(self):
+        return self.data[0].shape[1]
+
+    @property
+    def nbytes(self):
+        """Memoria aproximada de los extremos y categorías."""
+        size = sum(values.nbytes for values in self.data)
+        for categories in self._categories.values():
+            size += sum(len(value) + 49 for value in categories.values)
+        return size
+
+    def to_dataframe(self, categorical=False):
+        """
+        ``DataFrame`` con dos filas por grupo: ``StepType`` ``Max`` y ``Min``.
+
+        Con ``categorical=True`` las columnas de texto se devuelven como
+        ``pd.Categorical``.
+        """
+        codes, maximum, minimum = self.data
+        frame = {}
+        for key, key_codes in zip(self.keys, codes):
+            key_codes = np.repeat(key_codes, 2)
+            categories = self._categories[key].array()
+            if categorical:
+                frame[key] = pd.Categorical.from_codes(key_codes, categories=categories)
+            else:
+                frame[key] = categories[key_codes]
+        frame['StepType'] = np.tile(np.array(['Max', 'Min'], dtype=object), codes.shape[1])
+        for column, high, low in zip(self.values, maximum, minimum):
+            frame[column] = np.column_stack([high, low]).ravel()
+        return pd.DataFrame(frame, columns=self.columns)
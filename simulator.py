@@ -0,0 +1,1392 @@
+"""
+Modelo CSI simulado en memoria.
+
+``SimulatedModel`` genera un edificio paramétrico (pisos x vanos) con columnas,
+vigas, losas, muros, grid, casos, combinaciones y resultados sintéticos, y
+expone las llamadas de ``SapModel`` que usa ``csi_py`` con la forma ya
+normalizada por ``CSIAPIHelpers``. Se selecciona con ``backend="simulated"``.
+
+Con ``api_shape="comtypes"`` o ``"dotnet"`` las respuestas se entregan con la
+forma cruda de ese backend (tuplas; o código de retorno primero y arreglos
+con protocolo buffer) y pasan por los wrappers especiales de los helpers.
+"""
+
+import array
+import os
+from collections import Counter
+from functools import partial, wraps
+
+import numpy as np
+
+from .constants import eItemTypeElm
+
+# Tablas de definición (ImportType 2: editables) y de resultados (ImportType 0).
+_DEFINITION_TABLES = {
+    "Story Definitions": "_table_stories",
+    "Grid Definitions - Grid Lines": "_table_grid_lines",
+    "Frame Section Property Definitions - Concrete Rectangular": "_table_frame_sections",
+    "Joint Assignments - Restraints": "_table_restraints",
+    "Joint Assignments - Diaphragms": "_table_diaphragms",
+    "Frame Assignments - Section Properties": "_table_frame_assignments",
+    "Point Object Connectivity": "_table_points",
+    "Column Object Connectivity": "_table_columns",
+    "Beam Object Connectivity": "_table_beams",
+    "Floor Object Connectivity": "_table_floors",
+    "Wall Object Connectivity": "_table_walls",
+    "Load Combination Definitions": "_table_combos",
+}
+# Tablas filtrables por ``GroupName``: tipo de objeto de su columna ``UniqueName``.
+_GROUP_TABLES = {
+    "Element Forces - Columns": "frames",
+    "Element Forces - Beams": "frames",
+    "Joint Reactions": "points",
+    "Joint Assignments - Restraints": "points",
+}
+_SUMMARY_TABLES = {
+    "Frame Section Property Definitions - Summary": "_table_frame_summary",
+    "Load Case Definitions - Summary": "_table_cases",
+}
+_RESULT_TABLES = {
+    "Element Forces - Columns": "_table_column_forces",
+    "Element Forces - Beams": "_table_beam_forces",
+    "Joint Reactions": "_table_joint_reactions",
+    "Modal Participating Mass Ratios": "_table_modal",
+}
+
+_COLUMN, _BEAM = 0, 1
+_WALL, _FLOOR = 1, 2
+_STATIONS = np.array([0.0, 0.5, 1.0])
+_NUM_MODES = 12
+# Campos de resultados que no escalan con el factor del caso.
+_FACTOR_FREE = {"ObjSta", "StepNum"}
+
+API_SHAPES = ("comtypes", "dotnet")
+# Respuestas cuya forma dotnet no es la rotación de la forma normalizada.
+_DOTNET_RESULTS = {
+    # El wrapper agrega FillImportLog; la API devuelve ret y los contadores.
+    "DatabaseTables.ApplyEditedTables": lambda result: (result[-1],) + tuple(result[1:-1]),
+}
+# ``array.array`` con el mismo layout que los ``System.Array`` de pythonnet.
+_NET_TYPECODES = {"f": "d", "i": "i", "u": "i", "b": "b"}
+
+
+def _count_calls(path, method):
+    @wraps(method)
+    def counted(self, *args, **kwargs):
+        self._sim.calls[path] += 1
+        return method(self, *args, **kwargs)
+    return counted
+
+
+def _counted(cls):
+    """Registra en ``SimulatedModel.calls`` cada llamada a métodos de la API."""
+    for name, member in list(vars(cls).items()):
+        if name[:1].isupper() and callable(member):
+            path = f"{cls._path}.{name}" if cls._path else name
+            setattr(cls, name, _count_calls(path, member))
+    return cls
+
+
+def _str_array(values):
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def _fmt(values):
+    """Formatea valores numéricos como texto, igual que las tablas CSI."""
+    return np.char.mod("%.6g", np.asarray(values, dtype=float)).astype(object)
+
+
+def _flatten_table(columns, field_keys=""):
+    """Aplana ``{campo: textos}`` al formato ``TableData`` fila por fila."""
+    if field_keys:
+        fields = [field for field in field_keys if field in columns]
+    else:
+        fields = list(columns)
+    num_records = len(columns[fields[0]]) if fields else 0
+    if not num_records:
+        return fields, 0, []
+    return fields, num_records, np.column_stack([columns[field] for field in fields]).ravel().tolist()
+
+
+class _SimComponent:
+    _path = ""
+
+    def __init__(self, sim):
+        self._sim = sim
+
+
+@_counted
+class _SimFile(_SimComponent):
+    _path = "File"
+
+    def OpenFile(self, file_path, *args, **kwargs):
+        self._sim.file_path = file_path
+        return 0
+
+    def Save(self, file_path="", *args, **kwargs):
+        if file_path:
+            self._sim.file_path = file_path
+        # Un guardado real reescribe el archivo: si existe, se actualiza su fecha.
+        if os.path.isfile(self._sim.file_path):
+            os.utime(self._sim.file_path)
+        return 0
+
+    def NewBlank(self, *args, **kwargs):
+        return 0
+
+
+@_counted
+class _SimView(_SimComponent):
+    _path = "View"
+
+    def RefreshView(self, *args, **kwargs):
+        return 0
+
+
+@_counted
+class _SimAnalyze(_SimComponent):
+    _path = "Analyze"
+
+    def RunAnalysis(self, *args, **kwargs):
+        self._sim.analyzed = True
+        return 0
+
+
+@_counted
+class _SimSelectObj(_SimComponent):
+    _path = "SelectObj"
+
+    def GetSelected(self, *args, **kwargs):
+        return 0, (), (), 0
+
+
+@_counted
+class _SimStory(_SimComponent):
+    _path = "Story"
+
+    def GetStories(self, *args, **kwargs):
+        sim = self._sim
+        count = len(sim.story_names)
+        return (
+            count,
+            _str_array(sim.story_names),
+            sim.elevations.copy(),
+            sim.heights.copy(),
+            np.zeros(count, dtype=bool),
+            _str_array(["None"] * count),
+            np.zeros(count, dtype=bool),
+            np.zeros(count),
+            0,
+        )
+
+    def GetHeight(self, story_name, *args, **kwargs):
+        index = self._sim._story_index.get(story_name)
+        if index is None:
+            return 0.0, 1
+        return float(self._sim.heights[index]), 0
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.story_names), list(self._sim.story_names), 0
+
+
+@_counted
+class _SimGridSys(_SimComponent):
+    _path = "GridSys"
+
+    def GetNameList(self, *args, **kwargs):
+        return 1, [self._sim.grid_name], 0
+
+
+@_counted
+class _SimPointObj(_SimComponent):
+    _path = "PointObj"
+
+    def Count(self, *args, **kwargs):
+        return len(self._sim.point_names)
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.point_names), list(self._sim.point_names), 0
+
+    def GetNameListOnStory(self, story_name, *args, **kwargs):
+        sim = self._sim
+        level = sim._story_index.get(story_name)
+        if level is None:
+            return 0, [], 1
+        names = sim.point_names[level * sim.points_per_level:(level + 1) * sim.points_per_level]
+        return len(names), list(names), 0
+
+    def SetGroupAssign(self, name, group_name, remove=False, *args, **kwargs):
+        return self._sim._assign_group("points", self._sim._point_index, name, group_name, remove)
+
+    def GetAllPoints(self, *args, **kwargs):
+        sim = self._sim
+        return (
+            len(sim.point_names), _str_array(sim.point_names),
+            sim.point_x.copy(), sim.point_y.copy(), sim.point_z.copy(), 0,
+        )
+
+    def GetCoordCartesian(self, name, *args, **kwargs):
+        index = self._sim._point_index.get(name)
+        if index is None:
+            return 0.0, 0.0, 0.0, 1
+        return float(self._sim.point_x[index]), float(self._sim.point_y[index]), float(self._sim.point_z[index]), 0
+
+    def GetRestraint(self, name, *args, **kwargs):
+        index = self._sim._point_index.get(name)
+        if index is None:
+            return (False,) * 6, 1
+        return (bool(self._sim.point_restrained[index]),) * 6, 0
+
+    def GetDiaphragm(self, name, *args, **kwargs):
+        index = self._sim._point_index.get(name)
+        if index is None:
+            return 1, "", 1
+        if self._sim.point_level[index] == 0:
+            return 1, "", 0
+        return 3, self._sim.diaphragm_name, 0
+
+
+@_counted
+class _SimFrameObj(_SimComponent):
+    _path = "FrameObj"
+
+    def Count(self, *args, **kwargs):
+        return len(self._sim.frame_names)
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.frame_names), list(self._sim.frame_names), 0
+
+    def GetNameListOnStory(self, story_name, *args, **kwargs):
+        sim = self._sim
+        if story_name not in sim._story_index:
+            return 0, [], 1
+        names = [sim.frame_names[k] for k in np.flatnonzero(sim.frame_story == story_name)]
+        return len(names), names, 0
+
+    def SetGroupAssign(self, name, group_name, remove=False, *args, **kwargs):
+        return self._sim._assign_group("frames", self._sim._frame_index, name, group_name, remove)
+
+    def GetLabelNameList(self, *args, **kwargs):
+        sim = self._sim
+        return (
+            len(sim.frame_names),
+            list(sim.frame_names),
+            list(sim.frame_label),
+            list(sim.frame_story),
+            0,
+        )
+
+    def GetAllFrames(self, *args, **kwargs):
+        sim = self._sim
+        count = len(sim.frame_names)
+        zeros = np.zeros(count)
+        return (
+            count,
+            _str_array(sim.frame_names),
+            sim.frame_section.copy(),
+            sim.frame_story.copy(),
+            _str_array([sim.point_names[k] for k in sim.frame_i]),
+            _str_array([sim.point_names[k] for k in sim.frame_j]),
+            sim.point_x[sim.frame_i], sim.point_y[sim.frame_i], sim.point_z[sim.frame_i],
+            sim.point_x[sim.frame_j], sim.point_y[sim.frame_j], sim.point_z[sim.frame_j],
+            zeros, zeros.copy(), zeros.copy(), zeros.copy(), zeros.copy(), zeros.copy(), zeros.copy(),
+            np.full(count, 10, dtype=np.int64),
+            0,
+        )
+
+    def GetSection(self, name, *args, **kwargs):
+        index = self._sim._frame_index.get(name)
+        if index is None:
+            return "", "", 1
+        return self._sim.frame_section[index], "", 0
+
+    def GetPoints(self, name, *args, **kwargs):
+        sim = self._sim
+        index = sim._frame_index.get(name)
+        if index is None:
+            return "", "", 1
+        return sim.point_names[sim.frame_i[index]], sim.point_names[sim.frame_j[index]], 0
+
+
+@_counted
+class _SimAreaObj(_SimComponent):
+    _path = "AreaObj"
+
+    def Count(self, *args, **kwargs):
+        return len(self._sim.area_names)
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.area_names), list(self._sim.area_names), 0
+
+    def GetNameListOnStory(self, story_name, *args, **kwargs):
+        sim = self._sim
+        if story_name not in sim._story_index:
+            return 0, [], 1
+        names = [sim.area_names[k] for k in np.flatnonzero(sim.area_story == story_name)]
+        return len(names), names, 0
+
+    def SetGroupAssign(self, name, group_name, remove=False, *args, **kwargs):
+        return self._sim._assign_group("areas", self._sim._area_index, name, group_name, remove)
+
+    def GetAllAreas(self, *args, **kwargs):
+        sim = self._sim
+        corners = sim.area_points.ravel()
+        count = len(sim.area_names)
+        return (
+            count,
+            _str_array(sim.area_names),
+            sim.area_orientation.astype(np.int64),
+            corners.size,
+            np.arange(1, count + 1, dtype=np.int64) * 4 - 1,
+            _str_array([sim.point_names[i] for i in corners]),
+            sim.point_x[corners],
+            sim.point_y[corners],
+            sim.point_z[corners],
+            0,
+        )
+
+    def GetProperty(self, name, *args, **kwargs):
+        index = self._sim._area_index.get(name)
+        if index is None:
+            return "", 1
+        return self._sim.area_section[index], 0
+
+    def GetPoints(self, name, *args, **kwargs):
+        sim = self._sim
+        index = sim._area_index.get(name)
+        if index is None:
+            return 0, [], 1
+        return 4, [sim.point_names[i] for i in sim.area_points[index]], 0
+
+
+@_counted
+class _SimPropFrame(_SimComponent):
+    _path = "PropFrame"
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.frame_sections), list(self._sim.frame_sections), 0
+
+    def GetSectProps(self, name, *args, **kwargs):
+        dims = self._sim.frame_sections.get(name)
+        if dims is None:
+            return (0.0,) * 12 + (1,)
+        t3, t2 = dims
+        area = t3 * t2
+        i33 = t2 * t3 ** 3 / 12
+        i22 = t3 * t2 ** 3 / 12
+        torsion = min(t2, t3) ** 3 * max(t2, t3) / 3
+        return (
+            area, area * 5 / 6, area * 5 / 6, torsion, i22, i33,
+            i22 / (t2 / 2), i33 / (t3 / 2), t3 * t2 ** 2 / 4, t2 * t3 ** 2 / 4,
+            (i22 / area) ** 0.5, (i33 / area) ** 0.5, 0,
+        )
+
+
+@_counted
+class _SimPropArea(_SimComponent):
+    _path = "PropArea"
+
+    def GetNameList(self, *args, **kwargs):
+        names = sorted(set(self._sim.area_section))
+        return len(names), names, 0
+
+
+@_counted
+class _SimGroupDef(_SimComponent):
+    _path = "GroupDef"
+
+    def GetNameList(self, *args, **kwargs):
+        names = ["All"] + list(self._sim.groups)
+        return len(names), names, 0
+
+    def SetGroup(self, name, *args, **kwargs):
+        if str(name).upper() != "ALL":
+            self._sim.groups.setdefault(name, {"points": set(), "frames": set(), "areas": set()})
+        return 0
+
+    def Delete(self, name, *args, **kwargs):
+        return 0 if self._sim.groups.pop(name, None) is not None else 1
+
+
+@_counted
+class _SimPierLabel(_SimComponent):
+    _path = "PierLabel"
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.pier_names), list(self._sim.pier_names), 0
+
+
+@_counted
+class _SimLoadPatterns(_SimComponent):
+    _path = "LoadPatterns"
+
+    def GetNameList(self, *args, **kwargs):
+        names = [name for name, case in self._sim.cases.items() if case["case_type"] == 1]
+        return len(names), names, 0
+
+    def GetLoadType(self, name, *args, **kwargs):
+        case = self._sim.cases.get(name)
+        if case is None:
+            return 0, 1
+        return case["design_type"], 0
+
+    def GetSelfWTMultiplier(self, name, *args, **kwargs):
+        return (1.0 if name == "Dead" else 0.0), 0
+
+
+@_counted
+class _SimLoadCases(_SimComponent):
+    _path = "LoadCases"
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.cases), list(self._sim.cases), 0
+
+    def GetTypeOAPI_1(self, name, *args, **kwargs):
+        case = self._sim.cases.get(name)
+        if case is None:
+            return 0, 0, 0, 0, 0, 1
+        return case["case_type"], 0, case["design_type"], 0, 0, 0
+
+
+@_counted
+class _SimRespCombo(_SimComponent):
+    _path = "RespCombo"
+
+    def GetNameList(self, *args, **kwargs):
+        return len(self._sim.combos), list(self._sim.combos), 0
+
+    def GetTypeOAPI(self, name, *args, **kwargs):
+        combo = self._sim.combos.get(name)
+        if combo is None:
+            return 0, 1
+        return combo["combo_type"], 0
+
+    def Add(self, name, combo_type=0, *args, **kwargs):
+        if name in self._sim.combos or name in self._sim.cases:
+            return 1
+        self._sim.combos[name] = {"combo_type": int(combo_type), "items": []}
+        return 0
+
+    def SetCaseList(self, name, cname_type, case_name, scale_factor, *args, **kwargs):
+        combo = self._sim.combos.get(name)
+        catalog = self._sim.combos if int(cname_type) == 1 else self._sim.cases
+        if combo is None or case_name not in catalog:
+            return 1
+        items = [item for item in combo["items"] if item[0] != case_name]
+        combo["items"] = items + [(case_name, float(scale_factor))]
+        return 0
+
+    def GetCaseList(self, name, *args, **kwargs):
+        combo = self._sim.combos.get(name)
+        if combo is None:
+            return 0, [], [], [], 1
+        items = combo["items"]
+        return (
+            len(items),
+            [1 if case_name in self._sim.combos else 0 for case_name, _ in items],
+            [case_name for case_name, _ in items],
+            [float(factor) for _, factor in items],
+            0,
+        )
+
+
+@_counted
+class _SimResultsSetup(_SimComponent):
+    _path = "Results.Setup"
+
+    def DeselectAllCasesAndCombosForOutput(self, *args, **kwargs):
+        self._sim.output_selection.clear()
+        return 0
+
+    def SetCaseSelectedForOutput(self, name, selected=True, *args, **kwargs):
+        return self._sim._select_output(name, selected, self._sim.cases)
+
+    def SetComboSelectedForOutput(self, name, selected=True, *args, **kwargs):
+        return self._sim._select_output(name, selected, self._sim.combos)
+
+
+@_counted
+class _SimResults(_SimComponent):
+    _path = "Results"
+
+    def __init__(self, sim):
+        super().__init__(sim)
+        self.Setup = _SimResultsSetup(sim)
+
+    def FrameForce(self, name, item_type=0, *args, **kwargs):
+        sim = self._sim
+        frames = sim._resolve_items(name, item_type, sim._frame_index, "frames")
+        if frames is None or not sim.analyzed:
+            return (0,) + ((),) * 13 + (1,)
+        block = sim._result_block(partial(sim._frame_force_block, frames), sim._selected_outputs())
+        names = block["Obj"]
+        return (
+            len(names), names, block["ObjSta"], names.copy(), block["ObjSta"].copy(),
+            block["LoadCase"], block["StepType"], block["StepNum"],
+            block["P"], block["V2"], block["V3"], block["T"], block["M2"], block["M3"], 0,
+        )
+
+    def JointReact(self, name, item_type=0, *args, **kwargs):
+        sim = self._sim
+        points = sim._resolve_items(name, item_type, sim._point_index, "points")
+        if points is None or not sim.analyzed:
+            return (0,) + ((),) * 11 + (1,)
+        points = points[sim.point_restrained[points]]
+        block = sim._result_block(partial(sim._joint_block, points, reactions=True), sim._selected_outputs())
+        return (
+            len(block["Obj"]), block["Obj"], block["Obj"].copy(), block["LoadCase"],
+            block["StepType"], block["StepNum"],
+            block["F1"], block["F2"], block["F3"], block["M1"], block["M2"], block["M3"], 0,
+        )
+
+    def JointDispl(self, name, item_type=0, *args, **kwargs):
+        sim = self._sim
+        points = sim._resolve_items(name, item_type, sim._point_index, "points")
+        if points is None or not sim.analyzed:
+            return (0,) + ((),) * 11 + (1,)
+        block = sim._result_block(partial(sim._joint_block, points, reactions=False), sim._selected_outputs())
+        return (
+            len(block["Obj"]), block["Obj"], block["Obj"].copy(), block["LoadCase"],
+            block["StepType"], block["StepNum"],
+            block["F1"], block["F2"], block["F3"], block["M1"], block["M2"], block["M3"], 0,
+        )
+
+    def AreaForceShell(self, name, item_type=0, *args, **kwargs):
+        sim = self._sim
+        areas = sim._resolve_items(name, item_type, sim._area_index, "areas")
+        if areas is None or not sim.analyzed:
+            return (0,) + ((),) * 23 + (1,)
+        block = sim._result_block(partial(sim._area_force_block, areas), sim._selected_outputs())
+        return (len(block["Obj"]),) + tuple(block[key] for key in sim._AREA_FORCE_KEYS) + (0,)
+
+    def PierForce(self, *args, **kwargs):
+        sim = self._sim
+        if not sim.analyzed:
+            return (0,) + ((),) * 10 + (1,)
+        block = sim._result_block(sim._pier_force_block, sim._selected_outputs())
+        return (
+            len(block["Story"]), block["Story"], block["Pier"], block["LoadCase"], block["Location"],
+            block["P"], block["V2"], block["V3"], block["T"], block["M2"], block["M3"], 0,
+        )
+
+    def ModalParticipatingMassRatios(self, *args, **kwargs):
+        sim = self._sim
+        if not sim.analyzed:
+            return (0,) + ((),) * 16 + (1,)
+        block = sim._modal_block(sim._output_names())
+        return (len(block["LoadCase"]),) + tuple(block[key] for key in sim._MODAL_KEYS) + (0,)
+
+
+@_counted
+class _SimDatabaseTables(_SimComponent):
+    _path = "DatabaseTables"
+
+    def GetAvailableTables(self, *args, **kwargs):
+        tables = (
+            [(name, 2) for name in _DEFINITION_TABLES]
+            + [(name, 1) for name in _SUMMARY_TABLES]
+            + [(name, 0) for name in _RESULT_TABLES]
+        )
+        names = [name for name, _ in tables]
+        return len(tables), names, list(names), [import_type for _, import_type in tables], 0
+
+    def SetLoadCasesSelectedForDisplay(self, names, *args, **kwargs):
+        self._sim.display_cases = set(names or ())
+        return 0
+
+    def SetLoadCombinationsSelectedForDisplay(self, names, *args, **kwargs):
+        self._sim.display_combos = set(names or ())
+        return 0
+
+    def SetOutputOptionsForDisplay(self, *args, **kwargs):
+        return 0
+
+    def GetTableForDisplayArray(self, table_name, FieldKeyList="", GroupName="", *args, **kwargs):
+        sim = self._sim
+        builder = (
+            _DEFINITION_TABLES.get(table_name)
+            or _SUMMARY_TABLES.get(table_name)
+            or _RESULT_TABLES.get(table_name)
+        )
+        if builder is None:
+            return FieldKeyList, 0, [], 0, [], -96
+        group = None
+        if GroupName and str(GroupName).upper() != "ALL":
+            group = sim.groups.get(GroupName)
+            if group is None:
+                return FieldKeyList, 0, [], 0, [], -1
+        if table_name in _RESULT_TABLES and not sim.analyzed:
+            return FieldKeyList, 0, [], 0, [], 1
+        columns = getattr(sim, builder)()
+        if group is not None and table_name in _GROUP_TABLES:
+            members = group[_GROUP_TABLES[table_name]]
+            keep = np.isin(columns["UniqueName"], _str_array(sorted(members)))
+            columns = {field: values[keep] for field, values in columns.items()}
+        fields, num_records, table_data = _flatten_table(columns, FieldKeyList)
+        return FieldKeyList, 1, fields, num_records, table_data, 0
+
+    def GetTableForEditingArray(self, table_name, GroupName="", *args, **kwargs):
+        builder = _DEFINITION_TABLES.get(table_name)
+        if builder is None:
+            return 0, [], 0, [], -96
+        fields, num_records, table_data = _flatten_table(getattr(self._sim, builder)())
+        return 1, fields, num_records, table_data, 0
+
+    def SetTableForEditingArray(self, table_name, table_version, fields, number_records, table_data, *args, **kwargs):
+        if table_name not in _DEFINITION_TABLES:
+            return table_version, 1
+        if len(table_data) != int(number_records) * len(fields):
+            return table_version, 1
+        # Las ediciones quedan registradas pero no modifican la geometría simulada.
+        self._sim.edited_tables[table_name] = (list(fields), int(number_records), list(table_data))
+        return table_version, 0
+
+    def ApplyEditedTables(self, fill_import_log, *args, **kwargs):
+        self._sim.edited_tables.clear()
+        return bool(fill_import_log), 0, 0, 0, 0, "", 0
+
+
+@_counted
+class SimulatedModel(_SimComponent):
+    """
+    ``SapModel`` sintético para pruebas de escala sin programa CSI.
+
+    El edificio tiene ``stories`` pisos y ``bays_x`` x ``bays_y`` vanos:
+    columnas en cada intersección de grid, vigas en ambas direcciones, una losa
+    por vano y ``walls`` paños de muro sobre el primer eje Y. ``calls`` cuenta
+    las llamadas recibidas por ruta.
+    """
+
+    _path = ""
+    _AREA_FORCE_KEYS = (
+        "Obj", "Elm", "PointElm", "LoadCase", "StepType", "StepNum",
+        "F11", "F22", "F12", "FMax", "FMin", "FAngle", "FVM",
+        "M11", "M22", "M12", "MMax", "MMin", "MAngle",
+        "V13", "V23", "VMax", "VAngle",
+    )
+    _MODAL_KEYS = (
+        "LoadCase", "StepType", "StepNum", "Period", "UX", "UY", "UZ",
+        "SumUX", "SumUY", "SumUZ", "RX", "RY", "RZ", "SumRX", "SumRY", "SumRZ",
+    )
+
+    def __init__(self, stories=10, bays_x=4, bays_y=4, bay_x=6.0, bay_y=6.0,
+                 story_height=3.0, walls=1, analyzed=True):
+        if stories < 1 or bays_x < 1 or bays_y < 1:
+            raise ValueError("El modelo simulado requiere al menos un piso y un vano por dirección")
+        self._sim = self
+        self.calls = Counter()
+        self.file_path = "simulated.edb"
+        self.units = None
+        self.analyzed = analyzed
+        self.output_selection = []
+        self.display_cases = set()
+        self.display_combos = set()
+        self.edited_tables = {}
+        self.groups = {}
+        self.grid_name = "G1"
+        self.diaphragm_name = "D1"
+
+        self._build_geometry(stories, bays_x, bays_y, bay_x, bay_y, story_height, min(walls, bays_x))
+        self._build_loads()
+
+        self.File = _SimFile(self)
+        self.View = _SimView(self)
+        self.Analyze = _SimAnalyze(self)
+        self.SelectObj = _SimSelectObj(self)
+        self.Story = _SimStory(self)
+        self.GridSys = _SimGridSys(self)
+        self.PointObj = _SimPointObj(self)
+        self.FrameObj = _SimFrameObj(self)
+        self.AreaObj = _SimAreaObj(self)
+        self.PropFrame = _SimPropFrame(self)
+        self.PropArea = _SimPropArea(self)
+        self.GroupDef = _SimGroupDef(self)
+        self.PierLabel = _SimPierLabel(self)
+        self.LoadPatterns = _SimLoadPatterns(self)
+        self.LoadCases = _SimLoadCases(self)
+        self.RespCombo = _SimRespCombo(self)
+        self.Results = _SimResults(self)
+        self.DatabaseTables = _SimDatabaseTables(self)
+
+    # ---------------------------- API raíz ----------------------------
+
+    def GetModelFilename(self, *args, **kwargs):
+        return self.file_path
+
+    def GetModelIsLocked(self, *args, **kwargs):
+        return self.analyzed
+
+    def SetPresentUnits(self, units, *args, **kwargs):
+        self.units = int(units)
+        return 0
+
+    def GetPresentUnits(self, *args, **kwargs):
+        return self.units
+
+    def InitializeNewModel(self, *args, **kwargs):
+        return 0
+
+    @property
+    def num_calls(self):
+        return sum(self.calls.values())
+
+    # ---------------------------- geometría ----------------------------
+
+    def _build_geometry(self, stories, bays_x, bays_y, bay_x, bay_y, story_height, walls):
+        nxp, nyp = bays_x + 1, bays_y + 1
+        per_level = nxp * nyp
+        levels = stories + 1
+        self.points_per_level = per_level
+
+        self.story_names = ["Base"] + [f"Story{i}" for i in range(1, levels)]
+        self._story_index = {name: i for i, name in enumerate(self.story_names)}
+        self.elevations = np.arange(levels) * float(story_height)
+        self.heights = np.full(levels, float(story_height))
+        self.heights[0] = 0.0
+        self.grid_x = [(chr(ord("A") + i) if i < 26 else f"X{i + 1}", i * float(bay_x)) for i in range(nxp)]
+        self.grid_y = [(str(j + 1), j * float(bay_y)) for j in range(nyp)]
+
+        gi, gj = np.meshgrid(np.arange(nxp), np.arange(nyp), indexing="ij")
+        gi, gj = gi.ravel(), gj.ravel()
+        self.point_names = [str(i + 1) for i in range(per_level * levels)]
+        self._point_index = {name: i for i, name in enumerate(self.point_names)}
+        self.point_x = np.tile(gi * float(bay_x), levels)
+        self.point_y = np.tile(gj * float(bay_y), levels)
+        self.point_z = np.repeat(self.elevations, per_level)
+        self.point_level = np.repeat(np.arange(levels), per_level)
+        self.point_label = _str_array([str(k + 1) for k in range(per_level)] * levels)
+        self.point_restrained = self.point_level == 0
+
+        # Índices dentro de un nivel de vigas en X (i -> i+1) y en Y (j -> j+1).
+        grid = np.arange(per_level).reshape(nxp, nyp)
+        beam_x = np.column_stack([grid[:-1, :].ravel(), grid[1:, :].ravel()])
+        beam_y = np.column_stack([grid[:, :-1].ravel(), grid[:, 1:].ravel()])
+        beams = np.vstack([beam_x, beam_y])
+        bays = np.column_stack([
+            grid[:-1, :-1].ravel(), grid[1:, :-1].ravel(),
+            grid[1:, 1:].ravel(), grid[:-1, 1:].ravel(),
+        ])
+        wall_bays = np.column_stack([grid[:walls, 0], grid[1:walls + 1, 0]])
+
+        frame_i, frame_j, frame_kind, frame_label, frame_story = [], [], [], [], []
+        area_points, area_orientation, area_label, area_story = [], [], [], []
+        column_labels = [f"C{k + 1}" for k in range(per_level)]
+        beam_labels = [f"B{k + 1}" for k in range(len(beams))]
+        floor_labels = [f"F{k + 1}" for k in range(len(bays))]
+        wall_labels = [f"W{k + 1}" for k in range(walls)]
+        for level in range(1, levels):
+            top, bottom = level * per_level, (level - 1) * per_level
+            story = self.story_names[level]
+            frame_i.append(bottom + np.arange(per_level))
+            frame_j.append(top + np.arange(per_level))
+            frame_kind.append(np.full(per_level, _COLUMN))
+            frame_label += column_labels
+            frame_i.append(top + beams[:, 0])
+            frame_j.append(top + beams[:, 1])
+            frame_kind.append(np.full(len(beams), _BEAM))
+            frame_label += beam_labels
+            frame_story += [story] * (per_level + len(beams))
+
+            area_points.append(top + bays)
+            area_orientation.append(np.full(len(bays), _FLOOR))
+            area_label += floor_labels
+            if walls:
+                area_points.append(np.column_stack([
+                    bottom + wall_bays[:, 0], bottom + wall_bays[:, 1],
+                    top + wall_bays[:, 1], top + wall_bays[:, 0],
+                ]))
+                area_orientation.append(np.full(walls, _WALL))
+                area_label += wall_labels
+            area_story += [story] * (len(bays) + walls)
+
+        self.frame_i = np.concatenate(frame_i)
+        self.frame_j = np.concatenate(frame_j)
+        self.frame_kind = np.concatenate(frame_kind)
+        self.frame_label = _str_array(frame_label)
+        self.frame_story = _str_array(frame_story)
+        self.frame_names = [str(k + 1) for k in range(len(self.frame_i))]
+        self._frame_index = {name: k for k, name in enumerate(self.frame_names)}
+        self.frame_length = np.sqrt(
+            (self.point_x[self.frame_j] - self.point_x[self.frame_i]) ** 2
+            + (self.point_y[self.frame_j] - self.point_y[self.frame_i]) ** 2
+            + (self.point_z[self.frame_j] - self.point_z[self.frame_i]) ** 2
+        )
+        self.frame_sections = {"C50x50": (0.5, 0.5), "V30x60": (0.6, 0.3)}
+        self.frame_section = _str_array(np.where(self.frame_kind == _COLUMN, "C50x50", "V30x60"))
+
+        self.area_points = np.vstack(area_points)
+        self.area_orientation = np.concatenate(area_orientation)
+        self.area_label = _str_array(area_label)
+        self.area_story = _str_array(area_story)
+        self.area_names = [str(k + 1) for k in range(len(self.area_points))]
+        self._area_index = {name: k for k, name in enumerate(self.area_names)}
+        self.area_section = _str_array(np.where(self.area_orientation == _WALL, "Muro25", "Losa20"))
+        self.pier_names = [f"P{k + 1}" for k in range(walls)]
+
+    def _build_loads(self):
+        # Factor de escala de cada caso base sobre la respuesta sintética unitaria.
+        self.cases = {
+            "Dead": {"case_type": 1, "design_type": 1, "factor": 1.0},
+            "Live": {"case_type": 1, "design_type": 3, "factor": 0.5},
+            "SX": {"case_type": 1, "design_type": 5, "factor": 0.8},
+            "SY": {"case_type": 1, "design_type": 5, "factor": 0.6},
+            "Modal": {"case_type": 3, "design_type": 8, "factor": 0.0},
+            "SDX": {"case_type": 4, "design_type": 5, "factor": 0.7},
+        }
+        self.combos = {
+            "1.4D+1.7L": {"combo_type": 0, "items": [("Dead", 1.4), ("Live", 1.7)]},
+            "D+L+SX": {"combo_type": 0, "items": [("Dead", 1.25), ("Live", 1.25), ("SX", 1.0)]},
+            "D+L-SX": {"combo_type": 0, "items": [("Dead", 1.25), ("Live", 1.25), ("SX", -1.0)]},
+            "D+L+SY": {"combo_type": 0, "items": [("Dead", 1.25), ("Live", 1.25), ("SY", 1.0)]},
+            "D+L-SY": {"combo_type": 0, "items": [("Dead", 1.25), ("Live", 1.25), ("SY", -1.0)]},
+        }
+        self.combos["Envolvente"] = {
+            "combo_type": 1,
+            "items": [(name, 1.0) for name in list(self.combos)],
+        }
+        # Combinación con espectro: CSI suma la parte estática y +/- la magnitud espectral.
+        self.combos["1.25D+SDX"] = {"combo_type": 0, "items": [("Dead", 1.25), ("SDX", 1.0)]}
+
+    # ---------------------------- selección ----------------------------
+
+    def _output_names(self):
+        """Salidas seleccionadas en el orden del modelo (casos y luego combinaciones), como CSI."""
+        selected = set(self.output_selection)
+        return [name for name in list(self.cases) + list(self.combos) if name in selected]
+
+    def _select_output(self, name, selected, catalog):
+        if name not in catalog:
+            return 1
+        if selected and name not in self.output_selection:
+            self.output_selection.append(name)
+        elif not selected and name in self.output_selection:
+            self.output_selection.remove(name)
+        return 0
+
+    def _assign_group(self, kind, index, name, group_name, remove):
+        group = self.groups.get(group_name)
+        if group is None or name not in index:
+            return 1
+        if remove:
+            group[kind].discard(name)
+        else:
+            group[kind].add(name)
+        return 0
+
+    def _resolve_items(self, name, item_type, index, kind):
+        """Índices de objetos pedidos por nombre (``ObjectElm``) o por grupo (``GroupElm``)."""
+        if int(item_type) == eItemTypeElm.GroupElm:
+            if str(name).upper() == "ALL":
+                return np.arange(len(index))
+            group = self.groups.get(name)
+            if group is None:
+                return None
+            return np.array(sorted(index[item] for item in group[kind]), dtype=int)
+        position = index.get(name)
+        if position is None:
+            return None
+        return np.array([position])
+
+    def _output_factors(self, name):
+        """
+        Retorna ``[(StepType, reducción, factores), ...]`` de un caso o combinación.
+
+        Cada factor escala la respuesta unitaria; la reducción indica cómo se
+        combinan valor a valor (suma, envolvente, suma absoluta o SRSS). Los casos
+        de espectro de respuesta solo entregan la fila ``Max`` (magnitud), como CSI.
+        """
+        if name in self.cases:
+            case = self.cases[name]
+            if case["case_type"] == 3:
+                return []
+            if case["case_type"] == 4:
+                return [("Max", "abs", [case["factor"]])]
+            return [("", "sum", [case["factor"]])]
+        combo = self.combos[name]
+        terms = []
+        spectral = []
+        for item, scale in combo["items"]:
+            is_spectral = self.cases.get(item, {}).get("case_type") == 4
+            for _, _, factors in self._output_factors(item):
+                (spectral if is_spectral else terms).extend(factor * scale for factor in factors)
+        combo_type = combo["combo_type"]
+        if spectral:
+            if combo_type != 0:
+                raise NotImplementedError("El simulador solo combina espectros en Linear Add")
+            factors = [sum(terms)] + spectral
+            return [("Max", "sum+abs", factors), ("Min", "sum-abs", factors)]
+        if not terms:
+            return []
+        if combo_type == 1:
+            return [("Max", "max", terms), ("Min", "min", terms)]
+        if combo_type == 2:
+            return [("Max", "abs", terms), ("Min", "-abs", terms)]
+        if combo_type == 3:
+            return [("Max", "srss", terms), ("Min", "-srss", terms)]
+        return [("", "sum", [sum(terms)])]
+
+    def _selected_outputs(self, names=None):
+        names = self._output_names() if names is None else names
+        outputs = []
+        for name in names:
+            for step_type, reducer, factors in self._output_factors(name):
+                outputs.append((name, step_type, reducer, factors))
+        return outputs
+
+    def _result_block(self, builder, outputs):
+        """
+        Evalúa ``builder(outputs)`` término a término y reduce valor a valor.
+
+        Las envolventes toman máximo/mínimo por valor y no por factor, igual que CSI.
+        """
+        width = max([len(factors) for *_, factors in outputs] or [1])
+        blocks = []
+        for k in range(width):
+            terms = []
+            for name, step_type, reducer, factors in outputs:
+                if k < len(factors):
+                    factor = factors[k]
+                else:
+                    factor = factors[-1] if reducer in ("max", "min") else 0.0
+                terms.append((name, step_type, factor))
+            blocks.append(builder(terms))
+        block = blocks[0]
+        if all(reducer == "sum" for _, _, reducer, _ in outputs):
+            return block
+
+        reducers = {(name, step_type): reducer for name, step_type, reducer, _ in outputs}
+        keys = [f"{name}\x1f{step}" for name, step in zip(block["LoadCase"], block["StepType"])]
+        uniques, inverse = np.unique(np.asarray(keys, dtype=object).astype(str), return_inverse=True)
+        row_reducer = np.array([reducers[tuple(key.split("\x1f"))] for key in uniques])[inverse]
+        for key, value in block.items():
+            if key in _FACTOR_FREE or not np.issubdtype(np.asarray(value).dtype, np.floating):
+                continue
+            stack = np.stack([item[key] for item in blocks])
+            reduced = {
+                "sum": stack[0],
+                "max": stack.max(axis=0),
+                "min": stack.min(axis=0),
+                "abs": np.abs(stack).sum(axis=0),
+                "srss": np.sqrt((stack ** 2).sum(axis=0)),
+            }
+            reduced["-abs"] = -reduced["abs"]
+            reduced["-srss"] = -reduced["srss"]
+            reduced["sum+abs"] = stack[0] + np.abs(stack[1:]).sum(axis=0)
+            reduced["sum-abs"] = stack[0] - np.abs(stack[1:]).sum(axis=0)
+            values = np.array(value, dtype=float)
+            for reducer, result in reduced.items():
+                mask = row_reducer == reducer
+                values[mask] = result[mask]
+            block[key] = values
+        return block
+
+    def _display_outputs(self):
+        names = [name for name in self.cases if name in self.display_cases]
+        names += [name for name in self.combos if name in self.display_combos]
+        return self._selected_outputs(names)
+
+    # ---------------------------- resultados ----------------------------
+
+    def _expand(self, items, outputs, per_item):
+        """Ordena filas como CSI: objeto -> salida -> estación/punto."""
+        num_outputs = len(outputs)
+        item = np.repeat(items, num_outputs * per_item)
+        output = np.tile(np.repeat(np.arange(num_outputs), per_item), len(items))
+        position = np.tile(np.arange(per_item), len(items) * num_outputs)
+        factors = np.array([factor for _, _, factor in outputs], dtype=float)
+        load_case = _str_array([name for name, _, _ in outputs])
+        step_type = _str_array([step for _, step, _ in outputs])
+        return item, position, factors[output], load_case[output], step_type[output]
+
+    def _frame_force_block(self, frames, outputs):
+        frame, station, factor, load_case, step_type = self._expand(frames, outputs, len(_STATIONS))
+        t = _STATIONS[station]
+        length = self.frame_length[frame]
+        base = 1.0 + frame % 7
+        is_column = self.frame_kind[frame] == _COLUMN
+        return {
+            "Obj": _str_array([self.frame_names[k] for k in frame]),
+            "ObjSta": t * length,
+            "LoadCase": load_case,
+            "StepType": step_type,
+            "StepNum": np.zeros(len(frame)),
+            "P": -factor * base * np.where(is_column, 10.0, 1.0),
+            "V2": factor * base * (0.5 - t) * length,
+            "V3": factor * 0.1 * base,
+            "T": factor * 0.01 * base,
+            "M2": factor * 0.05 * base * (0.5 - t) * length,
+            "M3": factor * base * (t * (1.0 - t) * length ** 2 / 2 - length ** 2 / 12),
+        }
+
+    def _joint_block(self, points, outputs, reactions):
+        point, _, factor, load_case, step_type = self._expand(points, outputs, 1)
+        base = 1.0 + point % 5
+        if reactions:
+            scale = base * (len(self.story_names) - 1)
+            values = (0.05 * scale, 0.04 * scale, scale, 0.02 * scale, 0.03 * scale, 0.001 * scale)
+        else:
+            height = self.point_z[point]
+            values = (1e-3 * height, 8e-4 * height, -1e-4 * base, 1e-5 * height, 1e-5 * height, 1e-6 * base)
+        block = {
+            "Obj": _str_array([self.point_names[k] for k in point]),
+            "LoadCase": load_case,
+            "StepType": step_type,
+            "StepNum": np.zeros(len(point)),
+        }
+        for key, value in zip(("F1", "F2", "F3", "M1", "M2", "M3"), values):
+            block[key] = factor * value
+        return block
+
+    def _area_force_block(self, areas, outputs):
+        area, corner, factor, load_case, step_type = self._expand(areas, outputs, 4)
+        base = 1.0 + area % 3
+        sign = np.where(corner % 2 == 0, 1.0, -1.0)
+        f11, f22, f12 = factor * base, 0.8 * factor * base, 0.1 * factor * base * sign
+        m11, m22, m12 = 0.5 * factor * base * sign, 0.4 * factor * base * sign, 0.05 * factor * base
+        v13, v23 = 0.2 * factor * base * sign, 0.15 * factor * base * sign
+        names = _str_array([self.area_names[k] for k in area])
+        return {
+            "Obj": names,
+            "Elm": names.copy(),
+            "PointElm": _str_array([self.point_names[k] for k in self.area_points[area, corner]]),
+            "LoadCase": load_case,
+            "StepType": step_type,
+            "StepNum": np.zeros(len(area)),
+            "F11": f11, "F22": f22, "F12": f12,
+            "FMax": np.maximum(f11, f22), "FMin": np.minimum(f11, f22), "FAngle": np.zeros(len(area)),
+            "FVM": np.sqrt(f11 ** 2 - f11 * f22 + f22 ** 2 + 3 * f12 ** 2),
+            "M11": m11, "M22": m22, "M12": m12,
+            "MMax": np.maximum(m11, m22), "MMin": np.minimum(m11, m22), "MAngle": np.zeros(len(area)),
+            "V13": v13, "V23": v23, "VMax": np.hypot(v13, v23), "VAngle": np.zeros(len(area)),
+        }
+
+    def _pier_force_block(self, outputs):
+        piers = np.arange(len(self.pier_names))
+        stories = np.arange(1, len(self.story_names))
+        pairs = np.array([(story, pier) for story in stories[::-1] for pier in piers], dtype=int).reshape(-1, 2)
+        pair, location, factor, load_case, step_type = self._expand(np.arange(len(pairs)), outputs, 2)
+        story, pier = pairs[pair, 0], pairs[pair, 1]
+        above = len(self.story_names) - story
+        return {
+            "Story": _str_array([self.story_names[k] for k in story]),
+            "Pier": _str_array([self.pier_names[k] for k in pier]),
+            "LoadCase": load_case,
+            "StepType": step_type,
+            "Location": _str_array(np.where(location == 0, "Top", "Bottom")),
+            "P": -factor * 100.0 * above,
+            "V2": factor * 10.0 * above,
+            "V3": factor * 1.0 * above,
+            "T": factor * 0.5 * above,
+            "M2": factor * 2.0 * above,
+            "M3": factor * 30.0 * above * (1 + location),
+        }
+
+    def _modal_block(self, names):
+        modal = [name for name in names if self.cases.get(name, {}).get("case_type") == 3]
+        modes = np.arange(1, _NUM_MODES + 1)
+        weights = 0.8 ** modes
+        ux = np.where(modes % 3 == 1, weights, 0.05 * weights) * 0.25
+        uy = np.where(modes % 3 == 2, weights, 0.05 * weights) * 0.25
+        rz = np.where(modes % 3 == 0, weights, 0.05 * weights) * 0.25
+        period = 0.1 * (len(self.story_names) - 1) / modes
+        count = len(modal)
+        block = {
+            "LoadCase": _str_array([name for name in modal for _ in modes]),
+            "StepType": _str_array(["Mode"] * (count * _NUM_MODES)),
+            "StepNum": np.tile(modes.astype(float), count),
+            "Period": np.tile(period, count),
+            "UX": np.tile(ux, count), "UY": np.tile(uy, count), "UZ": np.zeros(count * _NUM_MODES),
+            "SumUX": np.tile(np.cumsum(ux), count), "SumUY": np.tile(np.cumsum(uy), count),
+            "SumUZ": np.zeros(count * _NUM_MODES),
+            "RX": np.tile(0.5 * uy, count), "RY": np.tile(0.5 * ux, count), "RZ": np.tile(rz, count),
+            "SumRX": np.tile(np.cumsum(0.5 * uy), count), "SumRY": np.tile(np.cumsum(0.5 * ux), count),
+            "SumRZ": np.tile(np.cumsum(rz), count),
+        }
+        return block
+
+    # ---------------------------- tablas ----------------------------
+    # Cada tabla retorna {campo: array de textos} con el orden de columnas CSI.
+
+    def _table_stories(self):
+        order = np.arange(len(self.story_names) - 1, 0, -1)
+        return {
+            "Tower": _str_array(["T1"] * len(order)),
+            "Story": _str_array([self.story_names[k] for k in order]),
+            "Height": _fmt(self.heights[order]),
+            "MasterStory": _str_array(["Yes" if k == order[0] else "No" for k in order]),
+            "SimilarTo": _str_array(["None" if k == order[0] else self.story_names[order[0]] for k in order]),
+            "SpliceAbove": _str_array(["No"] * len(order)),
+            "SpliceHeight": _fmt(np.zeros(len(order))),
+        }
+
+    def _table_grid_lines(self):
+        lines = [("X (Cartesian)", gid, value) for gid, value in self.grid_x]
+        lines += [("Y (Cartesian)", gid, value) for gid, value in self.grid_y]
+        return {
+            "Name": _str_array([self.grid_name] * len(lines)),
+            "LineType": _str_array([line[0] for line in lines]),
+            "ID": _str_array([line[1] for line in lines]),
+            "Ordinate": _fmt([line[2] for line in lines]),
+            "BubbleLoc": _str_array(["End" if line[0][0] == "X" else "Start" for line in lines]),
+            "Visible": _str_array(["Yes"] * len(lines)),
+        }
+
+    def _table_frame_summary(self):
+        names = list(self.frame_sections)
+        return {
+            "Name": _str_array(names),
+            "Material": _str_array(["4000Psi"] * len(names)),
+            "Shape": _str_array(["Concrete Rectangular"] * len(names)),
+        }
+
+    def _table_frame_sections(self):
+        names = list(self.frame_sections)
+        return {
+            "Name": _str_array(names),
+            "Material": _str_array(["4000Psi"] * len(names)),
+            "t3": _fmt([self.frame_sections[name][0] for name in names]),
+            "t2": _fmt([self.frame_sections[name][1] for name in names]),
+        }
+
+    def _table_restraints(self):
+        points = np.flatnonzero(self.point_restrained)
+        yes = _str_array(["Yes"] * len(points))
+        columns = {
+            "Story": _str_array([self.story_names[self.point_level[k]] for k in points]),
+            "Label": self.point_label[points],
+            "UniqueName": _str_array([self.point_names[k] for k in points]),
+        }
+        for dof in ("UX", "UY", "UZ", "RX", "RY", "RZ"):
+            columns[dof] = yes
+        return columns
+
+    def _table_diaphragms(self):
+        points = np.flatnonzero(self.point_level > 0)
+        return {
+            "Story": _str_array([self.story_names[self.point_level[k]] for k in points]),
+            "Label": self.point_label[points],
+            "UniqueName": _str_array([self.point_names[k] for k in points]),
+            "Diaphragm": _str_array([self.diaphragm_name] * len(points)),
+        }
+
+    def _table_frame_assignments(self):
+        return {
+            "Story": self.frame_story,
+            "Label": self.frame_label,
+            "UniqueName": _str_array(self.frame_names),
+            "Shape": _str_array(["Concrete Rectangular"] * len(self.frame_names)),
+            "AutoSelect": _str_array(["N/A"] * len(self.frame_names)),
+            "Section": self.frame_section,
+        }
+
+    def _table_points(self):
+        return {
+            "UniqueName": _str_array(self.point_names),
+            "Story": _str_array([self.story_names[k] for k in self.point_level]),
+            "PointBay": self.point_label,
+            "IsAuto": _str_array(["No"] * len(self.point_names)),
+            "X": _fmt(self.point_x),
+            "Y": _fmt(self.point_y),
+            "Z": _fmt(self.point_z),
+        }
+
+    def _frame_connectivity(self, kind, bay_field):
+        frames = np.flatnonzero(self.frame_kind == kind)
+        return {
+            "UniqueName": _str_array([self.frame_names[k] for k in frames]),
+            "Story": self.frame_story[frames],
+            bay_field: self.frame_label[frames],
+            "UniquePtI": _str_array([self.point_names[k] for k in self.frame_i[frames]]),
+            "UniquePtJ": _str_array([self.point_names[k] for k in self.frame_j[frames]]),
+            "Length": _fmt(self.frame_length[frames]),
+        }
+
+    def _table_columns(self):
+        return self._frame_connectivity(_COLUMN, "ColumnBay")
+
+    def _table_beams(self):
+        return self._frame_connectivity(_BEAM, "BeamBay")
+
+    def _area_connectivity(self, orientation, bay_field):
+        areas = np.flatnonzero(self.area_orientation == orientation)
+        columns = {
+            "UniqueName": _str_array([self.area_names[k] for k in areas]),
+            "Story": self.area_story[areas],
+            bay_field: self.area_label[areas],
+        }
+        for corner in range(4):
+            columns[f"UniquePt{corner + 1}"] = _str_array(
+                [self.point_names[k] for k in self.area_points[areas, corner]]
+            )
+        return columns
+
+    def _table_floors(self):
+        return self._area_connectivity(_FLOOR, "FloorBay")
+
+    def _table_walls(self):
+        return self._area_connectivity(_WALL, "WallBay")
+
+    def _table_cases(self):
+        names = list(self.cases)
+        type_names = {1: "Linear Static", 3: "Modal - Eigen", 4: "Response Spectrum"}
+        return {
+            "Name": _str_array(names),
+            "Type": _str_array([type_names[self.cases[name]["case_type"]] for name in names]),
+        }
+
+    def _table_combos(self):
+        rows = [
+            (name, combo, item, scale)
+            for name, combo in self.combos.items()
+            for item, scale in combo["items"]
+        ]
+        type_names = {0: "Linear Add", 1: "Envelope", 2: "Absolute Add", 3: "SRSS"}
+        return {
+            "Name": _str_array([row[0] for row in rows]),
+            "Type": _str_array([type_names[row[1]["combo_type"]] for row in rows]),
+            "IsAuto": _str_array(["No"] * len(rows)),
+            "CaseName": _str_array([row[2] for row in rows]),
+            "ScaleFactor": _fmt([row[3] for row in rows]),
+        }
+
+    def _frame_force_table(self, kind, label_field):
+        frames = np.flatnonzero(self.frame_kind == kind)
+        outputs = self._display_outputs()
+        block = self._result_block(partial(self._frame_force_block, frames), outputs)
+        frame = np.repeat(frames, len(outputs) * len(_STATIONS))
+        columns = {
+            "Story": self.frame_story[frame],
+            label_field: self.frame_label[frame],
+            "UniqueName": block["Obj"],
+            "OutputCase": block["LoadCase"],
+            "CaseType": self._case_type_labels(block["LoadCase"]),
+            "StepType": block["StepType"],
+            "Station": _fmt(block["ObjSta"]),
+        }
+        for key in ("P", "V2", "V3", "T", "M2", "M3"):
+            columns[key] = _fmt(block[key])
+        return columns
+
+    def _case_type_labels(self, load_cases):
+        labels = {name: "Combination" for name in self.combos}
+        labels.update({
+            name: "LinRespSpec" if case["case_type"] == 4 else "LinStatic"
+            for name, case in self.cases.items()
+        })
+        return _str_array([labels[name] for name in load_cases])
+
+    def _table_column_forces(self):
+        return self._frame_force_table(_COLUMN, "Column")
+
+    def _table_beam_forces(self):
+        return self._frame_force_table(_BEAM, "Beam")
+
+    def _table_joint_reactions(self):
+        points = np.flatnonzero(self.point_restrained)
+        outputs = self._display_outputs()
+        block = self._result_block(partial(self._joint_block, points, reactions=True), outputs)
+        point = np.repeat(points, len(outputs))
+        columns = {
+            "Story": _str_array([self.story_names[self.point_level[k]] for k in point]),
+            "Label": self.point_label[point],
+            "UniqueName": block["Obj"],
+            "OutputCase": block["LoadCase"],
+            "CaseType": self._case_type_labels(block["LoadCase"]),
+            "StepType": block["StepType"],
+        }
+        for key, field in zip(("F1", "F2", "F3", "M1", "M2", "M3"), ("FX", "FY", "FZ", "MX", "MY", "MZ")):
+            columns[field] = _fmt(block[key])
+        return columns
+
+    def _table_modal(self):
+        block = self._modal_block([name for name in self.cases if name in self.display_cases])
+        columns = {
+            "Case": block["LoadCase"],
+            "Mode": _fmt(block["StepNum"]),
+        }
+        for key in self._MODAL_KEYS[3:]:
+            columns[key] = _fmt(block[key])
+        return columns
+
+
+def _comtypes_value(value):
+    """Arreglos como tuplas, igual que los ``SAFEARRAY`` de comtypes."""
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _dotnet_value(value):
+    """Arreglos numéricos con protocolo buffer y textos como lista, igual que pythonnet."""
+    if isinstance(value, np.ndarray):
+        typecode = _NET_TYPECODES.get(value.dtype.kind)
+        if typecode is None:
+            return list(value)
+        return array.array(typecode, value.astype(np.dtype(typecode)).tolist())
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+def _shape_result(path, result, shape):
+    if not isinstance(result, tuple):
+        return result
+    if shape == "comtypes":
+        return tuple(_comtypes_value(value) for value in result)
+    reorder = _DOTNET_RESULTS.get(path)
+    raw = reorder(result) if reorder is not None else (result[-1],) + tuple(result[:-1])
+    return (raw[0],) + tuple(_dotnet_value(value) for value in raw[1:])
+
+
+class _ShapedComponent:
+    """Vista de un componente simulado que responde con la forma cruda de ``shape``."""
+
+    def __init__(self, component, shape, path=""):
+        self._component = component
+        self._shape = shape
+        self._path = path
+
+    def __getattr__(self, name):
+        attr = getattr(self._component, name)
+        path = f"{self._path}.{name}" if self._path else name
+        if isinstance(attr, _SimComponent):
+            return _ShapedComponent(attr, self._shape, path)
+        if name[:1].isupper() and callable(attr):
+            return partial(self._call, path, attr)
+        return attr
+
+    def _call(self, path, method, *args, **kwargs):
+        return _shape_result(path, method(*args, **kwargs), self._shape)
+
+
+class _NetArrayType:
+    def __getitem__(self, element):
+        return list
+
+
+class SimulatedSystem:
+    """Sustituto mínimo de ``System`` para los wrappers dotnet (``Array[T](...)`` y escalares)."""
+
+    Array = _NetArrayType()
+    Double = float
+    Int32 = int
+    String = str
+
+
+class SimulatedApplication:
+    """Equivalente mínimo de ``cOAPI`` sobre un ``SimulatedModel``."""
+
+    def __init__(self, model, api_shape=None):
+        if api_shape is not None and api_shape not in API_SHAPES:
+            raise ValueError(f"api_shape debe ser uno de {API_SHAPES}, no '{api_shape}'")
+        self.SapModel = model if api_shape is None else _ShapedComponent(model, api_shape)
+
+    def ApplicationStart(self, *args, **kwargs):
+        return 0
+
+    def ApplicationExit(self, *args, **kwargs):
+        return 0
@@ -0,0 +1,248 @@
+"""
+Cache en disco de extracciones de un archivo de modelo.
+
+``ModelSnapshot`` guarda ``DataFrame`` (o diccionarios de ``DataFrame``) como
+columnas NumPy en archivos ``.npz`` sin pickle, uno por entrada, junto a un
+``manifest.json`` con la clave del modelo: ruta, tamaño y fecha de
+modificación del archivo más el estado reportado por el handler (bloqueo por
+análisis, cantidad de objetos). Si la clave cambia, el snapshot se descarta.
+
+Las ediciones hechas en la sesión no están en el archivo: tras la primera, el
+snapshot queda marcado (``dirty``) y no lee ni guarda entradas hasta que el
+archivo se guarde y cambie su fecha de modificación.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+SNAPSHOT_FORMAT = 1
+_MANIFEST = 'manifest.json'
+
+
+def default_snapshot_dir():
+    """Directorio por defecto: ``<temp>/csi_py_snapshots``."""
+    return os.path.join(tempfile.gettempdir(), 'csi_py_snapshots')
+
+
+def _encode_column(series):
+    """Retorna ``(meta, {sufijo: arreglo})`` de una columna."""
+    meta = {'dtype': str(series.dtype)}
+    values = series.to_numpy()
+    if values.dtype.kind in 'biuf':
+        meta['kind'] = 'values'
+        return meta, {'': values}
+
+    items = values.astype(object)
+    missing = np.asarray(pd.isna(items), dtype=bool) if len(items) else np.zeros(0, dtype=bool)
+    present = items[~missing]
+    if all(isinstance(item, str) for item in present):
+        text = items.copy()
+        text[missing] = ''
+        meta['kind'] = 'text'
+        return meta, {'': text.astype(str), 'missing': missing}
+
+    if all(isinstance(item, (tuple, list, np.ndarray)) for item in present):
+        sequences = [np.asarray(item, dtype=float) if not is_missing else np.empty(0)
+                     for item, is_missing in zip(items, missing)]
+        lengths = np.array([len(item) for item in sequences], dtype=np.int64)
+        flat = np.concatenate(sequences) if sequences else np.empty(0)
+        meta['kind'] = 'sequence'
+        meta['container'] = 'tuple' if any(isinstance(item, tuple) for item in present) else 'array'
+        return meta, {'': flat, 'lengths': lengths, 'missing': missing}
+
+    raise TypeError(f"La columna '{series.name}' no tiene un tipo serializable")
+
+
+def _decode_column(meta, arrays):
+    kind = meta['kind']
+    if kind == 'values':
+        return arrays['']
+    missing = arrays['missing']
+    if kind == 'text':
+        values = arrays[''].astype(object)
+        values[missing] = None
+    else:
+        lengths = arrays['lengths']
+        if len(lengths) and not missing.any() and (lengths == lengths[0]).all():
+            # Caso habitual (coordenadas, contornos de 4 puntos): una sola matriz
+            parts = arrays[''].reshape(len(lengths), int(lengths[0]))
+        else:
+            parts = np.split(arrays[''], np.cumsum(lengths)[:-1]) if len(lengths) else []
+        if meta['container'] == 'tuple':
+            parts = [tuple(part) for part in (parts.tolist() if isinstance(parts, np.ndarray) else
+                                              [part.tolist() for part in parts])]
+        values = np.empty(len(missing), dtype=object)
+        values[:] = [None if is_missing else part for part, is_missing in zip(parts, missing)]
+    if meta['dtype'] == 'object':
+        return pd.Series(values, dtype=object)
+    return values
+
+
+def encode_frame(frame):
+    """Retorna ``(meta, arreglos)`` de un ``DataFrame`` para ``np.savez``."""
+    meta = {'columns': [], 'index': None}
+    arrays = {}
+    columns = [(str(name), frame[name]) for name in frame.columns]
+    if not isinstance(frame.index, pd.RangeIndex) or frame.index.start != 0 or frame.index.step != 1:
+        columns.append(('__index__', pd.Series(frame.index, name='__index__')))
+        meta['index'] = '__index__'
+    for position, (name, series) in enumerate(columns):
+        column_meta, column_arrays = _encode_column(series)
+        column_meta['name'] = name
+        meta['columns'].append(column_meta)
+        for suffix, values in column_arrays.items():
+            arrays[f'c{position}{"_" + suffix if suffix else ""}'] = values
+    return meta, arrays
+
+
+def decode_frame(meta, arrays):
+    """Reconstruye el ``DataFrame`` guardado con :func:`encode_frame`."""
+    data = {}
+    for position, column_meta in enumerate(meta['columns']):
+        prefix = f'c{position}'
+        column_arrays = {key[len(prefix):].lstrip('_'): arrays[key] for key in arrays
+                         if key == prefix or key.startswith(prefix + '_')}
+        data[column_meta['name']] = _decode_column(column_meta, column_arrays)
+    index = data.pop(meta['index']) if meta['index'] else None
+    names = [column['name'] for column in meta['columns'] if column['name'] != meta['index']]
+    frame = pd.DataFrame(data, columns=names)
+    if index is not None:
+        frame.index = pd.Index(index)
+    return frame
+
+
+class ModelSnapshot:
+    """
+    Extracciones persistidas de un archivo de modelo.
+
+    ``state`` agrega a la clave datos del modelo vivo (por ejemplo, si está
+    bloqueado por análisis); cualquier diferencia con el manifiesto guardado
+    descarta las entradas existentes.
+
+    Con ``dirty`` (ver :meth:`mark_dirty`) el modelo vivo ya no coincide con el
+    archivo: ``load`` retorna ``None`` y ``save`` no escribe.
+    """
+
+    def __init__(self, directory, file_path, state=None):
+        self.file = os.path.abspath(file_path)
+        name = hashlib.sha1(os.path.normcase(self.file).encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(directory, name)
+        self.dirty = False
+        self.key = self._make_key(state)
+        self.entries = {}
+        manifest = self._read_manifest()
+        if manifest is not None and manifest.get('key') == self.key:
+            self.entries = manifest.get('entries', {})
+        elif os.path.isdir(self.path):
+            self.clear()
+
+    def _make_key(self, state):
+        stat = os.stat(self.file)
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'file': self.file,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'state': dict(state or {}),
+        }
+
+    def mark_dirty(self):
+        """Marca el modelo vivo como distinto del archivo: deja de leer y guardar entradas."""
+        self.dirty = True
+
+    def file_changed(self):
+        """Indica si el archivo cambió (tamaño o fecha de modificación) desde la clave."""
+        try:
+            stat = os.stat(self.file)
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime) != (self.key['size'], self.key['mtime'])
+
+    def rekey(self, state=None):
+        """Descarta las entradas y toma la clave del archivo actual; quita ``dirty``."""
+        self.clear()
+        self.key = self._make_key(state)
+        self.dirty = False
+
+    def _read_manifest(self):
+        try:
+            with open(os.path.join(self.path, _MANIFEST), encoding='utf-8') as stream:
+                return json.load(stream)
+        except (OSError, ValueError):
+            return None
+
+    def _write_manifest(self):
+        os.makedirs(self.path, exist_ok=True)
+        target = os.path.join(self.path, _MANIFEST)
+        with open(target + '.tmp', 'w', encoding='utf-8') as stream:
+            json.dump({'key': self.key, 'entries': self.entries}, stream, indent=1)
+        os.replace(target + '.tmp', target)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def load(self, name):
+        """Retorna la entrada ``name`` o ``None`` si no está guardada o no se puede leer."""
+        entry = None if self.dirty else self.entries.get(name)
+        if entry is None:
+            return None
+        try:
+            with np.load(os.path.join(self.path, entry['file']), allow_pickle=False) as stored:
+                arrays = dict(stored)
+        except (OSError, ValueError, KeyError):
+            return None
+        frames = {}
+        for key, meta in entry['frames'].items():
+            prefix = f'f{meta["position"]}_'
+            frames[key] = decode_frame(meta, {k[len(prefix):]: v for k, v in arrays.items()
+                                              if k.startswith(prefix)})
+        return frames[''] if entry['single'] else frames
+
+    def save(self, name, value):
+        """
+        Guarda un ``DataFrame`` o un diccionario ``{clave: DataFrame}``.
+
+        Retorna ``False`` (sin guardar) si alguna columna no es serializable o si
+        el snapshot está marcado como ``dirty``.
+        """
+        if self.dirty:
+            return False
+        single = isinstance(value, pd.DataFrame)
+        frames = {'': value} if single else dict(value)
+        arrays, metas = {}, {}
+        try:
+            for position, (key, frame) in enumerate(frames.items()):
+                meta, frame_arrays = encode_frame(frame)
+                meta['position'] = position
+                metas[str(key)] = meta
+                arrays.update({f'f{position}_{k}': v for k, v in frame_arrays.items()})
+        except TypeError:
+            return False
+        file_name = f'{hashlib.sha1(name.encode("utf-8")).hexdigest()[:12]}.npz'
+        os.makedirs(self.path, exist_ok=True)
+        np.savez(os.path.join(self.path, file_name), **arrays)
+        self.entries[name] = {'file': file_name, 'single': single, 'frames': metas}
+        self._write_manifest()
+        return True
+
+    def discard(self, name):
+        """Elimina una entrada."""
+        entry = self.entries.pop(name, None)
+        if entry is None:
+            return
+        try:
+            os.remove(os.path.join(self.path, entry['file']))
+        except OSError:
+            pass
+        self._write_manifest()
+
+    def clear(self):
+        """Elimina todas las entradas del modelo."""
+        self.entries = {}
+        shutil.rmtree(self.path, ignore_errors=True)
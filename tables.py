@@ -0,0 +1,184 @@
+"""
+Decodificación de tablas de ``DatabaseTables``.
+
+CSI entrega las tablas como una lista plana de textos fila por fila. ``decode_table``
+la lleva directamente a una matriz NumPy ``(registros, campos)`` y convierte en
+bloque las columnas numéricas a ``float64``. Las columnas de identificadores
+(nombres, etiquetas, pisos, casos, ...) se mantienen como texto aunque parezcan
+números, para que sigan coincidiendo con los nombres de la API.
+
+El tipo de cada columna sale de ``TABLE_SCHEMAS`` para las tablas que usa el
+extractor; en el resto (o en columnas que el esquema no lista) se deduce del
+nombre con :func:`is_text_column`.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# Palabras de un nombre de columna que la marcan como identificador de texto.
+TEXT_TOKENS = frozenset({
+    'Name', 'Label', 'Unique', 'ID', 'GUID', 'Story', 'Tower', 'Pier', 'Spandrel',
+    'Point', 'Joint', 'Frame', 'Beam', 'Column', 'Brace', 'Wall', 'Floor', 'Link',
+    'Object', 'Strip', 'Bay', 'Case', 'Combo', 'Section', 'Material', 'Grid',
+    'System', 'Group', 'Diaphragm', 'Pt', 'Elem', 'Area', 'Element', 'Shell', 'Tendon',
+})
+
+# Columnas de posición a lo largo del elemento (``Station``, ``ElemStation``, ...):
+# son numéricas aunque lleven una palabra de identificador.
+NUMERIC_SUFFIXES = ('Station',)
+
+# Columnas comunes de las tablas de resultados.
+_RESULT_COLUMNS = {
+    'Story': str, 'OutputCase': str, 'CaseType': str, 'StepType': str,
+    'StepNumber': float, 'StepNum': float,
+}
+_FRAME_FORCES = dict(
+    _RESULT_COLUMNS, UniqueName=str, Station=float, Element=str, ElemStation=float,
+    Location=str, P=float, V2=float, V3=float, T=float, M2=float, M3=float,
+)
+
+# Tipo de columna (``str`` o ``float``) de las tablas de resultados y asignaciones
+# que lee el extractor.
+TABLE_SCHEMAS = {
+    'Element Forces - Beams': dict(_FRAME_FORCES, Beam=str),
+    'Element Forces - Columns': dict(_FRAME_FORCES, Column=str),
+    'Element Forces - Braces': dict(_FRAME_FORCES, Brace=str),
+    'Joint Reactions': dict(
+        _RESULT_COLUMNS, Label=str, UniqueName=str,
+        FX=float, FY=float, FZ=float, MX=float, MY=float, MZ=float,
+    ),
+    'Joint Displacements': dict(
+        _RESULT_COLUMNS, Label=str, UniqueName=str,
+        Ux=float, Uy=float, Uz=float, Rx=float, Ry=float, Rz=float,
+    ),
+    'Story Forces': dict(
+        _RESULT_COLUMNS, Location=str,
+        P=float, VX=float, VY=float, T=float, MX=float, MY=float,
+    ),
+    'Story Max Over Avg Displacements': dict(
+        _RESULT_COLUMNS, Direction=str, Maximum=float, Average=float, Ratio=float,
+    ),
+    'Diaphragm Max Over Avg Drifts': dict(
+        _RESULT_COLUMNS, Item=str, Label=str,
+        **{'Max Drift': float, 'Avg Drift': float, 'Ratio': float}
+    ),
+    'Soil Pressures': dict(
+        _RESULT_COLUMNS, Label=str, UniqueName=str, SoilPressure=float,
+        GlobalX=float, GlobalY=float, GlobalZ=float,
+    ),
+    'Strip Forces': dict(
+        _RESULT_COLUMNS, Strip=str, StripObject=str, Station=float,
+        P=float, V2=float, V3=float, T=float, M2=float, M3=float,
+        GlobalX=float, GlobalY=float, GlobalZ=float,
+    ),
+    'Pier Section Properties': {
+        'Story': str, 'Pier': str, 'AxisAngle': float, 'MatProp': str,
+        'WidthBot': float, 'ThickBot': float, 'WidthTop': float, 'ThickTop': float,
+        'CGBotX': float, 'CGBotY': float, 'CGBotZ': float,
+        'CGTopX': float, 'CGTopY': float, 'CGTopZ': float,
+    },
+    'Area Assignments - Pier Labels': {
+        'Story': str, 'Label': str, 'UniqueName': str, 'PierName': str,
+    },
+    'Area Assignments - Section Properties': {
+        'Story': str, 'Label': str, 'UniqueName': str, 'Section Property': str,
+    },
+    'Wall Bays': {'Story': str, 'Label': str, 'PointBay': str},
+    'Joint Assignments - Restraints': {
+        'Story': str, 'Label': str, 'UniqueName': str,
+        'UX': str, 'UY': str, 'UZ': str, 'RX': str, 'RY': str, 'RZ': str,
+    },
+    'Joint Assignments - Diaphragms': {
+        'Story': str, 'Label': str, 'UniqueName': str, 'Diaphragm': str,
+    },
+    # ``Area`` es la propiedad de sección, no un objeto de área.
+    'Frame Section Property Definitions - Summary': {
+        'Name': str, 'Material': str, 'Shape': str, 't3': float, 't2': float,
+        'Area': float, 'J': float, 'I33': float, 'I22': float, 'As2': float, 'As3': float,
+    },
+    'Frame Assignments - Section Properties': {
+        'Story': str, 'Label': str, 'UniqueName': str, 'Shape': str,
+        'AutoSelect': str, 'Auto Select List': str, 'Section': str,
+        'Section Property': str,
+    },
+}
+
+# Fracción máxima de valores distintos para convertir texto en categórico.
+CATEGORICAL_RATIO = 0.5
+
+_TOKEN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+')
+
+
+def is_text_column(name):
+    """Indica si ``name`` corresponde a una columna de identificadores."""
+    name = str(name)
+    if name.endswith(NUMERIC_SUFFIXES):
+        return False
+    return any(token in TEXT_TOKENS for token in _TOKEN.findall(name))
+
+
+def _to_float(values):
+    """Convierte una columna de textos a ``float64``; ``None`` si no es numérica."""
+    empty = values == ''
+    if empty.all():
+        return None
+    if empty.any():
+        values = values.copy()
+        values[empty] = 'nan'
+    try:
+        return values.astype(float)
+    except (TypeError, ValueError):
+        return None
+
+
+def decode_table(fields, num_records, data, raw=False, dtypes=None, categorical=False,
+                 table_name=None):
+    """
+    Construye el ``DataFrame`` de una tabla a partir de la lista plana de CSI.
+
+    Con ``raw=True`` todas las columnas quedan como texto, tal como las acepta
+    ``SetTableForEditingArray``. Si no, ``dtypes`` (``{columna: tipo}``) fija el
+    tipo de columnas concretas; el resto sigue el esquema de ``table_name`` en
+    ``TABLE_SCHEMAS`` o, sin esquema, se infiere: numéricas a ``float64`` y el
+    resto texto. Con ``categorical=True`` las columnas de texto con pocos
+    valores distintos (``Story``, ``OutputCase``, ...) se devuelven como
+    ``category``.
+    """
+    fields = list(fields)
+    values = np.array(data, dtype=object)
+    values[pd.isna(values)] = ''
+    values = values.reshape(num_records, len(fields))
+    dtypes = dtypes or {}
+    schema = TABLE_SCHEMAS.get(table_name, {})
+
+    columns = {}
+    for position, field in enumerate(fields):
+        column = values[:, position]
+        if raw:
+            columns[field] = column
+            continue
+        if field in dtypes:
+            columns[field] = _apply_dtype(column, dtypes[field])
+            continue
+        text = schema[field] is str if field in schema else is_text_column(field)
+        numeric = None if text else _to_float(column)
+        if numeric is not None:
+            columns[field] = numeric
+        elif categorical and len(column) and \
+                len(pd.unique(column)) <= CATEGORICAL_RATIO * len(column):
+            columns[field] = pd.Categorical(column)
+        else:
+            columns[field] = column
+    return pd.DataFrame(columns, columns=fields)
+
+
+def _apply_dtype(column, dtype):
+    if dtype in ('category', 'categorical'):
+        return pd.Categorical(column)
+    if dtype in (str, 'str', object, 'object'):
+        return column
+    if np.issubdtype(np.dtype(dtype), np.number):
+        column = np.where(column == '', 'nan', column).astype(float)
+    return column.astype(dtype)
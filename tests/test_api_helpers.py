@@ -0,0 +1,162 @@
+"""
+Conversión de arreglos ``System.Array`` sin pythonnet.
+
+Los dobles imitan lo que entrega pythonnet: un arreglo con protocolo buffer,
+uno sin él cuyo tipo de elemento se conoce (``Marshal.Copy``) y uno que solo
+se puede iterar.
+"""
+
+import array
+import ctypes
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from csi_py.api_helpers import CSIAPIHelpers
+
+
+class _Owner:
+    backend = "dotnet"
+    connector = None
+
+
+class _ElementType:
+    def __init__(self, name):
+        self.Name = name
+
+
+class _NetType:
+    def __init__(self, name):
+        self._element = _ElementType(name)
+
+    def GetElementType(self):
+        return self._element
+
+
+class _BufferArray(array.array):
+    """``System.Array`` que expone el protocolo buffer."""
+
+
+class _MarshalArray:
+    """``System.Array`` sin protocolo buffer, con tipo de elemento .NET."""
+
+    def __init__(self, values, element):
+        self.values = list(values)
+        self.element = element
+        self.iterated = False
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        self.iterated = True
+        return iter(self.values)
+
+    def GetType(self):
+        return _NetType(self.element)
+
+
+class _IterableArray:
+    """Arreglo que solo se puede recorrer elemento por elemento."""
+
+    def __init__(self, values):
+        self.values = list(values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+
+@pytest.fixture
+def helpers():
+    return CSIAPIHelpers(_Owner())
+
+
+@pytest.fixture
+def fake_marshal(monkeypatch):
+    """Instala módulos ``System`` falsos; ``Marshal.Copy`` escribe en la dirección recibida."""
+    copies = []
+
+    def copy(source, start, pointer, count):
+        element = {"Double": ctypes.c_double, "Int32": ctypes.c_int32}[source.element]
+        data = (element * count)(*source.values[start:start + count])
+        ctypes.memmove(pointer, data, ctypes.sizeof(data))
+        copies.append(count)
+
+    system = types.ModuleType("System")
+    system.IntPtr = int
+    interop = types.ModuleType("System.Runtime.InteropServices")
+    interop.Marshal = types.SimpleNamespace(Copy=copy)
+    monkeypatch.setitem(sys.modules, "System", system)
+    monkeypatch.setitem(sys.modules, "System.Runtime.InteropServices", interop)
+    return copies
+
+
+def test_buffer_array_float(helpers):
+    values = _BufferArray("d", [1.5, -2.0, 3.25])
+    result = helpers._as_float_array(values)
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [1.5, -2.0, 3.25])
+
+
+def test_buffer_array_int(helpers):
+    values = _BufferArray("i", [3, 0, -7])
+    result = helpers._as_int_array(values)
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, [3, 0, -7])
+
+
+def test_marshal_copy_double(helpers, fake_marshal):
+    values = _MarshalArray([0.5, 1.0, 2.5, 4.0], "Double")
+    result = helpers._as_float_array(values)
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [0.5, 1.0, 2.5, 4.0])
+    assert fake_marshal == [4] and not values.iterated
+
+
+def test_marshal_copy_int32(helpers, fake_marshal):
+    values = _MarshalArray([1, -2, 3], "Int32")
+    result = helpers._as_int_array(values)
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, [1, -2, 3])
+    assert fake_marshal == [3] and not values.iterated
+
+
+def test_marshal_copy_to_bool(helpers, fake_marshal):
+    result = helpers._as_bool_array(_MarshalArray([0, 1, 2], "Int32"))
+    assert result.dtype == np.bool_
+    np.testing.assert_array_equal(result, [False, True, True])
+
+
+def test_unknown_element_type_iterates(helpers, fake_marshal):
+    values = _MarshalArray([1, 2], "Int64")
+    result = helpers._as_int_array(values)
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, [1, 2])
+    assert fake_marshal == [] and values.iterated
+
+
+def test_iterable_without_type(helpers):
+    result = helpers._as_float_array(_IterableArray([1, 2, 3]))
+    assert result.dtype == np.float64
+    np.testing.assert_array_equal(result, [1.0, 2.0, 3.0])
+    result = helpers._as_bool_array(_IterableArray([0, 1]))
+    assert result.dtype == np.bool_
+    np.testing.assert_array_equal(result, [False, True])
+
+
+def test_empty_marshal_array(helpers, fake_marshal):
+    result = helpers._as_float_array(_MarshalArray([], "Double"))
+    assert result.dtype == np.float64 and len(result) == 0
+    assert fake_marshal == []
+
+
+def test_sequences_and_none(helpers):
+    assert helpers._as_float_array(None).dtype == np.float64
+    result = helpers._as_int_array((1, 2, 3))
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, [1, 2, 3])
@@ -0,0 +1,45 @@
+"""
+``ComboEngine`` frente a las combinaciones que entrega el simulador (lado CSI).
+"""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from csi_py import CSIHandler
+
+_RS_COMBO = "1.25D+SDX"
+
+
+@pytest.fixture(scope="module")
+def handler():
+    handler = CSIHandler(backend="simulated", stories=3, bays_x=2, bays_y=2, walls=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    return handler
+
+
+def test_response_spectrum_goes_to_csi(handler):
+    engine = handler.get_combo_engine()
+    assert not engine.is_local("SDX")
+    assert not engine.is_local(_RS_COMBO)
+    assert engine.is_local("Envolvente")
+
+
+@pytest.mark.parametrize("result, extract, keys, values", [
+    ("frame", "get_frame_forces", ["Frame", "Station"], ["P", "V2", "V3", "T", "M2", "M3"]),
+    ("joint", "get_point_reactions", ["Point"], ["F1", "F2", "F3", "M1", "M2", "M3"]),
+])
+def test_max_only_case_is_enveloped(handler, result, extract, keys, values):
+    engine = handler.get_combo_engine()
+    base = getattr(handler, extract)(None, engine.base_cases([_RS_COMBO]))
+    spectral = base[base["OutputCase"] == "SDX"]
+    assert set(spectral["StepType"].str.strip()) == {"Max"}
+
+    local = engine.evaluate(base, [_RS_COMBO], keys, values)
+    remote = handler.get_combo_results(result, combos=[_RS_COMBO])
+    pd.testing.assert_frame_equal(
+        local.reset_index(drop=True), remote.reset_index(drop=True), check_dtype=False
+    )
@@ -0,0 +1,85 @@
+"""``GridEngine`` contra la regla densa punto-segmento sobre todos los pares."""
+
+import numpy as np
+import pandas as pd
+
+from csi_py.grid_index import GridEngine
+
+
+def _dense_general_pairs(engine, xi, yi, xj, yj, tol):
+    hits = (
+        GridEngine._on_segments(xi, yi, engine._segments, tol)
+        & GridEngine._on_segments(xj, yj, engine._segments, tol)
+    )
+    frames, cols = np.nonzero(hits)
+    return frames, engine._general[cols]
+
+
+def _grid(rng, count):
+    angle = rng.uniform(0, np.pi, count)
+    cx, cy = rng.uniform(0, 50, count), rng.uniform(0, 50, count)
+    length = rng.uniform(5, 60, count)
+    # Un segmento degenerado y uno vertical entre las líneas generales
+    length[0] = 0.0
+    angle[1] = np.pi / 2
+    return pd.DataFrame({
+        "GridLineID": [f"G{k}" for k in range(count)],
+        "Axis": "General",
+        "Ordinate": np.nan,
+        "X1": cx - length / 2 * np.cos(angle), "Y1": cy - length / 2 * np.sin(angle),
+        "X2": cx + length / 2 * np.cos(angle), "Y2": cy + length / 2 * np.sin(angle),
+    })
+
+
+def _frames_near(rng, lines, count, tol):
+    """Extremos sobre las líneas, desplazados alrededor de ``tol`` (dentro y fuera)."""
+    k = rng.integers(0, len(lines), count)
+    x1, y1, x2, y2 = (lines[c].to_numpy()[k] for c in ("X1", "Y1", "X2", "Y2"))
+    points = []
+    for _ in range(2):
+        t = rng.uniform(-0.05, 1.05, count)
+        offset = rng.choice([0.0, 0.5, 0.999, 1.001, 2.0], count) * tol
+        angle = rng.uniform(0, 2 * np.pi, count)
+        points.append(x1 + t * (x2 - x1) + offset * np.cos(angle))
+        points.append(y1 + t * (y2 - y1) + offset * np.sin(angle))
+    xi, yi, xj, yj = points
+    # Columnas: ambos extremos en el mismo punto de planta
+    column = rng.random(count) < 0.4
+    xj, yj = np.where(column, xi, xj), np.where(column, yi, yj)
+    xi[:3] = np.nan
+    return xi, yi, xj, yj
+
+
+def test_general_pairs_match_dense_rule():
+    rng = np.random.default_rng(7)
+    tol = 1e-3
+    lines = _grid(rng, 40)
+    engine = GridEngine(lines)
+    xi, yi, xj, yj = _frames_near(rng, lines, 4000, tol)
+    # Pisos repetidos: mismas coordenadas en planta
+    xi, yi, xj, yj = (np.tile(values, 3) for values in (xi, yi, xj, yj))
+
+    frames, found = engine._general_pairs(xi, yi, xj, yj, tol)
+    expected_frames, expected_lines = _dense_general_pairs(engine, xi, yi, xj, yj, tol)
+    got = sorted(zip(frames.tolist(), found.tolist()))
+    expected = sorted(zip(expected_frames.tolist(), expected_lines.tolist()))
+    assert got == expected
+    assert len(expected) > 1000
+
+
+def test_pairs_mix_cartesian_and_general():
+    lines = pd.DataFrame({
+        "GridLineID": ["A", "1", "D1"],
+        "Axis": ["X", "Y", "General"],
+        "Ordinate": [0.0, 0.0, np.nan],
+        "X1": [np.nan, np.nan, 0.0], "Y1": [np.nan, np.nan, 0.0],
+        "X2": [np.nan, np.nan, 10.0], "Y2": [np.nan, np.nan, 10.0],
+    })
+    engine = GridEngine(lines)
+    xi, yi = np.array([0.0, 0.0, 2.0, 5.0]), np.array([0.0, 3.0, 2.0, 0.0])
+    xj, yj = np.array([0.0, 0.0, 4.0, 7.0]), np.array([0.0, 6.0, 4.0, 0.0])
+    grids = engine.column_grids(xi, yi, xj, yj)
+    assert grids["GridX"].tolist() == ["A", "A", "", ""]
+    assert grids["GridY"].tolist() == ["1", "", "", "1"]
+    assert grids["General"].tolist() == ["D1", "", "D1", ""]
+    assert engine.beam_grids(xi, yi, xj, yj).tolist() == ["A", "A", "D1", "1"]
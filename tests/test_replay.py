@@ -0,0 +1,55 @@
+"""Grabaciones ``.npz`` sin pickle: ida y vuelta de la estructura de llamadas."""
+
+import numpy as np
+import pytest
+
+from csi_py.replay import CallRecorder, ReplayModel, call_key, load_recording
+
+
+def _record(path):
+    recorder = CallRecorder(str(path), program="ETABS", backend="comtypes")
+    calls = [
+        ("PointObj.GetAllPoints", (), {}, (3, ("1", "2", "3"), (0.0, 1.5, 3.0), (0.0,) * 3, (0.0,) * 3, 0)),
+        ("FrameObj.GetSection", ("B1",), {}, ("V30x60", "", 0)),
+        ("Results.FrameForce", ("All", 2), {}, (9, tuple(range(9)), tuple(float(i) for i in range(9)), 0)),
+        ("DatabaseTables.GetTableForDisplayArray", ("Story Forces",), {"GroupName": ""},
+         (["Story", "P"], 1, ["Story", "P"], 2, ["P1", "1.5", "P2", "2"], 0)),
+        ("SetPresentUnits", (6,), {}, 0),
+        ("SetPresentUnits", (6,), {}, 1),
+        ("File.Raw", (b"\x00\x01",), {}, (b"\xff", np.float64(2.5), np.arange(4.0), 0)),
+    ]
+    for name, args, kwargs, result in calls:
+        recorder.observe(name, args, kwargs, result, 0.0, 0.0)
+    recorder.save()
+    return recorder
+
+
+def test_round_trip_preserves_calls(tmp_path):
+    recorder = _record(tmp_path / "modelo.csirec")
+    loaded = load_recording(recorder.path)
+    assert loaded["program"] == "ETABS" and loaded["num_calls"] == recorder.num_calls
+    assert set(loaded["calls"]) == set(recorder.calls)
+    for name, by_key in recorder.calls.items():
+        assert set(loaded["calls"][name]) == set(by_key)
+    forces = loaded["calls"]["Results.FrameForce"][call_key(("All", 2), {})][0]
+    assert forces[1] == tuple(range(9)) and isinstance(forces[1], tuple)
+    assert forces[2] == tuple(float(i) for i in range(9))
+    raw = loaded["calls"]["File.Raw"][call_key((b"\x00\x01",), {})][0]
+    assert raw[0] == b"\xff" and raw[1] == 2.5
+    np.testing.assert_array_equal(raw[2], np.arange(4.0))
+
+
+def test_replay_serves_repeated_calls_in_order(tmp_path):
+    recorder = _record(tmp_path / "modelo.csirec")
+    replay = ReplayModel(recorder.path)
+    assert replay.call("SetPresentUnits", 6) == 0
+    assert replay.call("SetPresentUnits", 6) == 1
+    table = replay.call("DatabaseTables.GetTableForDisplayArray", "Story Forces", GroupName="")
+    assert table[4] == ["P1", "1.5", "P2", "2"]
+
+
+def test_rejects_files_that_are_not_recordings(tmp_path):
+    target = tmp_path / "otro.csirec"
+    target.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        load_recording(target)
@@ -0,0 +1,31 @@
+"""
+Selección de salida recordada por el handler frente a operaciones que la invalidan.
+"""
+
+import contextlib
+import io
+
+from csi_py import CSIHandler
+
+
+def _connect():
+    handler = CSIHandler(backend="simulated", stories=2, bays_x=1, bays_y=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    return handler
+
+
+def test_run_analysis_forgets_selection():
+    handler = _connect()
+    calls = handler.connector.sim_model.calls
+    for _ in range(2):
+        handler.select_output_cases(["Dead"])
+        handler.select_cases_and_combos(["Dead"])
+    assert calls["Results.Setup.DeselectAllCasesAndCombosForOutput"] == 1
+    assert calls["DatabaseTables.SetLoadCasesSelectedForDisplay"] == 1
+
+    handler.run_analysis()
+    handler.select_output_cases(["Dead"])
+    handler.select_cases_and_combos(["Dead"])
+    assert calls["Results.Setup.DeselectAllCasesAndCombosForOutput"] == 2
+    assert calls["DatabaseTables.SetLoadCasesSelectedForDisplay"] == 2
@@ -0,0 +1,71 @@
+"""
+Wrappers de ``CSIAPIHelpers`` sobre el simulador con forma cruda comtypes y dotnet.
+
+Cada extracción debe coincidir con la del simulador normalizado, que no pasa
+por los wrappers.
+"""
+
+import contextlib
+import io
+
+import pandas as pd
+import pytest
+
+from csi_py import CSIHandler
+
+_MODEL = {"stories": 3, "bays_x": 2, "bays_y": 2, "walls": 1}
+
+_EXTRACTIONS = {
+    "story_table": lambda h: h.story_table,
+    "points_coordinates": lambda h: h.points_coordinates,
+    "points_restraints": lambda h: h.points_restraints,
+    "point_diaphragms": lambda h: h.point_diaphragms,
+    "frames_properties": lambda h: h.frames_properties,
+    "area_geometry": lambda h: h.area_geometry,
+    "beams_connectivity": lambda h: h.get_beams_connectivity(),
+    "frame_forces": lambda h: h.get_frame_forces(),
+    "frame_forces_subset": lambda h: h.get_frame_forces(h.frame_list[::3]),
+    "area_forces": lambda h: h.get_area_forces(),
+    "point_reactions": lambda h: h.get_point_reactions(),
+    "point_displacements": lambda h: h.get_point_displacements(),
+    "modal_data": lambda h: h.get_modal_data(),
+    "beam_forces_table": lambda h: h.get_table("Element Forces - Beams"),
+    "editing_table": lambda h: h.get_editing_table("Frame Assignments - Section Properties")[1],
+}
+
+
+def _connect(api_shape=None):
+    handler = CSIHandler(backend="simulated", api_shape=api_shape, **_MODEL)
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    handler.select_cases_and_combos(handler.cases_and_combos)
+    return handler
+
+
+@pytest.fixture(scope="module")
+def reference():
+    handler = _connect()
+    return {name: extract(handler) for name, extract in _EXTRACTIONS.items()}
+
+
+@pytest.mark.parametrize("api_shape", ["comtypes", "dotnet"])
+@pytest.mark.parametrize("name", list(_EXTRACTIONS))
+def test_shape_matches_normalized(reference, api_shape, name):
+    handler = _connect(api_shape)
+    assert handler.api._special, "los wrappers especiales deben estar activos"
+    result = _EXTRACTIONS[name](handler)
+    pd.testing.assert_frame_equal(result, reference[name], check_dtype=False)
+
+
+def test_dotnet_shape_is_raw():
+    handler = _connect("dotnet")
+    raw = handler._raw_model.PointObj.GetAllPoints()
+    assert raw[0] == 0 and raw[1] == len(handler.point_list)
+    assert isinstance(memoryview(raw[3]), memoryview)
+
+
+def test_set_table_round_trip_through_wrappers():
+    handler = _connect("dotnet")
+    version, table = handler.get_editing_table("Frame Assignments - Section Properties")
+    handler.set_table("Frame Assignments - Section Properties", table, version)
+    assert handler.connector.sim_model.calls["DatabaseTables.ApplyEditedTables"] == 1
@@ -0,0 +1,75 @@
+"""
+Snapshot en disco frente a ediciones de la sesión sin guardar.
+"""
+
+import contextlib
+import io
+import os
+
+import pandas as pd
+import pytest
+
+from csi_py import CSIHandler
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    path = tmp_path / "model.edb"
+    path.write_text("simulated")
+    # Fecha antigua para que un guardado la cambie aunque el reloj sea grueso.
+    os.utime(path, (1e9, 1e9))
+    return str(path)
+
+
+def _session(model_file, snapshot_dir):
+    handler = CSIHandler(backend="simulated", snapshot_dir=snapshot_dir, stories=2, bays_x=1, bays_y=1)
+    handler.connector.sim_model.file_path = model_file
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler.connect_open_instance()
+    return handler
+
+
+def _edit_section(handler):
+    handler.connector.sim_model.frame_section[0] = "Editada"
+    handler.invalidate_cache("sections", "geometry")
+
+
+def test_unsaved_edits_are_not_persisted(model_file, tmp_path):
+    snapshot_dir = str(tmp_path / "snapshots")
+    first = _session(model_file, snapshot_dir)
+    original = first.frames_properties.copy()
+
+    _edit_section(first)
+    edited = first.frames_properties
+    assert "Editada" in edited.values
+    assert first._snapshot.dirty
+
+    # Nueva sesión sobre el archivo sin guardar: recarga lo del archivo, sin llamar a CSI.
+    second = _session(model_file, snapshot_dir)
+    calls = sum(second.connector.sim_model.calls.values())
+    pd.testing.assert_frame_equal(second.frames_properties, original)
+    assert sum(second.connector.sim_model.calls.values()) == calls
+
+
+def test_save_rekeys_snapshot(model_file, tmp_path):
+    snapshot_dir = str(tmp_path / "snapshots")
+    first = _session(model_file, snapshot_dir)
+    first.frames_properties
+    _edit_section(first)
+    mtime = first._snapshot.key["mtime"]
+
+    first.save(model_file)
+    edited = first.frames_properties
+    assert not first._snapshot.dirty
+    assert first._snapshot.key["mtime"] != mtime
+    assert "frames_properties" in first._snapshot
+
+    # El archivo guardado ya contiene la edición: la sesión siguiente la recarga.
+    second = _session(model_file, snapshot_dir)
+    pd.testing.assert_frame_equal(second.frames_properties, edited)
+
+
+def test_results_invalidation_keeps_snapshot(model_file, tmp_path):
+    handler = _session(model_file, str(tmp_path / "snapshots"))
+    handler.run_analysis()
+    assert not handler._snapshot.dirty
@@ -0,0 +1,56 @@
+"""
+Tipos de columna de ``decode_table``: esquemas por tabla y heurística por nombre.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csi_py.tables import TABLE_SCHEMAS, decode_table, is_text_column
+
+
+def _decode(fields, rows, **kwargs):
+    data = [value for row in rows for value in row]
+    return decode_table(fields, len(rows), data, **kwargs)
+
+
+@pytest.mark.parametrize("name", ["Area", "Element", "Shell", "Tendon", "AreaElem", "PierName"])
+def test_identifier_columns_are_text(name):
+    assert is_text_column(name)
+
+
+@pytest.mark.parametrize("name", ["Station", "ElemStation", "P", "SoilPressure", "AxisAngle"])
+def test_numeric_columns(name):
+    assert not is_text_column(name)
+
+
+def test_schema_types_result_table():
+    fields = ["Story", "Beam", "UniqueName", "OutputCase", "Station", "M3", "Element", "ElemStation"]
+    rows = [["1", "12", "7", "1", "0.5", "2.5", "12-1", "0.5"],
+            ["2", "13", "8", "1", "", "-1", "13-1", "1"]]
+    table = _decode(fields, rows, table_name="Element Forces - Beams")
+    for column in ("Story", "Beam", "UniqueName", "OutputCase", "Element"):
+        assert table[column].tolist() == [row[fields.index(column)] for row in rows]
+    assert np.isnan(table["Station"].iloc[1])
+    assert table["ElemStation"].dtype == np.float64
+    assert table["M3"].tolist() == [2.5, -1.0]
+
+
+def test_schema_overrides_heuristic():
+    schema = TABLE_SCHEMAS["Joint Assignments - Restraints"]
+    assert schema["UX"] is str
+    table = _decode(["UniqueName", "UX"], [["1", "1"]], table_name="Joint Assignments - Restraints")
+    assert table["UX"].tolist() == ["1"]
+    # Sin esquema, ``UX`` numérico se convierte a float.
+    assert _decode(["UniqueName", "UX"], [["1", "1"]])["UX"].tolist() == [1.0]
+
+
+def test_dtypes_override_schema():
+    table = _decode(["Story", "P"], [["3", "1.5"]], table_name="Story Forces",
+                    dtypes={"Story": float})
+    pd.testing.assert_series_equal(table["Story"], pd.Series([3.0], name="Story"))
+
+
+def test_schema_numeric_column_with_text_stays_text():
+    table = _decode(["Story", "P"], [["3", "N/A"]], table_name="Story Forces")
+    assert table["P"].tolist() == ["N/A"]